@@ -0,0 +1,247 @@
+"""Fake WMI, DFC and psutil backends for the benchmark suite.
+
+Each fake sleeps for a configurable latency and counts its calls, so the
+suite runs on Linux and a new WMI query or DFC run shows up both as time
+and as a higher call count.
+"""
+
+import os
+import shutil
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+import types
+from collections import Counter, namedtuple
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Latency:
+    """Seconds each fake backend takes per call."""
+    wmi: float = 0.05
+    dfc: float = 0.1
+    psutil: float = 0.0
+
+
+@dataclass
+class CallCounts:
+    counts: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+
+# ── WMI ──────────────────────────────────────────────────────
+
+_WMI_CLASSES = {
+    "Win32_ComputerSystem": dict(
+        Name="LAB-PC-01", Domain="SFU.LOCAL", Manufacturer="Dell Inc.",
+        Model="OptiPlex 7090", TotalPhysicalMemory=str(16 * 1024**3),
+    ),
+    "Win32_OperatingSystem": dict(
+        Caption="Microsoft Windows 11 Education ", BuildNumber="22631",
+        LastBootUpTime="20260101080000.000000-480",
+    ),
+    "Win32_BaseBoard": dict(Product="0XCR9H", SerialNumber="/ABC1234/"),
+    "Win32_Processor": dict(
+        Name="Intel(R) Core(TM) i7-10700 CPU @ 2.90GHz",
+        NumberOfCores=8, NumberOfLogicalProcessors=16,
+    ),
+    "Win32_VideoController": dict(Name="Intel(R) UHD Graphics 630"),
+    "Win32_BIOS": dict(SMBIOSBIOSVersion="2.14.0"),
+}
+
+
+def _make_wmi(latency: Latency, calls: CallCounts) -> types.ModuleType:
+    class FakeWMI:
+        def __getattr__(self, name):
+            if name not in _WMI_CLASSES:
+                raise AttributeError(name)
+
+            def query():
+                calls.add("wmi")
+                time.sleep(latency.wmi)
+                return [types.SimpleNamespace(**_WMI_CLASSES[name])]
+            return query
+
+    module = types.ModuleType("wmi")
+    module.WMI = FakeWMI
+    return module
+
+
+def _make_pythoncom() -> types.ModuleType:
+    module = types.ModuleType("pythoncom")
+    module.CoInitialize = lambda: None
+    module.CoUninitialize = lambda: None
+    return module
+
+
+# ── psutil ───────────────────────────────────────────────────
+
+_vmem = namedtuple("svmem", "total available percent used free")
+_disk = namedtuple("sdiskusage", "total used free percent")
+_netio = namedtuple("snetio", "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout")
+_ifstats = namedtuple("snicstats", "isup duplex speed mtu flags")
+_ifaddr = namedtuple("snicaddr", "family address netmask broadcast ptp")
+
+
+def _make_psutil(latency: Latency, calls: CallCounts) -> types.ModuleType:
+    module = types.ModuleType("psutil")
+    state = {"net": 0}
+
+    def timed(name, fn):
+        def wrapper(*args, **kwargs):
+            calls.add("psutil")
+            if latency.psutil:
+                time.sleep(latency.psutil)
+            return fn(*args, **kwargs)
+        wrapper.__name__ = name
+        return wrapper
+
+    def net_io_counters(pernic=False):
+        state["net"] += 250_000
+        counters = _netio(state["net"], state["net"] * 4, 0, 0, 0, 0, 0, 0)
+        return {"Ethernet": counters} if pernic else counters
+
+    module.AF_LINK = -1
+    module.Error = Exception
+    module.boot_time = timed("boot_time", lambda: 1_767_254_400.0)
+    module.cpu_percent = timed(
+        "cpu_percent", lambda interval=None, percpu=False: [12.5] * 16 if percpu else 12.5
+    )
+    module.cpu_count = timed("cpu_count", lambda logical=True: 16 if logical else 8)
+    module.virtual_memory = timed(
+        "virtual_memory", lambda: _vmem(16 * 1024**3, 9 * 1024**3, 43.8, 7 * 1024**3, 9 * 1024**3)
+    )
+    module.disk_usage = timed(
+        "disk_usage", lambda path: _disk(512 * 1024**3, 200 * 1024**3, 312 * 1024**3, 39.1)
+    )
+    module.net_io_counters = timed("net_io_counters", net_io_counters)
+    module.net_if_stats = timed(
+        "net_if_stats",
+        lambda: {
+            "Ethernet": _ifstats(True, 2, 1000, 1500, ""),
+            "Wi-Fi": _ifstats(False, 2, 0, 1500, ""),
+            "Loopback Pseudo-Interface 1": _ifstats(True, 0, 1073, 1500, ""),
+        },
+    )
+    module.net_if_addrs = timed(
+        "net_if_addrs",
+        lambda: {
+            "Ethernet": [
+                _ifaddr(socket.AF_INET, "10.0.0.42", "255.255.255.0", None, None),
+                _ifaddr(-1, "AA-BB-CC-DD-EE-FF", None, None, None),
+            ],
+        },
+    )
+    return module
+
+
+# ── Installation ─────────────────────────────────────────────
+
+
+class FakeBackends:
+    """Context manager that swaps the real backends for the fakes.
+
+    Also points MTCP's cache dir into ``workdir`` (a temp dir removed on
+    exit), aims the connectivity probe at a local listener and writes a
+    fake DFC executable, whose path is ``df_path``, for the Deep Freeze
+    provider to run.
+    """
+
+    def __init__(self, latency: Latency = Latency(), fake_psutil: bool = True) -> None:
+        self.latency = latency
+        self.fake_psutil = fake_psutil
+        self.calls = CallCounts()
+        self.df_path = ""
+        self.workdir = ""
+        self._saved_modules: dict = {}
+        self._patches: list = []
+        self._listener = None
+
+    def __enter__(self) -> "FakeBackends":
+        self.workdir = tempfile.mkdtemp(prefix="mtcp-bench-")
+        self._saved_env = os.environ.get("MTCP_CACHE_DIR")
+        os.environ["MTCP_CACHE_DIR"] = os.path.join(self.workdir, "cache")
+
+        modules = {"wmi": _make_wmi(self.latency, self.calls), "pythoncom": _make_pythoncom()}
+        if self.fake_psutil:
+            modules["psutil"] = _make_psutil(self.latency, self.calls)
+        for name, module in modules.items():
+            self._saved_modules[name] = sys.modules.get(name)
+            sys.modules[name] = module
+
+        from mtcp import deepfreeze, netinfo, netprobe, sysinfo
+
+        self._patch(sysinfo, "_cached_cpu_name", None)
+
+        self._listener = socket.socket()
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(16)
+        port = self._listener.getsockname()[1]
+        self._patch(netprobe, "_probe", netprobe.ConnectivityProbe(targets=(f"127.0.0.1:{port}",)))
+        self._patch(netinfo, "_inventory", netinfo.NetworkInventory(enricher=lambda names: {}))
+
+        self.df_path = self._write_dfc()
+        self._patch(deepfreeze, "_provider", None)
+        self.reset_deep_freeze()
+        return self
+
+    def reset_deep_freeze(self) -> None:
+        """Install a fresh Deep Freeze provider (empty cache) on the fake DFC."""
+        from mtcp import deepfreeze
+
+        calls = self.calls
+
+        class CountingDfc(deepfreeze.DfcBackend):
+            def query(self) -> str:
+                calls.add("dfc")
+                return super().query()
+
+        deepfreeze._provider = deepfreeze.DeepFreezeProvider(CountingDfc(self.df_path))
+
+    def __exit__(self, *exc) -> None:
+        for target, name, value in reversed(self._patches):
+            setattr(target, name, value)
+        for name, module in self._saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        if self._saved_env is None:
+            os.environ.pop("MTCP_CACHE_DIR", None)
+        else:
+            os.environ["MTCP_CACHE_DIR"] = self._saved_env
+        if self._listener is not None:
+            self._listener.close()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def _patch(self, target, name: str, value) -> None:
+        self._patches.append((target, name, getattr(target, name)))
+        setattr(target, name, value)
+
+    def _write_dfc(self) -> str:
+        """A DFC stand-in that reports FROZEN (exit code 1) after a delay."""
+        if sys.platform == "win32":
+            path = os.path.join(self.workdir, "DFC.cmd")
+            with open(path, "w") as f:
+                f.write(f"@powershell -NoProfile -Command Start-Sleep -Milliseconds {int(self.latency.dfc * 1000)}\n@exit /b 1\n")
+            return path
+        path = os.path.join(self.workdir, "DFC")
+        with open(path, "w") as f:
+            f.write(f"#!/bin/sh\nsleep {self.latency.dfc}\nexit 1\n")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        return path
@@ -0,0 +1,125 @@
+"""Compare cold and warm launch times of MTCP builds.
+
+Usage (from ROOT, after building both layouts)::
+
+    set MTCP_BUILD_MODE=onefile && pyinstaller mtcp.spec --noconfirm
+    set MTCP_BUILD_MODE=onedir && pyinstaller mtcp.spec --noconfirm
+    python benchmarks/startup.py dist/MTCP.exe dist/MTCP/MTCP.exe --runs 10
+
+Each target is launched with ``--exit-after-startup``, so a run ends as
+soon as the TUI has painted its first frame (``--headless`` times
+``mtcp --headless tools`` instead, for machines without a console).
+``--source`` adds ``python -m mtcp`` as a baseline.
+
+"Cold" is the first launch from a fresh copy of the build in a new
+directory: Windows has no prefetch data for that path yet, and a onefile
+exe has to extract everything, as after a Deep Freeze reboot. The OS file
+cache is not flushed, so for true cold numbers reboot and run with
+``--runs 1 --no-copy``. "Warm" is every launch after that.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def is_onedir(exe: str) -> bool:
+    """True if ``exe`` sits in a PyInstaller onedir folder."""
+    folder = os.path.dirname(os.path.abspath(exe))
+    return os.path.isdir(os.path.join(folder, "_internal")) or os.path.exists(
+        os.path.join(folder, "base_library.zip")
+    )
+
+
+def fresh_copy(exe: str, workdir: str) -> str:
+    """Copy a build (the exe, or its whole onedir folder) under ``workdir``."""
+    dest = tempfile.mkdtemp(prefix="mtcp-bench-", dir=workdir)
+    if is_onedir(exe):
+        folder = os.path.dirname(os.path.abspath(exe))
+        target = os.path.join(dest, os.path.basename(folder))
+        shutil.copytree(folder, target)
+        return os.path.join(target, os.path.basename(exe))
+    target = os.path.join(dest, os.path.basename(exe))
+    shutil.copy2(exe, target)
+    return target
+
+
+def launch(command: list[str], headless: bool, timeout: float) -> float:
+    """Run one launch to completion; return its wall time in ms."""
+    args = command + (["--headless", "tools"] if headless else ["--exit-after-startup"])
+    start = time.perf_counter()
+    subprocess.run(
+        args,
+        cwd=ROOT,
+        # The TUI needs the real console to draw its first frame
+        stdout=subprocess.DEVNULL if headless else None,
+        stderr=subprocess.DEVNULL if headless else None,
+        timeout=timeout,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def bench(label: str, command: list[str], runs: int, headless: bool, timeout: float) -> dict:
+    times = [launch(command, headless, timeout) for _ in range(runs)]
+    warm = times[1:] or times
+    return {
+        "target": label,
+        "mode": "source" if label == "source" else ("onedir" if is_onedir(command[0]) else "onefile"),
+        "cold_ms": round(times[0], 1),
+        "warm_median_ms": round(statistics.median(warm), 1),
+        "warm_min_ms": round(min(warm), 1),
+        "warm_max_ms": round(max(warm), 1),
+        "runs": runs,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("exes", nargs="*", help="MTCP.exe builds to compare")
+    parser.add_argument("--runs", type=int, default=5, help="launches per target (first is cold)")
+    parser.add_argument("--source", action="store_true", help="also time python -m mtcp")
+    parser.add_argument("--headless", action="store_true", help="time the headless path instead of the TUI")
+    parser.add_argument("--no-copy", action="store_true", help="launch the builds in place")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds per launch")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+    if not args.exes and not args.source:
+        parser.error("give at least one exe or --source")
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    results = []
+    workdir = tempfile.mkdtemp(prefix="mtcp-bench-")
+    try:
+        if args.source:
+            results.append(bench("source", [sys.executable, "-m", "mtcp"], args.runs, args.headless, args.timeout))
+        for exe in args.exes:
+            target = exe if args.no_copy else fresh_copy(exe, workdir)
+            results.append(bench(exe, [target], args.runs, args.headless, args.timeout))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    width = max(len(r["target"]) for r in results)
+    print(f"{'target':<{width}}  {'mode':<7}  {'cold ms':>9}  {'warm ms':>9}  {'min':>8}  {'max':>8}")
+    for r in results:
+        print(
+            f"{r['target']:<{width}}  {r['mode']:<7}  {r['cold_ms']:>9.1f}  "
+            f"{r['warm_median_ms']:>9.1f}  {r['warm_min_ms']:>8.1f}  {r['warm_max_ms']:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
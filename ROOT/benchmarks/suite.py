@@ -0,0 +1,453 @@
+"""Startup and hot-path benchmarks for MTCP, runnable on Linux.
+
+    python benchmarks/suite.py                 # run, save to results/
+    python benchmarks/suite.py --check         # ... and fail on regressions
+    python benchmarks/suite.py --save-baseline # make this run the baseline
+
+WMI, DFC and psutil are replaced by the fakes in fakes.py,
+which sleep for a configurable latency and count their calls. Every run
+is written to ``benchmarks/results/``. With ``--check`` it is compared
+against ``benchmarks/baseline.json``: timings and memory may grow by
+``--tolerance``, backend call counts may not grow at all, so an extra
+WMI query fails the check even on a fast machine.
+
+The Textual benchmarks (first frame, menu navigation) are skipped when
+Textual is not installed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+
+from fakes import FakeBackends, Latency  # noqa: E402
+
+RESULTS_DIR = os.path.join(HERE, "results")
+BASELINE_FILE = os.path.join(HERE, "baseline.json")
+
+# Timings below this many ms are noise; don't flag them
+MIN_REGRESSION_MS = 2.0
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+# ── Synthetic config ─────────────────────────────────────────
+
+
+def synthetic_config(categories: int, subcategories: int, tools: int) -> dict:
+    """A config.json with categories × subcategories × tools entries."""
+    def tool(c, s, t):
+        return {
+            "name": f"Tool {c}.{s}.{t}",
+            "description": f"Synthetic tool {t} in subcategory {s} of category {c}",
+            "command": f"echo {c}-{s}-{t}",
+        }
+
+    return {
+        "meta": {"version": "9.9.9", "author": "benchmark"},
+        "commands": {"help": {"description": "Help", "action": "show-help"}},
+        "categories": [
+            {
+                "name": f"Category {c}",
+                "description": f"Synthetic category {c}",
+                "subcategories": [
+                    {
+                        "name": f"Subcategory {c}.{s}",
+                        "tools": [tool(c, s, t) for t in range(tools)],
+                    }
+                    for s in range(subcategories)
+                ],
+            }
+            for c in range(categories)
+        ],
+    }
+
+
+def write_synthetic_root(args, fakes: FakeBackends) -> str:
+    """Write a synthetic ROOT (sfu-tools/config.json) and return its path."""
+    root = tempfile.mkdtemp(prefix="root-", dir=fakes.workdir)
+    os.makedirs(os.path.join(root, "sfu-tools"))
+    with open(os.path.join(root, "sfu-tools", "config.json"), "w", encoding="utf-8") as f:
+        json.dump(synthetic_config(args.categories, args.subcategories, args.tools), f)
+    return root
+
+
+# ── Benchmarks ───────────────────────────────────────────────
+
+
+def bench_import(args) -> dict:
+    """Import time of the TUI and headless entry modules, in a fresh process."""
+    results = {}
+    for name, module in (("import_app", "mtcp.app"), ("import_cli", "mtcp.cli")):
+        code = (
+            "import time, importlib; t = time.perf_counter(); "
+            f"importlib.import_module({module!r}); print(time.perf_counter() - t)"
+        )
+        samples = []
+        for _ in range(args.repeat):
+            out = subprocess.run(
+                [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=False
+            )
+            if out.returncode != 0:
+                return {"skipped": out.stderr.strip().splitlines()[-1] if out.stderr else "import failed"}
+            samples.append(float(out.stdout.strip()))
+        results[f"{name}_ms"] = _ms(statistics.median(samples))
+    return results
+
+
+def bench_sysinfo(args, fakes: FakeBackends) -> dict:
+    """Cold (no cache) and warm (static cache hit) collect_system_info."""
+    from mtcp.sysinfo import collect_system_info
+
+    results = {}
+    for label, use_cache in (("cold", False), ("prime", True), ("warm", True)):
+        if label == "cold":
+            fakes.reset_deep_freeze()
+        fakes.calls.reset()
+        first = []
+        start = time.perf_counter()
+        collect_system_info(
+            on_update=lambda info: first or first.append(time.perf_counter()),
+            use_cache=use_cache,
+        )
+        total = time.perf_counter() - start
+        # A cache hit revalidates in the background; count its WMI queries too
+        for thread in threading.enumerate():
+            if thread.name == "mtcp-sysinfo-revalidate":
+                thread.join()
+        calls = fakes.calls.snapshot()
+        if label == "prime":
+            continue
+        results[f"{label}_first_update_ms"] = _ms(first[0] - start) if first else None
+        results[f"{label}_total_ms"] = _ms(total)
+        results[f"{label}_wmi_calls"] = calls.get("wmi", 0)
+        results[f"{label}_dfc_calls"] = calls.get("dfc", 0)
+    return results
+
+
+def bench_metrics_tick(args, fakes: FakeBackends) -> dict:
+    """Cost and retained memory of one sampler tick (metrics + history)."""
+    from mtcp.history import MetricsHistory
+    from mtcp.sysinfo import get_live_metrics
+
+    history = MetricsHistory()
+    # Warm-up: the first tick resolves the CPU name and primes counters
+    fakes.calls.reset()
+    get_live_metrics()
+    first_calls = fakes.calls.snapshot()
+
+    fakes.calls.reset()
+    samples = []
+    for _ in range(args.ticks):
+        start = time.perf_counter()
+        history.record(get_live_metrics())
+        samples.append(time.perf_counter() - start)
+    calls = fakes.calls.snapshot()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for _ in range(args.ticks):
+        history.record(get_live_metrics())
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples.sort()
+    return {
+        "first_tick_wmi_calls": first_calls.get("wmi", 0),
+        "tick_mean_ms": _ms(statistics.fmean(samples)),
+        "tick_p95_ms": _ms(samples[int(len(samples) * 0.95) - 1]),
+        "tick_wmi_calls": calls.get("wmi", 0),
+        "retained_bytes_per_tick": round(max(0, after - before) / args.ticks, 1),
+        "peak_bytes": peak - before,
+    }
+
+
+def bench_detailed_tick(args, fakes: FakeBackends) -> dict:
+    """Cost of the monitor screen's per-core/disk/NIC collection."""
+    import psutil
+    if not hasattr(psutil, "disk_io_counters"):
+        return {"skipped": "needs real psutil (--real-psutil)"}
+    from mtcp.monitor import DetailedCollector
+
+    collector = DetailedCollector()
+    collector.sample()
+    samples = []
+    for _ in range(args.ticks):
+        start = time.perf_counter()
+        collector.sample()
+        samples.append(time.perf_counter() - start)
+    return {"tick_mean_ms": _ms(statistics.fmean(samples))}
+
+
+def bench_config(args, fakes: FakeBackends) -> dict:
+    """Compile a large synthetic config, then load it from the cache."""
+    from mtcp.config import compile_config, load_config
+
+    root = write_synthetic_root(args, fakes)
+    path = os.path.join(root, "sfu-tools", "config.json")
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+
+    start = time.perf_counter()
+    config = compile_config(text, source=path)
+    compile_s = time.perf_counter() - start
+    load_config(path)  # writes the cache
+    start = time.perf_counter()
+    load_config(path)
+    cached_s = time.perf_counter() - start
+
+    queries = ["tool 7", "synthetic 3", "subcat 1.2", "xyz"]
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for query in queries:
+            config.search_index.search(query)
+    search_s = (time.perf_counter() - start) / (args.repeat * len(queries))
+    return {
+        "tools": len(config.tools_by_id),
+        "compile_ms": _ms(compile_s),
+        "cached_load_ms": _ms(cached_s),
+        "search_ms": _ms(search_s),
+    }
+
+
+def bench_launch(args, fakes: FakeBackends) -> dict:
+    """Planning tool commands, and starting one directly vs. via the shell."""
+    import shutil
+    from mtcp.launch import LaunchPlan, plan_command
+    from mtcp.tools import stream_command
+
+    commands = [
+        "sfc /scannow",
+        "ipconfig /all & pause",
+        "devmgmt.msc",
+        'powershell.exe -ExecutionPolicy Bypass -File "$PSScriptRoot\\sfu-tools\\Invoke-CheckDisk.ps1"',
+    ] * 250
+    start = time.perf_counter()
+    for command in commands:
+        plan_command(command)
+    plan_s = time.perf_counter() - start
+
+    # A POSIX no-op stands in for a console tool
+    program = shutil.which("true")
+    if program is None:
+        return {"plan_1000_ms": _ms(plan_s), "skipped": "needs a 'true' program"}
+    plans = {"direct": plan_command(program), "shell": LaunchPlan(command=program)}
+    results = {"plan_1000_ms": _ms(plan_s)}
+    for label, plan in plans.items():
+        samples = []
+        for _ in range(args.repeat * 10):
+            start = time.perf_counter()
+            stream_command(plan.args(ROOT), lambda lines: None)
+            samples.append(time.perf_counter() - start)
+        results[f"{label}_launch_ms"] = _ms(statistics.median(samples))
+    return results
+
+
+def _textual_app(root: str):
+    """An MTCPApp pointed at ``root`` that records when its first frame is up."""
+    from mtcp.app import MTCPApp
+
+    class BenchApp(MTCPApp):
+        # Textual resolves CSS_PATH relative to the subclass's module
+        CSS_PATH = os.path.join(ROOT, "mtcp", MTCPApp.CSS_PATH)
+        first_frame_at = None
+
+        def _after_first_frame(self) -> None:
+            self.first_frame_at = time.perf_counter()
+            super()._after_first_frame()
+
+    app = BenchApp()
+    app.script_root = root
+    app.config_path = os.path.join(root, "sfu-tools", "config.json")
+    app.config_watcher.path = app.config_path
+    return app
+
+
+async def _wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("benchmark condition not reached")
+        await asyncio.sleep(0.001)
+
+
+def bench_first_frame(args, fakes: FakeBackends) -> dict:
+    """Time from constructing the app to its first painted frame."""
+    try:
+        import textual  # noqa: F401
+    except ImportError:
+        return {"skipped": "textual not installed"}
+    root = write_synthetic_root(args, fakes)
+
+    async def run() -> dict:
+        start = time.perf_counter()
+        app = _textual_app(root)
+        async with app.run_test(size=(120, 42)) as pilot:
+            await _wait_for(lambda: app.first_frame_at is not None)
+            first_frame = app.first_frame_at - start
+            await _wait_for(lambda: app.config is not None)
+            await pilot.pause()
+            menu_ready = time.perf_counter() - start
+        return {"first_frame_ms": _ms(first_frame), "menu_ready_ms": _ms(menu_ready)}
+
+    return asyncio.run(run())
+
+
+def bench_menu_navigation(args, fakes: FakeBackends) -> dict:
+    """_populate_menu cost entering each category, cold and from the cache."""
+    try:
+        import textual  # noqa: F401
+    except ImportError:
+        return {"skipped": "textual not installed"}
+    root = write_synthetic_root(args, fakes)
+
+    async def run() -> dict:
+        app = _textual_app(root)
+        async with app.run_test(size=(120, 42)) as pilot:
+            await _wait_for(lambda: app.config is not None and app._option_cache)
+            await pilot.pause()
+            timings = {"cold": [], "warm": []}
+            for label in ("cold", "warm"):
+                for category in app.config.categories:
+                    for sub in category.subcategories:
+                        app.current_category = category
+                        app.current_subcategory = sub
+                        app.current_view = "tools"
+                        start = time.perf_counter()
+                        app._populate_menu()
+                        timings[label].append(time.perf_counter() - start)
+            app.current_view = "categories"
+            start = time.perf_counter()
+            app._populate_menu()
+            root_s = time.perf_counter() - start
+        return {
+            "views": len(timings["cold"]),
+            "enter_view_cold_ms": _ms(statistics.fmean(timings["cold"])),
+            "enter_view_warm_ms": _ms(statistics.fmean(timings["warm"])),
+            "back_to_categories_ms": _ms(root_s),
+        }
+
+    return asyncio.run(run())
+
+
+BENCHMARKS = {
+    "import": bench_import,
+    "sysinfo": bench_sysinfo,
+    "metrics_tick": bench_metrics_tick,
+    "detailed_tick": bench_detailed_tick,
+    "config": bench_config,
+    "launch": bench_launch,
+    "first_frame": bench_first_frame,
+    "menu_navigation": bench_menu_navigation,
+}
+
+
+# ── Results ──────────────────────────────────────────────────
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a line per metric that regressed against ``baseline``."""
+    problems = []
+    for bench, metrics in result["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(bench, {})
+        for key, value in metrics.items():
+            old = base.get(key)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)):
+                continue
+            if key.endswith("_calls"):
+                if value > old:
+                    problems.append(f"{bench}.{key}: {old} -> {value} backend calls")
+            elif key.endswith(("_ms", "_bytes", "_per_tick")):
+                slack = MIN_REGRESSION_MS if key.endswith("_ms") else 0
+                if value > old * (1 + tolerance) + slack:
+                    problems.append(f"{bench}.{key}: {old} -> {value} (+{(value / old - 1) * 100 if old else 0:.0f}%)")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("names", nargs="*", metavar="name", help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--wmi-latency", type=float, default=Latency.wmi, help="seconds per fake WMI query")
+    parser.add_argument("--dfc-latency", type=float, default=Latency.dfc, help="seconds per fake DFC.exe run")
+    parser.add_argument("--psutil-latency", type=float, default=Latency.psutil, help="seconds per fake psutil call")
+    parser.add_argument("--real-psutil", action="store_true", help="use the installed psutil instead of the fake")
+    parser.add_argument("--categories", type=int, default=20, help="synthetic config size")
+    parser.add_argument("--subcategories", type=int, default=10)
+    parser.add_argument("--tools", type=int, default=50, help="tools per subcategory")
+    parser.add_argument("--ticks", type=int, default=200, help="metrics ticks to sample")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions of the short benchmarks")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a metric regressed against the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown for --check")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args(argv)
+    unknown = [n for n in args.names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    latency = Latency(
+        wmi=args.wmi_latency,
+        dfc=args.dfc_latency,
+        psutil=args.psutil_latency,
+    )
+    result = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "latency": vars(latency),
+        "benchmarks": {},
+    }
+    names = args.names or list(BENCHMARKS)
+    with FakeBackends(latency, fake_psutil=not args.real_psutil) as fakes:
+        for name in names:
+            bench = BENCHMARKS[name]
+            try:
+                metrics = bench(args) if name == "import" else bench(args, fakes)
+            except Exception as e:
+                metrics = {"error": f"{type(e).__name__}: {e}"}
+            result["benchmarks"][name] = metrics
+            print(f"{name}:")
+            for key, value in metrics.items():
+                print(f"  {key:<32} {value}")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    with open(os.path.join(RESULTS_DIR, f"{stamp}.json"), "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    if args.save_baseline:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"Saved baseline to {BASELINE_FILE}")
+
+    if args.check:
+        if not os.path.exists(BASELINE_FILE):
+            print("No baseline yet; run with --save-baseline first.", file=sys.stderr)
+            return 1
+        with open(BASELINE_FILE, encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems = compare(result, baseline, args.tolerance)
+        errors = [n for n, m in result["benchmarks"].items() if "error" in m]
+        for line in problems:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        for name in errors:
+            print(f"ERROR {name}: {result['benchmarks'][name]['error']}", file=sys.stderr)
+        return 1 if problems or errors else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
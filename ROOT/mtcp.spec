@@ -1,11 +1,24 @@
 # -*- mode: python ; coding: utf-8 -*-
 # PyInstaller spec file for MTCP
+#
+# MTCP_BUILD_MODE selects the layout:
+#   onefile (default)  dist/MTCP.exe - a single file, but every launch
+#                      unpacks the whole bundle into a fresh temp dir and
+#                      UPX-decompresses it before Python starts
+#   onedir             dist/MTCP/MTCP.exe plus its files, uncompressed;
+#                      nothing is extracted at launch, so it starts much
+#                      faster on slow or Deep Freeze-reset lab disks
+# See benchmarks/startup.py to compare the two.
 
 import os
 import sys
 
 block_cipher = None
 
+build_mode = os.environ.get('MTCP_BUILD_MODE', 'onefile').lower()
+if build_mode not in ('onefile', 'onedir'):
+    raise SystemExit(f"MTCP_BUILD_MODE must be 'onefile' or 'onedir', not {build_mode!r}")
+
 # Get the directory containing this spec file
 spec_dir = os.path.dirname(os.path.abspath(SPEC))
 mtcp_dir = os.path.join(spec_dir, 'mtcp')
@@ -43,11 +56,30 @@ a = Analysis(
         'win32com.client',
         'pythoncom',
         'pywintypes',
+        'msgpack',
         'mtcp',
+        'mtcp.agent',
         'mtcp.app',
+        'mtcp.cli',
+        'mtcp.config',
+        'mtcp.deepfreeze',
+        'mtcp.fleet',
+        'mtcp.history',
+        'mtcp.jobs',
+        'mtcp.launch',
+        'mtcp.monitor',
+        'mtcp.netinfo',
+        'mtcp.netprobe',
+        'mtcp.paths',
+        'mtcp.pipelines',
+        'mtcp.procs',
         'mtcp.screens',
+        'mtcp.search',
+        'mtcp.startup',
         'mtcp.sysinfo',
         'mtcp.tools',
+        'mtcp.updates',
+        'mtcp.watcher',
     ],
     hookspath=[],
     hooksconfig={},
@@ -61,25 +93,55 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='MTCP',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,  # Console app for TUI
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=icon_path if os.path.exists(icon_path) else None,
-)
+if build_mode == 'onefile':
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        [],
+        name='MTCP',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=True,  # Console app for TUI
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=icon_path if os.path.exists(icon_path) else None,
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='MTCP',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,  # decompressing DLLs on every load costs more than it saves
+        console=True,  # Console app for TUI
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+        icon=icon_path if os.path.exists(icon_path) else None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='MTCP',
+    )
@@ -1,4 +1,22 @@
 """Entry point for running MTCP as a module: python -m mtcp"""
+import sys
+
+if "--headless" in sys.argv[1:]:
+    # Headless commands never load the Textual UI
+    from .cli import main as headless_main
+
+    sys.exit(headless_main([a for a in sys.argv[1:] if a != "--headless"]))
+
+from . import startup
+
+if "--profile-startup" in sys.argv[1:]:
+    # Print per-phase import and mount timings after the TUI exits
+    startup.enable()
+if "--exit-after-startup" in sys.argv[1:]:
+    # Used by benchmarks/startup.py to time launches end to end
+    startup.exit_after_first_frame = True
+startup.mark("python + mtcp package")
+
 from .app import main
 
 main()
@@ -0,0 +1,537 @@
+"""MTCP agent: sample SystemInfo and LiveMetrics once, serve them to everyone.
+
+``mtcp --headless agent`` keeps one MetricsSampler running and re-collects
+SystemInfo on a schedule. The TUI, the headless CLI and remote fleet
+queries read that cache over a socket instead of each paying for WMI,
+DFC and psutil on their own.
+
+Wire format: every message is a frame of a 4-byte big-endian length, a
+1-byte codec tag (``j`` JSON, ``m`` msgpack) and the payload. A client
+opens with ``hello`` listing the codecs it can read; the agent answers in
+JSON and uses the best shared codec from then on. msgpack is optional on
+both sides.
+
+Requests are ``{"op": ...}`` objects: ``hello``, ``ping``, ``info``
+(``refresh`` re-collects first, ``no_cache`` also skips the static
+hardware cache), ``metrics`` and ``subscribe`` with a list
+of ``topics``, after which the agent pushes ``{"topic", "data", "at"}``
+frames as new samples arrive and the connection takes no more requests.
+
+The agent listens on TCP (loopback unless ``--bind`` says otherwise) and,
+outside Windows, also on a Unix socket in the cache directory, which is
+where local clients look first.
+
+Peers on loopback or the Unix socket are trusted. Anyone else must send
+the shared ``fleet_token`` in their ``hello``, cannot bypass the static
+cache and can force a re-collection at most every
+``REMOTE_REFRESH_INTERVAL`` seconds; the agent refuses a non-loopback
+bind without a token.
+"""
+
+import asyncio
+import hmac
+import ipaddress
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+from dataclasses import asdict, fields
+from typing import Callable, Iterator, Optional
+
+from .paths import cache_path
+from .sysinfo import LiveMetrics, MetricsSampler, SystemInfo
+
+DEFAULT_AGENT_PORT = 47800
+DEFAULT_METRICS_INTERVAL = 2.0
+DEFAULT_INFO_INTERVAL = 60.0
+# A cold SystemInfo collection (WMI, DFC) takes seconds, a ping should not
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_INFO_TIMEOUT = 30.0
+DEFAULT_PROBE_TIMEOUT = 0.5
+PROTOCOL_VERSION = 1
+
+CODEC_JSON = b"j"
+CODEC_MSGPACK = b"m"
+_HEADER = struct.Struct(">IB")
+MAX_FRAME = 1024 * 1024
+# A subscriber this far behind is dropped rather than buffered forever
+MAX_SUBSCRIBER_BACKLOG = 256 * 1024
+
+TOPICS = ("metrics", "info")
+
+# How often a remote peer may make the agent re-collect SystemInfo
+REMOTE_REFRESH_INTERVAL = 30.0
+
+
+class AgentError(Exception):
+    """The agent could not be reached or refused a request."""
+
+
+def agent_socket_path() -> str:
+    """Where the local agent's Unix socket lives ('' on Windows)."""
+    if sys.platform == "win32" or not hasattr(socket, "AF_UNIX"):
+        return ""
+    return cache_path("agent.sock")
+
+
+def is_loopback(host: str) -> bool:
+    """Whether ``host`` (an address or 'localhost') only reaches this machine."""
+    if host == "localhost":
+        return True
+    try:
+        address = ipaddress.ip_address(host.split("%")[0])
+    except ValueError:
+        return False
+    if getattr(address, "ipv4_mapped", None):
+        address = address.ipv4_mapped
+    return address.is_loopback
+
+
+def _is_local_peer(writer: asyncio.StreamWriter) -> bool:
+    # Unix socket peers have no (host, port) pair
+    peer = writer.get_extra_info("peername")
+    if not isinstance(peer, tuple) or not peer:
+        return True
+    return is_loopback(str(peer[0]))
+
+
+# ── Framing ──────────────────────────────────────────────────
+
+
+def _msgpack():
+    try:
+        import msgpack
+        return msgpack
+    except ImportError:
+        return None
+
+
+def local_codecs() -> list[str]:
+    """Codecs this process can read, best first."""
+    return ["msgpack", "json"] if _msgpack() else ["json"]
+
+
+def choose_codec(offered) -> bytes:
+    return CODEC_MSGPACK if "msgpack" in offered and _msgpack() else CODEC_JSON
+
+
+def encode_frame(obj, codec: bytes = CODEC_JSON) -> bytes:
+    if codec == CODEC_MSGPACK:
+        payload = _msgpack().packb(obj, use_bin_type=True)
+    else:
+        payload = json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+    return _HEADER.pack(len(payload), codec[0]) + payload
+
+
+def decode_payload(codec: int, payload: bytes):
+    if codec == CODEC_MSGPACK[0]:
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise AgentError("received msgpack but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False)
+    if codec == CODEC_JSON[0]:
+        return json.loads(payload)
+    raise AgentError(f"unknown codec {codec!r}")
+
+
+async def read_frame(reader: asyncio.StreamReader):
+    length, codec = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > MAX_FRAME:
+        raise AgentError(f"frame of {length} bytes is too large")
+    return decode_payload(codec, await reader.readexactly(length))
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    data = bytearray()
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionResetError("agent closed the connection")
+        data += chunk
+    return bytes(data)
+
+
+def recv_frame(sock: socket.socket):
+    length, codec = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if length > MAX_FRAME:
+        raise AgentError(f"frame of {length} bytes is too large")
+    return decode_payload(codec, _recv_exact(sock, length))
+
+
+def _from_dict(cls, data: dict):
+    """Build a dataclass, ignoring fields this version does not know."""
+    names = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def info_from_dict(data: dict) -> SystemInfo:
+    return _from_dict(SystemInfo, data)
+
+
+def metrics_from_dict(data: dict) -> LiveMetrics:
+    return _from_dict(LiveMetrics, data)
+
+
+# ── Agent ────────────────────────────────────────────────────
+
+
+class _Subscriber:
+    def __init__(self, writer: asyncio.StreamWriter, codec: bytes, topics: set[str]) -> None:
+        self.writer = writer
+        self.codec = codec
+        self.topics = topics
+
+
+class Agent:
+    """Owns the samplers and answers clients from their latest results.
+
+    Metrics come from a MetricsSampler thread; each new sample is handed
+    to the event loop and pushed to subscribers. SystemInfo is collected
+    on a worker thread every ``info_interval`` seconds, or on request;
+    clients arriving during a collection share its result.
+    ``collect_info`` takes ``use_cache`` like ``collect_system_info``.
+    ``token`` is the secret remote peers must present in ``hello``.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_METRICS_INTERVAL,
+        info_interval: float = DEFAULT_INFO_INTERVAL,
+        collect_info: Optional[Callable[..., SystemInfo]] = None,
+        sample_metrics: Optional[Callable[[], LiveMetrics]] = None,
+        token: str = "",
+    ) -> None:
+        if collect_info is None:
+            from .sysinfo import collect_system_info
+            collect_info = collect_system_info
+        self.collect_info = collect_info
+        self.info_interval = info_interval
+        self.token = token
+        self.sampler = MetricsSampler(interval=interval, on_sample=self._on_sample)
+        if sample_metrics is not None:
+            self.sampler.source = sample_metrics
+        self._info: Optional[dict] = None
+        self._info_at = 0.0
+        self._metrics: Optional[dict] = None
+        self._metrics_at = 0.0
+        self._info_lock: Optional[asyncio.Lock] = None
+        self._metrics_ready: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: set[_Subscriber] = set()
+        self.clients = 0
+
+    # Metrics arrive on the sampler thread
+    def _on_sample(self, metrics: LiveMetrics) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._publish_metrics, metrics)
+
+    def _publish_metrics(self, metrics: LiveMetrics) -> None:
+        self._metrics = asdict(metrics)
+        self._metrics_at = time.time()
+        self._metrics_ready.set()
+        self._publish("metrics", self._metrics, self._metrics_at)
+
+    def _publish(self, topic: str, data: dict, at: float) -> None:
+        for sub in list(self._subscribers):
+            if topic not in sub.topics:
+                continue
+            if sub.writer.is_closing() or sub.writer.transport.get_write_buffer_size() > MAX_SUBSCRIBER_BACKLOG:
+                self._subscribers.discard(sub)
+                sub.writer.close()
+                continue
+            sub.writer.write(encode_frame({"topic": topic, "data": data, "at": at}, sub.codec))
+
+    async def info(self, refresh: bool = False, use_cache: bool = True) -> dict:
+        # A refresh is satisfied by any collection that finished after it was
+        # asked for; bypassing the static cache needs a collection of its own
+        oldest = time.time() if refresh else time.time() - self.info_interval
+        async with self._info_lock:
+            if not use_cache or self._info is None or self._info_at < oldest:
+                info = await asyncio.to_thread(self.collect_info, use_cache=use_cache)
+                self._info = asdict(info)
+                self._info_at = time.time()
+                self._publish("info", self._info, self._info_at)
+            return self._info
+
+    async def metrics(self) -> dict:
+        await self._metrics_ready.wait()
+        return self._metrics
+
+    async def _refresh_info_forever(self) -> None:
+        while True:
+            try:
+                await self.info(refresh=True)
+            except Exception:
+                pass
+            await asyncio.sleep(self.info_interval)
+
+    async def _answer(self, request: dict, local: bool = True) -> dict:
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True}
+        if op == "info":
+            refresh = bool(request.get("refresh"))
+            use_cache = not request.get("no_cache")
+            if not local:
+                # Remote peers must not be able to keep WMI and DFC busy
+                use_cache = True
+                refresh = refresh and time.time() - self._info_at >= REMOTE_REFRESH_INTERVAL
+            info = await self.info(refresh=refresh, use_cache=use_cache)
+            return {"ok": True, "info": info, "at": self._info_at}
+        if op == "metrics":
+            metrics = await self.metrics()
+            return {"ok": True, "metrics": metrics, "at": self._metrics_at}
+        return {"ok": False, "error": f"unknown request {op!r}"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        codec = CODEC_JSON
+        local = _is_local_peer(writer)
+        trusted = local
+        self.clients += 1
+        try:
+            while True:
+                try:
+                    request = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    return
+                if not isinstance(request, dict):
+                    request = {}
+                op = request.get("op")
+                if not trusted:
+                    token = request.get("token") if op == "hello" else None
+                    if not (self.token and isinstance(token, str)
+                            and hmac.compare_digest(token.encode(), self.token.encode())):
+                        writer.write(encode_frame({"ok": False, "error": "missing or wrong fleet token"}))
+                        await writer.drain()
+                        return
+                    trusted = True
+                if op == "hello":
+                    # Answered in JSON: the client does not know the codec yet
+                    codec = choose_codec(request.get("codecs", ()))
+                    response = {
+                        "ok": True,
+                        "version": PROTOCOL_VERSION,
+                        "codec": "msgpack" if codec == CODEC_MSGPACK else "json",
+                        "interval": self.sampler.interval,
+                    }
+                    writer.write(encode_frame(response, CODEC_JSON))
+                elif op == "subscribe":
+                    topics = set(request.get("topics") or TOPICS) & set(TOPICS)
+                    writer.write(encode_frame({"ok": True, "topics": sorted(topics)}, codec))
+                    subscriber = _Subscriber(writer, codec, topics)
+                    self._subscribers.add(subscriber)
+                    # Send the current state straight away
+                    if "info" in topics and self._info is not None:
+                        writer.write(encode_frame({"topic": "info", "data": self._info, "at": self._info_at}, codec))
+                    if "metrics" in topics and self._metrics is not None:
+                        writer.write(encode_frame({"topic": "metrics", "data": self._metrics, "at": self._metrics_at}, codec))
+                    try:
+                        # Push-only from here; wait for the client to leave
+                        while await reader.read(4096):
+                            pass
+                    finally:
+                        self._subscribers.discard(subscriber)
+                    return
+                else:
+                    try:
+                        response = await self._answer(request, local)
+                    except Exception as e:
+                        response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                    writer.write(encode_frame(response, codec))
+                await writer.drain()
+        except (ConnectionError, AgentError, ValueError, struct.error):
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def serve(self, bind: str, port: int, socket_path: Optional[str] = None) -> None:
+        """Sample and serve until cancelled.
+
+        Raises AgentError if ``bind`` reaches other machines and no
+        ``token`` is set.
+        """
+        if not is_loopback(bind) and not self.token:
+            raise AgentError(f"refusing to listen on {bind or 'all interfaces'} without a fleet_token")
+        self._loop = asyncio.get_running_loop()
+        self._info_lock = asyncio.Lock()
+        self._metrics_ready = asyncio.Event()
+        servers = [await asyncio.start_server(self.handle, bind, port)]
+        if socket_path is None:
+            socket_path = agent_socket_path()
+        if socket_path:
+            os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            servers.append(await asyncio.start_unix_server(self.handle, socket_path))
+            os.chmod(socket_path, 0o600)
+        self.sampler.start()
+        refresher = asyncio.create_task(self._refresh_info_forever())
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in servers))
+        finally:
+            refresher.cancel()
+            self.sampler.stop()
+            for server in servers:
+                server.close()
+            if socket_path and os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+
+# ── Client ───────────────────────────────────────────────────
+
+
+class AgentClient:
+    """Blocking client for the agent, safe to share between threads.
+
+    ``address`` is a Unix socket path or a ``(host, port)`` pair. The
+    connection is opened lazily and re-opened once if the agent has
+    restarted since the last request. ``timeout`` bounds connecting and
+    quick requests; ``info`` waits up to ``info_timeout``, since the agent
+    may have to collect SystemInfo before it can answer.
+    """
+
+    def __init__(
+        self,
+        address,
+        timeout: float = DEFAULT_TIMEOUT,
+        info_timeout: float = DEFAULT_INFO_TIMEOUT,
+    ) -> None:
+        self.address = address
+        self.timeout = timeout
+        self.info_timeout = info_timeout
+        self.interval = DEFAULT_METRICS_INTERVAL
+        self._sock: Optional[socket.socket] = None
+        self._codec = CODEC_JSON
+        self._lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                raise
+        else:
+            sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.sendall(encode_frame({"op": "hello", "codecs": local_codecs()}))
+        hello = recv_frame(sock)
+        if not hello.get("ok"):
+            sock.close()
+            raise AgentError(hello.get("error") or "agent refused hello")
+        self._codec = CODEC_MSGPACK if hello.get("codec") == "msgpack" else CODEC_JSON
+        self.interval = hello.get("interval", self.interval)
+        return sock
+
+    def _roundtrip(self, request: dict, timeout: float) -> dict:
+        if self._sock is None:
+            self._sock = self._connect()
+        self._sock.settimeout(timeout)
+        self._sock.sendall(encode_frame(request, self._codec))
+        return recv_frame(self._sock)
+
+    def request(self, op: str, timeout: Optional[float] = None, **args) -> dict:
+        """Send one request and return the agent's answer.
+
+        ``timeout`` (default: the client's) bounds the wait for the answer.
+        """
+        timeout = timeout or self.timeout
+        with self._lock:
+            reused = self._sock is not None
+            try:
+                response = self._roundtrip({"op": op, **args}, timeout)
+            except (OSError, struct.error, ValueError, AgentError) as e:
+                self._close()
+                if not reused:
+                    raise AgentError(f"agent unreachable: {e}") from e
+                try:
+                    response = self._roundtrip({"op": op, **args}, timeout)
+                except (OSError, struct.error, ValueError, AgentError) as e:
+                    self._close()
+                    raise AgentError(f"agent unreachable: {e}") from e
+        if not response.get("ok"):
+            raise AgentError(response.get("error") or "agent error")
+        return response
+
+    def info(self, refresh: bool = False, use_cache: bool = True) -> SystemInfo:
+        """The agent's SystemInfo; ``use_cache=False`` re-collects it from scratch."""
+        response = self.request(
+            "info", timeout=self.info_timeout, refresh=refresh, no_cache=not use_cache
+        )
+        return info_from_dict(response["info"])
+
+    def metrics(self) -> LiveMetrics:
+        return metrics_from_dict(self.request("metrics")["metrics"])
+
+    def subscribe(self, topics=TOPICS) -> Iterator[tuple[str, object, float]]:
+        """Yield ``(topic, SystemInfo | LiveMetrics, timestamp)`` as pushed.
+
+        Uses a connection of its own, which ends when the generator does.
+        Raises AgentError if the agent cannot be reached or goes away.
+        """
+        try:
+            sock = self._connect()
+        except (OSError, struct.error, ValueError) as e:
+            raise AgentError(f"agent unreachable: {e}") from e
+        codec = self._codec
+        try:
+            try:
+                sock.sendall(encode_frame({"op": "subscribe", "topics": list(topics)}, codec))
+                ack = recv_frame(sock)
+            except (OSError, struct.error, ValueError) as e:
+                raise AgentError(f"agent unreachable: {e}") from e
+            if not ack.get("ok"):
+                raise AgentError(ack.get("error") or "agent refused subscription")
+            # Pushes come when the agent has something new; wait for them
+            sock.settimeout(None)
+            while True:
+                try:
+                    push = recv_frame(sock)
+                except (OSError, struct.error) as e:
+                    raise AgentError(f"agent went away: {e}") from e
+                build = info_from_dict if push["topic"] == "info" else metrics_from_dict
+                yield push["topic"], build(push["data"]), push["at"]
+        finally:
+            sock.close()
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+def connect_local_agent(
+    port: int = DEFAULT_AGENT_PORT,
+    timeout: float = DEFAULT_TIMEOUT,
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+) -> Optional[AgentClient]:
+    """A client for the agent on this machine, or None if none is running.
+
+    Tries the Unix socket first, then TCP on the loopback interface. An
+    agent on this machine answers a ping at once, so each candidate gets
+    only ``probe_timeout``; the client then uses ``timeout``.
+    """
+    candidates = []
+    path = agent_socket_path()
+    if path and os.path.exists(path):
+        candidates.append(path)
+    candidates.append(("127.0.0.1", port))
+    for address in candidates:
+        client = AgentClient(address, timeout=probe_timeout)
+        try:
+            client.request("ping")
+        except AgentError:
+            client.close()
+            continue
+        client.timeout = timeout
+        return client
+    return None
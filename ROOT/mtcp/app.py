@@ -5,9 +5,12 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
-from pathlib import Path
+from dataclasses import replace
 from typing import Optional
 
+from . import startup
+
+from rich.text import Text
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -16,90 +19,41 @@ from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import (
     Collapsible,
-    Footer,
     Input,
-    Label,
-    LoadingIndicator,
     OptionList,
     ProgressBar,
-    RichLog,
+    Sparkline,
     Static,
 )
 from textual.widgets.option_list import Option
 
-from .screens import (
-    CreditsScreen,
-    DeepFreezeScreen,
-    DebugScreen,
-    ExitConfirmScreen,
-    HelpScreen,
-    ToolOutputScreen,
-    UpdateScreen,
-)
-from .sysinfo import SystemInfo, get_system_info, LiveMetrics, get_live_metrics
-from .tools import (
+startup.mark("import textual")
+
+# Modal screens (mtcp.screens) and the update checker are imported where
+# they are first used, so they load after the first frame has painted.
+from .sysinfo import SystemInfo, collect_system_info, get_live_metrics, LiveMetrics, MetricsSampler
+from .agent import DEFAULT_AGENT_PORT, AgentClient, AgentError, connect_local_agent
+from .deepfreeze import ENV_MAX_AGE, DeepFreezeStatus, get_deep_freeze
+from .config import (
     AppConfig,
     Category,
+    ConfigDiff,
+    ConfigError,
     Subcategory,
     Tool,
-    check_for_updates,
-    install_update,
+    diff_configs,
     load_config,
-    resolve_command,
-    run_tool,
 )
+from .launch import start_detached
+from .tools import resolve_command
+from .history import MetricsHistory
+from .jobs import CANCELLED, COMPLETED, TIMED_OUT, Job, JobManager
+from .netprobe import get_connectivity_probe
+from .paths import find_script_root
+from .pipelines import PipelineRun, format_duration
+from .watcher import FileWatcher
 
-
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# Determine paths (PyInstaller-aware)
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-def _get_bundle_dir() -> Path:
-    """Get the base directory for bundled resources (PyInstaller or source)."""
-    if getattr(sys, 'frozen', False):
-        # Running as compiled exe - sys._MEIPASS is the temp extraction folder
-        return Path(sys._MEIPASS)
-    else:
-        # Running from source - mtcp package directory
-        return Path(__file__).resolve().parent
-
-
-def _find_script_root() -> str:
-    """Find the ROOT directory (parent of mtcp package or exe location)."""
-    # When frozen, config is bundled inside the exe but we also need
-    # to check the exe's directory for external config
-    if getattr(sys, 'frozen', False):
-        # First check bundled location
-        bundle_dir = Path(sys._MEIPASS)
-        config = bundle_dir / "sfu-tools" / "config.json"
-        if config.exists():
-            return str(bundle_dir)
-        
-        # Then check exe's directory
-        exe_dir = Path(sys.executable).resolve().parent
-        config = exe_dir / "sfu-tools" / "config.json"
-        if config.exists():
-            return str(exe_dir)
-        
-        # Fallback to bundled
-        return str(bundle_dir)
-    
-    # Running from source
-    # Try relative to this file
-    pkg_dir = Path(__file__).resolve().parent          # mtcp/
-    root_dir = pkg_dir.parent                          # ROOT/
-    config = root_dir / "sfu-tools" / "config.json"
-    if config.exists():
-        return str(root_dir)
-
-    # Try CWD
-    cwd = Path.cwd()
-    config = cwd / "sfu-tools" / "config.json"
-    if config.exists():
-        return str(cwd)
-
-    # Fallback
-    return str(root_dir)
+startup.mark("import mtcp modules")
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -129,6 +83,12 @@ class MTCPApp(App):
         Binding("w", "wallpaper", "Wallpaper", priority=True),
         Binding("d", "deep_freeze", "Deep Freeze", priority=True),
         Binding("f1", "help", "Help"),
+        Binding("j", "show_jobs", "Jobs"),
+        Binding("h", "show_history", "History"),
+        Binding("m", "show_monitor", "Monitor"),
+        Binding("t", "show_top", "Top"),
+        Binding("f", "show_fleet", "Fleet"),
+        Binding("s", "search", "Search"),
         Binding("escape", "go_back", "Back", priority=True),
         Binding("left", "go_back", "Back", show=False),
         Binding("right", "enter_selection", "Enter", show=False),
@@ -139,12 +99,29 @@ class MTCPApp(App):
     current_category: Optional[Category] = None
     current_subcategory: Optional[Subcategory] = None
     command_mode: reactive[bool] = reactive(False)
+    search_mode: reactive[bool] = reactive(False)
 
     def __init__(self) -> None:
         super().__init__()
-        self.script_root = _find_script_root()
+        self.script_root = find_script_root()
+        self.config_path = os.path.join(self.script_root, "sfu-tools", "config.json")
         self.config: Optional[AppConfig] = None
+        self.config_watcher = FileWatcher(self.config_path, self.reload_config)
         self.sys_info: Optional[SystemInfo] = None
+        self.history = MetricsHistory()
+        self.sampler = MetricsSampler(interval=2.0, history=self.history)
+        # Set when a local agent (mtcp --headless agent) serves our metrics
+        self.agent: Optional[AgentClient] = None
+        self._unsubscribe_df = None
+        self._shown_history_version = -1
+        self._shown_metrics: Optional[LiveMetrics] = None
+        self._update_info: Optional[dict] = None
+        self.jobs = JobManager()
+        # Pipeline runs still in progress, by pipeline id
+        self.pipeline_runs: dict[str, PipelineRun] = {}
+        self._option_cache: dict[str, list[Option]] = {}
+        self._view_before_search = "categories"
+        self.jobs.add_listener(self._on_job_event)
 
     def compose(self) -> ComposeResult:
         with VerticalScroll():
@@ -180,6 +157,17 @@ class MTCPApp(App):
                     yield Static("NET", classes="mon-label")
                     yield Static("● OFF", id="net-status", classes="mon-val")
                     yield Static("↑0↓0", id="net-rate", classes="mon-val-dim")
+                # Recent history (see MetricsHistory / HistoryScreen)
+                with Horizontal(id="spark-row"):
+                    yield Static("CPU", classes="mon-label")
+                    yield Sparkline([], id="cpu-spark")
+                    yield Static("│", classes="mon-sep")
+                    yield Static("RAM", classes="mon-label")
+                    yield Sparkline([], id="mem-spark")
+                    yield Static("│", classes="mon-sep")
+                    yield Static("NET", classes="mon-label")
+                    yield Sparkline([], id="net-spark")
+                    yield Static("", id="spark-span", classes="mon-val-dim")
 
             # Breadcrumb / navigation bar
             with Container(id="breadcrumb-bar"):
@@ -199,6 +187,15 @@ class MTCPApp(App):
                     id="command-input",
                 )
 
+        # Search input (hidden by default)
+        with Container(id="search-input-container"):
+            with Horizontal():
+                yield Static("🔍 ", id="search-label")
+                yield Input(
+                    placeholder="Search tools and commands...",
+                    id="search-input",
+                )
+
         # Hotkey footer
         with Horizontal(id="hotkey-bar"):
             yield Static(
@@ -206,24 +203,69 @@ class MTCPApp(App):
                 "[bold]Enter[/bold] Select  "
                 "[bold]←[/bold] Back  "
                 "[bold cyan]/[/bold cyan] Command  "
+                "[bold]S[/bold] Search  "
                 "[bold]W[/bold] Wallpaper  "
                 "[bold]D[/bold] DF  "
+                "[bold]J[/bold] Jobs  "
                 "[bold red]Q[/bold red] Exit",
                 id="footer-nav",
             )
             yield Static("", id="footer-version")
+        startup.mark("compose")
 
     def on_mount(self) -> None:
         """Initialize the app on mount."""
+        startup.mark("mount")
         self.load_app_config()
-        self.refresh_sysinfo()
-        self.check_updates_on_start()
         # Focus the option list so up/down navigation works immediately
         self.set_timer(0.3, self._focus_menu)
-        # Start live metrics monitoring
-        self.set_interval(2.0, self._update_live_metrics)
-        # Initial metrics update
-        self.set_timer(0.5, self._update_live_metrics)
+        self.set_interval(0.5, self._update_live_metrics)
+        # Everything else waits until the banner and menu skeleton are on
+        # screen, so their imports and threads don't delay the first frame
+        self.call_after_refresh(self._after_first_frame)
+
+    def _after_first_frame(self) -> None:
+        """Start the background work deferred by on_mount."""
+        startup.mark("first frame")
+        if startup.exit_after_first_frame:
+            self.exit()
+            return
+        # The header's Deep Freeze badge follows the shared provider
+        self._unsubscribe_df = get_deep_freeze().subscribe(
+            lambda status: self.call_from_thread(self._apply_deep_freeze, status)
+        )
+        self.start_collection()
+        self.check_updates_on_start()
+        # Pick up edits to config.json without a restart
+        self.config_watcher.start()
+        self._preload_screens()
+
+    @work(thread=True)
+    def _preload_screens(self) -> None:
+        """Import the modal screens in the background before first use."""
+        from . import screens  # noqa: F401
+        startup.mark("import screens")
+
+    def on_unmount(self) -> None:
+        """Stop background samplers."""
+        self.sampler.stop()
+        self.config_watcher.stop()
+        if self.agent is not None:
+            self.agent.close()
+        if self._unsubscribe_df is not None:
+            self._unsubscribe_df()
+
+    # Main-screen actions bound with priority=True; while a modal is open
+    # they are disabled so the modal's own bindings (Esc, Q, ...) apply.
+    _MAIN_SCREEN_ACTIONS = frozenset(
+        {"request_exit", "wallpaper", "deep_freeze", "go_back", "enter_selection"}
+    )
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        """Disable main-screen priority bindings while a modal is showing."""
+        if action in self._MAIN_SCREEN_ACTIONS and isinstance(self.screen, ModalScreen):
+            return False
+        return True
 
     def _focus_menu(self) -> None:
         """Focus the tool list for keyboard navigation."""
@@ -236,9 +278,10 @@ class MTCPApp(App):
     @work(thread=True)
     def load_app_config(self) -> None:
         """Load configuration from config.json."""
-        config_path = os.path.join(self.script_root, "sfu-tools", "config.json")
+        config_path = self.config_path
         try:
             self.config = load_config(config_path)
+            startup.mark("config loaded")
             self.call_from_thread(self._on_config_loaded)
         except FileNotFoundError:
             self.call_from_thread(
@@ -247,6 +290,14 @@ class MTCPApp(App):
                 title="Error",
                 severity="error",
             )
+        except ConfigError as e:
+            self.call_from_thread(
+                self.notify,
+                str(e),
+                title="Config error",
+                severity="error",
+                timeout=30,
+            )
         except Exception as e:
             self.call_from_thread(
                 self.notify,
@@ -260,6 +311,14 @@ class MTCPApp(App):
         if not self.config:
             return
 
+        self._apply_config_meta()
+        self._option_cache.clear()
+
+        # Populate menu
+        self._populate_menu()
+
+    def _apply_config_meta(self) -> None:
+        """Show the config's version/author and apply its settings."""
         # Update banner title
         banner_title = self.query_one("#banner-title", Static)
         banner_title.update(
@@ -272,20 +331,226 @@ class MTCPApp(App):
             f"[dim]v{self.config.version} │ {self.config.author}[/dim]"
         )
 
+        self.jobs.max_concurrent = self.config.max_concurrent_jobs
+        self.history.configure(
+            self.config.history_minutes * 60, self.config.history_resolution
+        )
+        get_connectivity_probe().configure(
+            targets=self.config.probe_targets,
+            timeout=self.config.probe_timeout,
+            ttl=self.config.probe_ttl,
+        )
+
         # Update window title
         self.title = f"MTCP v{self.config.version} - Multi-Tool Control Panel"
         self.sub_title = "Technical Assistants"
 
-        # Populate menu
-        self._populate_menu()
+    # ── Config Hot Reload ────────────────────────────────────
+
+    @work(thread=True, exclusive=True, group="config")
+    def reload_config(self) -> None:
+        """Recompile config.json after it changed on disk (watcher thread)."""
+        try:
+            config = load_config(self.config_path)
+        except ConfigError as e:
+            # Keep running with the last good config until the file is fixed
+            self.call_from_thread(
+                self.notify,
+                str(e),
+                title="Config not reloaded",
+                severity="error",
+                timeout=30,
+            )
+            return
+        except Exception:
+            return
+        old = self.config
+        if old is None:
+            self.config = config
+            self.call_from_thread(self._on_config_loaded)
+            return
+        diff = diff_configs(old, config)
+        self.call_from_thread(self._apply_config_reload, config, diff)
+
+    def _apply_config_reload(self, config: AppConfig, diff: ConfigDiff) -> None:
+        """Swap in a reloaded config, patching only the menu that changed.
+
+        Cached option lists are dropped only for views whose entries
+        changed. If the visible view kept the same entries in the same
+        order its prompts are replaced in place; otherwise it is rebuilt
+        with the previously highlighted entry still highlighted. The user
+        stays where they were unless that node was removed, in which case
+        they move up to the nearest surviving parent.
+        """
+        opt_list = self.query_one("#tool-list", OptionList)
+        old_view_key = self._current_view_key()
+        highlight_id = None
+        if opt_list.highlighted is not None and opt_list.option_count > 0:
+            highlight_id = opt_list.get_option_at_index(opt_list.highlighted).id
+
+        self.config = config
+        self._rebind_navigation()
+        if diff.meta_changed:
+            self._apply_config_meta()
+
+        stale = diff.containers | diff.removed | {
+            node_id.rpartition("/")[0] for node_id in diff.changed | diff.containers
+        }
+        for view_key in list(self._option_cache):
+            if self._view_container(view_key) in stale:
+                del self._option_cache[view_key]
+
+        view_key = self._current_view_key()
+        container = self._view_container(view_key)
+        if self.search_mode:
+            self._show_search_results(self.query_one("#search-input", Input).value)
+        elif view_key != old_view_key or container in diff.containers:
+            self._populate_menu(highlight_id=highlight_id)
+        else:
+            # Same entries, same order: only relabel what changed
+            for node_id in diff.changed:
+                if node_id.rpartition("/")[0] != container:
+                    continue
+                kind, node = self._find_node(node_id)
+                opt_list.replace_option_prompt(f"{kind}:{node_id}", self._option_prompt(node))
+            self._option_cache[view_key] = list(opt_list.options)
+            self._update_breadcrumb()
+            self._update_tool_description()
+
+        if not diff.empty:
+            parts = [
+                f"{len(ids)} {label}"
+                for ids, label in (
+                    (diff.added, "added"),
+                    (diff.removed, "removed"),
+                    (diff.changed, "changed"),
+                )
+                if ids
+            ]
+            if diff.commands:
+                parts.append(f"{len(diff.commands)} command(s) updated")
+            if diff.pipelines:
+                parts.append(f"{len(diff.pipelines)} pipeline(s) updated")
+            self.notify(
+                ", ".join(parts) or "Settings updated",
+                title="Config reloaded",
+                severity="information",
+            )
+
+    def _rebind_navigation(self) -> None:
+        """Point the navigation state at nodes of the current config."""
+        config = self.config
+        if self.current_category is not None:
+            self.current_category = config.categories_by_id.get(self.current_category.id)
+        if self.current_subcategory is not None:
+            self.current_subcategory = config.subcategories_by_id.get(
+                self.current_subcategory.id
+            )
+        if self.current_category is None:
+            self.current_subcategory = None
+
+        view = self.current_view
+        if view == "search":
+            view = self._view_before_search
+        if view != "categories":
+            if self.current_category is None:
+                view = "categories"
+            elif self.current_subcategory is None:
+                view = "subcategories" if self.current_category.has_subcategories else "tools"
+        if self.current_view == "search":
+            self._view_before_search = view
+        else:
+            self.current_view = view
+
+    @staticmethod
+    def _view_container(view_key: str) -> str:
+        """Id of the node whose children a view lists ("" for the top)."""
+        return "" if view_key == "categories" else view_key.partition(":")[2]
+
+    def _find_node(self, node_id: str) -> tuple[str, Category | Subcategory | Tool]:
+        """Return (option id prefix, node) for a node id."""
+        config = self.config
+        if node_id in config.categories_by_id:
+            return "cat", config.categories_by_id[node_id]
+        if node_id in config.subcategories_by_id:
+            return "sub", config.subcategories_by_id[node_id]
+        return "tool", config.tools_by_id[node_id]
 
     @work(thread=True)
+    def start_collection(self) -> None:
+        """Start collecting here, then switch to a running agent if one answers.
+
+        Probing for the agent can take a second or two when none runs (a
+        refused loopback connect on Windows), so the first metrics and
+        system info never wait on it. Either way live metrics come from
+        the sampler's own thread; the UI timer only reads the latest
+        snapshot.
+        """
+        self.sampler.start()
+        self.call_from_thread(self.refresh_sysinfo)
+        port = self.config.fleet_port if self.config else DEFAULT_AGENT_PORT
+        agent = connect_local_agent(port=port)
+        if agent is not None:
+            self.agent = agent
+            self.sampler.interval = agent.interval
+            self.sampler.source = self._agent_metrics
+
+    def _agent_metrics(self) -> LiveMetrics:
+        """Metrics from the agent; back to sampling locally if it went away."""
+        agent = self.agent
+        if agent is not None:
+            try:
+                return agent.metrics()
+            except AgentError:
+                self._detach_agent()
+        return get_live_metrics()
+
+    def _detach_agent(self) -> None:
+        agent, self.agent = self.agent, None
+        self.sampler.source = get_live_metrics
+        if agent is not None:
+            agent.close()
+
+    @work(thread=True, exclusive=True, group="sysinfo")
     def refresh_sysinfo(self) -> None:
-        """Refresh system information in background."""
-        info = get_system_info()
+        """Refresh system information in background.
+
+        Sections are collected concurrently and each partial result is
+        rendered as soon as it arrives. With an agent running, its cached
+        copy is used (re-collected by the agent on later refreshes).
+        """
+        agent = self.agent
+        if agent is not None:
+            try:
+                info = agent.info(refresh=self.sys_info is not None)
+            except AgentError:
+                self._detach_agent()
+            else:
+                self._on_sysinfo_partial(info)
+                startup.mark("sysinfo")
+                return
+        self.sys_info = collect_system_info(
+            on_update=self._on_sysinfo_partial,
+            on_static_change=self._on_static_change,
+        )
+        startup.mark("sysinfo")
+
+    def _on_sysinfo_partial(self, info: SystemInfo) -> None:
+        """Forward a partial SystemInfo from the collector thread to the UI."""
         self.sys_info = info
         self.call_from_thread(self._update_sysinfo_display, info)
 
+    def _on_static_change(self, fields: dict) -> None:
+        """Hardware facts that differ from the cache (revalidation thread)."""
+        self.call_from_thread(self._apply_static_fields, fields)
+
+    def _apply_static_fields(self, fields: dict) -> None:
+        """Merge fresh hardware facts into whatever the header shows now."""
+        if self.sys_info is None:
+            return
+        self.sys_info = replace(self.sys_info, **fields)
+        self._update_sysinfo_display(self.sys_info)
+
     def _update_sysinfo_display(self, info: SystemInfo) -> None:
         """Update the system info panel widgets."""
         # Net status
@@ -344,10 +609,12 @@ class MTCPApp(App):
         self.query_one("#sysinfo-content", Static).update(content)
 
     def _update_live_metrics(self) -> None:
-        """Update live monitoring metrics."""
+        """Render the sampler's latest snapshot into the monitor panel."""
+        metrics = self.sampler.latest
+        if metrics is self._shown_metrics:
+            return
+        self._shown_metrics = metrics
         try:
-            metrics = get_live_metrics()
-            
             # Update CPU
             cpu_bar = self.query_one("#cpu-bar", ProgressBar)
             cpu_bar.progress = metrics.cpu_percent
@@ -377,10 +644,58 @@ class MTCPApp(App):
             )
         except Exception:
             pass
+        self._sync_header_network(metrics)
+        self._update_sparklines()
+
+    def _sync_header_network(self, metrics: LiveMetrics) -> None:
+        """Keep the header's network section in step with the live sample.
+
+        The sample, not the local probe, is the source: with an agent
+        attached the probe here is never refreshed.
+        """
+        info = self.sys_info
+        if info is None or not self.sampler.has_sample:
+            return
+        status = "Connected" if metrics.net_online else "Disconnected"
+        net_ip = metrics.net_ip or info.net_ip
+        net_type = metrics.net_type or info.net_type
+        if (info.net_status, info.net_ip, info.net_type) == (status, net_ip, net_type):
+            return
+        self.sys_info = replace(info, net_status=status, net_ip=net_ip, net_type=net_type)
+        self._update_sysinfo_display(self.sys_info)
+
+    def _apply_deep_freeze(self, status: DeepFreezeStatus) -> None:
+        """Update just the Deep Freeze badge after the state changed."""
+        info = self.sys_info
+        if info is None or (info.deep_freeze, info.df_color) == (status.state, status.color):
+            return
+        self.sys_info = replace(info, **status.fields)
+        self._update_sysinfo_display(self.sys_info)
+
+    def _update_sparklines(self) -> None:
+        """Redraw the monitor sparklines when the history gained a sample."""
+        history = self.history
+        if history.version == self._shown_history_version:
+            return
+        self._shown_history_version = history.version
+        try:
+            self.query_one("#cpu-spark", Sparkline).data = history.values("cpu")
+            self.query_one("#mem-spark", Sparkline).data = history.values("memory")
+            sent = history.values("net_sent")
+            recv = history.values("net_recv")
+            self.query_one("#net-spark", Sparkline).data = [
+                s + r for s, r in zip(sent, recv)
+            ]
+            self.query_one("#spark-span", Static).update(
+                f"{len(history) * history.resolution / 60:.0f}m"
+            )
+        except Exception:
+            pass
 
     @work(thread=True)
     def check_updates_on_start(self) -> None:
         """Check for updates on startup."""
+        from .updates import check_for_updates
         if not self.config:
             # Config not loaded yet, retry after a delay
             import time
@@ -388,7 +703,8 @@ class MTCPApp(App):
             if not self.config:
                 return
 
-        update_info = check_for_updates(self.config.version, self.script_root)
+        update_info = check_for_updates(self.config.version)
+        self._update_info = update_info
         if update_info and update_info.get("UpdateAvailable"):
             self.call_from_thread(
                 self._show_update_notification, update_info
@@ -396,6 +712,7 @@ class MTCPApp(App):
 
     def _show_update_notification(self, update_info: dict) -> None:
         """Show the update notification screen."""
+        from .screens import UpdateScreen
         self.push_screen(
             UpdateScreen(
                 current_version=update_info.get("CurrentVersion", "?"),
@@ -407,8 +724,10 @@ class MTCPApp(App):
 
     def _on_update_decision(self, should_update: bool) -> None:
         """Handle user's update decision."""
+        from .updates import install_update
         if should_update and self.config:
-            update_info = check_for_updates(self.config.version, self.script_root)
+            # Reuse the answer that triggered the prompt instead of re-checking
+            update_info = self._update_info
             if update_info:
                 success = install_update(
                     update_info.get("DownloadUrl", ""),
@@ -432,85 +751,133 @@ class MTCPApp(App):
 
     # ── Menu Population ──────────────────────────────────────
 
-    def _populate_menu(self) -> None:
-        """Populate the OptionList based on current navigation state."""
+    def _populate_menu(self, highlight_id: Optional[str] = None) -> None:
+        """Populate the OptionList based on current navigation state.
+
+        Option lists are built once per view and cached, so navigating is
+        a swap of prebuilt ``Option`` objects rather than a rebuild. The
+        option with ``highlight_id`` is highlighted if present, otherwise
+        the first one.
+        """
         if not self.config:
             return
 
         opt_list = self.query_one("#tool-list", OptionList)
+        view_key = self._current_view_key()
+
         opt_list.clear_options()
+        if view_key:
+            opt_list.add_options(self._view_options(view_key))
 
+        self._update_breadcrumb()
+
+        # Auto highlight first item
+        if opt_list.option_count > 0:
+            index = 0
+            if highlight_id is not None:
+                try:
+                    index = opt_list.get_option_index(highlight_id)
+                except Exception:
+                    index = 0
+            opt_list.highlighted = index
+            opt_list.focus()
+
+    def _current_view_key(self) -> str:
+        """Cache key of the option list for the current navigation state."""
+        if self.current_view == "categories":
+            return "categories"
+        if self.current_view == "subcategories" and self.current_category:
+            return f"sub:{self.current_category.id}"
+        if self.current_view == "tools" and self.current_subcategory:
+            return f"tools:{self.current_subcategory.id}"
+        if self.current_view == "tools" and self.current_category:
+            return f"tools:{self.current_category.id}"
+        return ""
+
+    def _update_breadcrumb(self) -> None:
+        """Show where we are in the menu and the current node's description."""
         breadcrumb = "📍 Main Menu"
         desc = ""
 
         if self.current_view == "categories":
-            breadcrumb = "📍 Main Menu"
             desc = "Select a category to continue"
-            for cat in self.config.categories:
-                icon = "📦" if cat.has_subcategories else "�"
-                opt_list.add_option(
-                    Option(f"{icon}  {cat.name}", id=f"cat:{cat.name}")
-                )
 
-        elif self.current_view == "subcategories" and self.current_category:
+        elif self.current_view == "tools" and self.current_subcategory:
+            breadcrumb = (
+                f"📍 Main Menu › {self.current_category.name} › "
+                f"{self.current_subcategory.name}"
+            )
+
+        elif self.current_category:
             breadcrumb = f"📍 Main Menu › {self.current_category.name}"
             desc = self.current_category.description
-            for subcat in self.current_category.subcategories:
-                opt_list.add_option(
-                    Option(f"📂  {subcat.name}", id=f"sub:{subcat.name}")
-                )
-
-        elif self.current_view == "tools":
-            tools = []
-            if self.current_subcategory:
-                breadcrumb = (
-                    f"📍 Main Menu › {self.current_category.name} › "
-                    f"{self.current_subcategory.name}"
-                )
-                tools = self.current_subcategory.tools
-            elif self.current_category:
-                breadcrumb = f"📍 Main Menu › {self.current_category.name}"
-                desc = self.current_category.description
-                tools = self.current_category.tools
-
-            for tool in tools:
-                hotkey_badge = f" [{tool.hotkey}]" if tool.hotkey else ""
-                opt_list.add_option(
-                    Option(
-                        f"🔧  {tool.name}{hotkey_badge}",
-                        id=f"tool:{tool.name}",
-                    )
-                )
 
-        # Update breadcrumb
         self.query_one("#breadcrumb-text", Static).update(breadcrumb)
         self.query_one("#breadcrumb-desc", Static).update(
             f"[dim italic]{desc}[/dim italic]" if desc else ""
         )
 
-        # Auto highlight first item
-        if opt_list.option_count > 0:
-            opt_list.highlighted = 0
-            opt_list.focus()
+    def _view_options(self, view_key: str) -> list[Option]:
+        """Return the cached Option list for a view, building it on first use."""
+        options = self._option_cache.get(view_key)
+        if options is None:
+            options = self._build_view_options(view_key)
+            self._option_cache[view_key] = options
+        return options
+
+    def _build_view_options(self, view_key: str) -> list[Option]:
+        """Build the Option list for a view key (see _current_view_key)."""
+        config = self.config
+        if view_key == "categories":
+            return [
+                Option(self._option_prompt(cat), id=f"cat:{cat.id}")
+                for cat in config.categories
+            ]
+
+        kind, _, node_id = view_key.partition(":")
+        if kind == "sub":
+            category = config.categories_by_id[node_id]
+            return [
+                Option(self._option_prompt(subcat), id=f"sub:{subcat.id}")
+                for subcat in category.subcategories
+            ]
+
+        container = (
+            config.subcategories_by_id.get(node_id)
+            or config.categories_by_id[node_id]
+        )
+        return [
+            Option(self._option_prompt(tool), id=f"tool:{tool.id}")
+            for tool in container.tools
+        ]
+
+    @staticmethod
+    def _option_prompt(node: Category | Subcategory | Tool) -> str:
+        """Menu label for a category, subcategory or tool."""
+        if isinstance(node, Category):
+            return f"{'📦' if node.has_subcategories else '�'}  {node.name}"
+        if isinstance(node, Subcategory):
+            return f"📂  {node.name}"
+        return f"🔧  {node.name}" + (f" [{node.hotkey}]" if node.hotkey else "")
 
     def _update_tool_description(self) -> None:
         """Update the breadcrumb description based on highlighted tool."""
-        if self.current_view != "tools":
+        if self.current_view not in ("tools", "search") or not self.config:
             return
 
         opt_list = self.query_one("#tool-list", OptionList)
-        if opt_list.highlighted is None:
+        if opt_list.highlighted is None or opt_list.option_count == 0:
             return
-
-        tools = []
-        if self.current_subcategory:
-            tools = self.current_subcategory.tools
-        elif self.current_category:
-            tools = self.current_category.tools
-
-        idx = opt_list.highlighted
-        if 0 <= idx < len(tools):
-            desc = tools[idx].description
+        option_id = str(opt_list.get_option_at_index(opt_list.highlighted).id)
+        kind, _, key = option_id.partition(":")
+        if kind == "tool":
+            node = self.config.tools_by_id.get(key)
+        elif kind == "cmd":
+            node = self.config.commands.get(key)
+        else:
+            node = None
+        if node is not None:
+            desc = node.description
             self.query_one("#breadcrumb-desc", Static).update(
                 f"[dim italic]{desc}[/dim italic]" if desc else ""
             )
@@ -535,44 +902,37 @@ class MTCPApp(App):
         if not self.config:
             return
 
-        if option_id.startswith("cat:"):
-            cat_name = option_id[4:]
-            for cat in self.config.categories:
-                if cat.name == cat_name:
-                    self.current_category = cat
-                    if cat.has_subcategories:
-                        self.current_view = "subcategories"
-                    else:
-                        self.current_view = "tools"
-                    self._populate_menu()
-                    return
-
-        elif option_id.startswith("sub:"):
-            sub_name = option_id[4:]
-            if self.current_category:
-                for sub in self.current_category.subcategories:
-                    if sub.name == sub_name:
-                        self.current_subcategory = sub
-                        self.current_view = "tools"
-                        self._populate_menu()
-                        return
-
-        elif option_id.startswith("tool:"):
-            tool_name = option_id[5:]
-            tools = []
-            if self.current_subcategory:
-                tools = self.current_subcategory.tools
-            elif self.current_category:
-                tools = self.current_category.tools
+        kind, _, node_id = option_id.partition(":")
+
+        if kind == "cat":
+            cat = self.config.categories_by_id.get(node_id)
+            if cat:
+                self.current_category = cat
+                if cat.has_subcategories:
+                    self.current_view = "subcategories"
+                else:
+                    self.current_view = "tools"
+                self._populate_menu()
+
+        elif kind == "sub":
+            sub = self.config.subcategories_by_id.get(node_id)
+            if sub and self.current_category:
+                self.current_subcategory = sub
+                self.current_view = "tools"
+                self._populate_menu()
 
-            for tool in tools:
-                if tool.name == tool_name:
-                    self._execute_tool(tool)
-                    return
+        elif kind == "tool":
+            tool = self.config.tools_by_id.get(node_id)
+            if tool:
+                self._execute_tool(tool)
+
+        elif kind == "cmd":
+            self._execute_slash_command(node_id)
 
     @work(thread=True)
     def _execute_tool(self, tool: Tool) -> None:
         """Execute a tool command in background."""
+        from .screens import ToolOutputScreen
         self.call_from_thread(
             self.notify,
             f"Running: {tool.name}...",
@@ -580,27 +940,12 @@ class MTCPApp(App):
             severity="information",
         )
 
-        command = resolve_command(tool.command, self.script_root)
-
-        # For GUI tools (msc, exe launchers), just open them
-        gui_extensions = [".msc", ".exe"]
-        is_gui = any(command.strip().lower().endswith(ext) for ext in gui_extensions)
-        # Also check for simple exe names without path
-        is_gui = is_gui or command.strip().lower() in [
-            "taskmgr.exe", "msinfo32.exe", "dfrgui.exe", "cleanmgr.exe",
-            "devmgmt.msc", "eventvwr.msc", "services.msc", "diskmgmt.msc",
-            "mdsched.exe",
-        ]
+        plan = tool.plan
 
-        if is_gui:
+        # GUI tools (snap-ins, launchers) open their own window; just start them
+        if plan.gui:
             try:
-                subprocess.Popen(
-                    command,
-                    shell=True,
-                    creationflags=subprocess.CREATE_NEW_CONSOLE
-                    if "powershell" in command.lower()
-                    else 0,
-                )
+                start_detached(plan, self.script_root)
                 self.call_from_thread(
                     self.notify,
                     f"{tool.name} launched.",
@@ -616,59 +961,40 @@ class MTCPApp(App):
                 )
             return
 
-        # For console tools, capture output
-        try:
-            # PowerShell scripts or commands that need a console
-            if "powershell" in command.lower() or "-File" in command:
-                proc = subprocess.Popen(
-                    command,
-                    shell=True,
-                    creationflags=subprocess.CREATE_NEW_CONSOLE,
-                )
-                proc.wait()
-                self.call_from_thread(
-                    self.notify,
-                    f"{tool.name} completed.",
-                    title="Done",
-                    severity="information",
-                )
-            else:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                )
-                output = result.stdout + result.stderr
-                if output.strip():
-                    self.call_from_thread(
-                        self.push_screen,
-                        ToolOutputScreen(f"📋 {tool.name}", output),
-                    )
-                else:
-                    self.call_from_thread(
-                        self.notify,
-                        f"{tool.name} completed.",
-                        title="Done",
-                        severity="information",
-                    )
+        # Interactive scripts may act on the exported Deep Freeze state
+        # (Invoke-DelProf2.ps1 does); make sure it is recent enough to trust
+        if plan.needs_console:
+            get_deep_freeze().status(max_age=ENV_MAX_AGE)
 
-        except subprocess.TimeoutExpired:
+        # Console tools run as tracked jobs (queued behind the concurrency
+        # limit). Interactive PowerShell scripts get their own console;
+        # everything else streams into an output screen.
+        job = self.jobs.submit(
+            tool.name, plan.args(self.script_root), capture=plan.capture, timeout=plan.timeout
+        )
+        if job.capture:
             self.call_from_thread(
-                self.notify,
-                f"{tool.name} timed out.",
-                title="Timeout",
-                severity="warning",
-            )
-        except Exception as e:
-            self.call_from_thread(
-                self.notify,
-                f"Error: {e}",
-                title="Failed",
-                severity="error",
+                lambda: self.push_screen(ToolOutputScreen(f"📋 {tool.name}", job=job))
             )
 
+    def _on_job_event(self, job: Job, lines: list[str], first_index: int) -> None:
+        """Notify when a job finishes (JobManager listener, job thread)."""
+        if lines or job.is_active:
+            return
+        if job.status == COMPLETED:
+            message, severity = f"{job.name} completed.", "information"
+        elif job.status == CANCELLED:
+            message, severity = f"{job.name} cancelled.", "warning"
+        elif job.status == TIMED_OUT:
+            message, severity = f"{job.name} timed out.", "warning"
+        else:
+            message = f"{job.name} failed ({job.error or f'exit code {job.exit_code}'})."
+            severity = "error"
+        try:
+            self.call_from_thread(self.notify, message, title="Job finished", severity=severity)
+        except Exception:
+            pass
+
     # ── Actions ──────────────────────────────────────────────
 
     def action_go_back(self) -> None:
@@ -677,6 +1003,10 @@ class MTCPApp(App):
             self._hide_command_input()
             return
 
+        if self.search_mode:
+            self._hide_search_input()
+            return
+
         if self.current_view == "tools":
             if self.current_subcategory:
                 self.current_subcategory = None
@@ -702,6 +1032,7 @@ class MTCPApp(App):
 
     def action_request_exit(self) -> None:
         """Show exit confirmation."""
+        from .screens import ExitConfirmScreen
         self.push_screen(ExitConfirmScreen(), callback=self._on_exit_decision)
 
     def _on_exit_decision(self, should_exit: bool) -> None:
@@ -714,14 +1045,9 @@ class MTCPApp(App):
             return
 
         # Look for wallpaper hotkey in config
-        wallpaper_cmd = self.config.hotkey_map.get("W", "")
-        if wallpaper_cmd:
-            resolved = resolve_command(wallpaper_cmd, self.script_root)
-            subprocess.Popen(
-                resolved,
-                shell=True,
-                creationflags=subprocess.CREATE_NEW_CONSOLE,
-            )
+        wallpaper_tool = self.config.tools_by_hotkey.get("W")
+        if wallpaper_tool:
+            start_detached(wallpaper_tool.plan, self.script_root)
             self.notify("Wallpaper script launched.", title="Wallpaper")
         else:
             # Try direct script path
@@ -750,6 +1076,7 @@ class MTCPApp(App):
 
     def action_deep_freeze(self) -> None:
         """Toggle Deep Freeze."""
+        from .screens import DeepFreezeScreen
         toggle_script = os.path.join(
             self.script_root, "sfu-tools", "Toggle-DeepFreeze.ps1"
         )
@@ -769,22 +1096,104 @@ class MTCPApp(App):
                 severity="error",
             )
 
-    def _on_df_done(self, result) -> None:
-        """Refresh sysinfo after Deep Freeze toggle."""
-        if result:
-            self.refresh_sysinfo()
+    def _on_df_done(self, toggle: Optional[subprocess.Popen]) -> None:
+        """Re-read the Deep Freeze state once the toggle script has run."""
+        if toggle is not None:
+            self.refresh_deep_freeze(toggle)
+
+    @work(thread=True, group="deep-freeze")
+    def refresh_deep_freeze(self, toggle: Optional[subprocess.Popen] = None) -> None:
+        """Refresh only the Deep Freeze state; the badge updates if it changed."""
+        if toggle is not None:
+            toggle.wait()
+        get_deep_freeze().refresh()
 
     def action_help(self) -> None:
         """Show help screen."""
+        from .screens import HelpScreen
         if self.config:
             self.push_screen(HelpScreen(self.config))
 
     def on_key(self, event) -> None:
         """Intercept / key before OptionList consumes it."""
-        if event.character == "/" and not self.command_mode:
+        if event.character == "/" and not (self.command_mode or self.search_mode):
             event.prevent_default()
             event.stop()
             self._show_command_input()
+        elif self.search_mode and event.key in ("up", "down"):
+            # Arrow keys move through results while typing continues
+            event.stop()
+            opt_list = self.query_one("#tool-list", OptionList)
+            if event.key == "up":
+                opt_list.action_cursor_up()
+            else:
+                opt_list.action_cursor_down()
+
+    def action_show_jobs(self) -> None:
+        """Show the jobs screen."""
+        from .screens import JobsScreen
+        self.push_screen(JobsScreen(self.jobs))
+
+    def action_show_history(self) -> None:
+        """Show the metrics history screen."""
+        from .screens import HistoryScreen
+        self.push_screen(HistoryScreen(self.history))
+
+    def action_show_monitor(self) -> None:
+        """Show the per-core/disk/adapter monitor."""
+        from .screens import MonitorScreen
+        self.push_screen(MonitorScreen(self.sampler))
+
+    def action_show_top(self) -> None:
+        """Show the top processes screen."""
+        from .screens import TopScreen
+        self.push_screen(TopScreen())
+
+    def action_show_fleet(self) -> None:
+        """Show the lab fleet screen."""
+        from .screens import FleetScreen
+        if self.config is None:
+            return
+        self.push_screen(FleetScreen(self.config))
+
+    def run_pipeline(self, pipeline_id: str) -> None:
+        """Start a pipeline (or reopen the run in progress) and show it."""
+        from .screens import PipelineScreen
+        pipeline = self.config.pipelines.get(pipeline_id) if self.config else None
+        if pipeline is None:
+            self.notify(f"Unknown pipeline: {pipeline_id}", title="Error", severity="error")
+            return
+        run = self.pipeline_runs.get(pipeline_id)
+        if run is None:
+            run = PipelineRun(
+                pipeline, self.config, self.jobs, self.script_root,
+                on_change=self._on_pipeline_change,
+            )
+            self.pipeline_runs[pipeline_id] = run
+            run.start()
+        self.push_screen(PipelineScreen(run))
+
+    def _on_pipeline_change(self, run: PipelineRun) -> None:
+        """Report a finished pipeline (PipelineRun listener, job thread)."""
+        if not run.done or self.pipeline_runs.get(run.pipeline.id) is not run:
+            return
+        del self.pipeline_runs[run.pipeline.id]
+        counts = run.counts()
+        summary = ", ".join(f"{n} {state}" for state, n in counts.items())
+        message = f"{summary} in {format_duration(run.elapsed)}."
+        severity = "information" if run.ok else "warning"
+        try:
+            self.call_from_thread(
+                self.notify, message, title=f"{run.pipeline.name} finished", severity=severity
+            )
+        except RuntimeError:
+            # Finished on the UI thread itself (cancelled with nothing running)
+            self.notify(message, title=f"{run.pipeline.name} finished", severity=severity)
+
+    def action_search(self) -> None:
+        """Show the search input."""
+        if self.config and not self.command_mode:
+            self._show_search_input()
 
     def action_command_palette(self) -> None:
         """Show the command input."""
@@ -823,8 +1232,85 @@ class MTCPApp(App):
 
         self._execute_slash_command(command_text)
 
+    # ── Search ───────────────────────────────────────────────
+
+    def _show_search_input(self) -> None:
+        """Show the search bar; results replace the menu while it is open."""
+        container = self.query_one("#search-input-container")
+        container.styles.display = "block"
+        self.search_mode = True
+        self._view_before_search = self.current_view
+        inp = self.query_one("#search-input", Input)
+        inp.value = ""
+        self._show_search_results("")
+        self.set_timer(0.1, lambda: inp.focus())
+
+    def _hide_search_input(self) -> None:
+        """Hide the search bar and restore the menu view."""
+        container = self.query_one("#search-input-container")
+        container.styles.display = "none"
+        self.search_mode = False
+        self.current_view = self._view_before_search
+        self._populate_menu()
+        self.set_timer(0.1, self._focus_menu)
+
+    @on(Input.Changed, "#search-input")
+    def on_search_changed(self, event: Input.Changed) -> None:
+        """Re-rank results on every keystroke."""
+        if self.search_mode:
+            self._show_search_results(event.value)
+
+    def _show_search_results(self, query: str) -> None:
+        """Fill the menu with ranked search results for ``query``."""
+        if not self.config:
+            return
+        self.current_view = "search"
+        results = self.config.search_index.search(query, limit=50)
+
+        opt_list = self.query_one("#tool-list", OptionList)
+        opt_list.clear_options()
+        opt_list.add_options(
+            Option(
+                Text.assemble(
+                    "🔧  " if entry.kind == "tool" else "💬  ",
+                    entry.title,
+                    (f"  {entry.subtitle}", "dim"),
+                ),
+                id=f"{'tool' if entry.kind == 'tool' else 'cmd'}:{entry.key}",
+            )
+            for entry in results
+        )
+        if opt_list.option_count > 0:
+            opt_list.highlighted = 0
+
+        self.query_one("#breadcrumb-text", Static).update(
+            f"🔍 Search: {query}" if query else "🔍 Search"
+        )
+        if not query:
+            hint = "Type to search tools and commands"
+        elif not results:
+            hint = "No matches"
+        else:
+            hint = ""
+        self.query_one("#breadcrumb-desc", Static).update(
+            f"[dim italic]{hint}[/dim italic]" if hint else ""
+        )
+        self._update_tool_description()
+
+    @on(Input.Submitted, "#search-input")
+    def on_search_submitted(self, event: Input.Submitted) -> None:
+        """Run the highlighted search result."""
+        opt_list = self.query_one("#tool-list", OptionList)
+        option_id = None
+        if opt_list.highlighted is not None and opt_list.option_count > 0:
+            option_id = str(opt_list.get_option_at_index(opt_list.highlighted).id)
+        self._hide_search_input()
+        if option_id:
+            self._handle_selection(option_id)
+
     def _execute_slash_command(self, command_name: str) -> None:
         """Execute a slash command."""
+        from .screens import CreditsScreen, DebugScreen, HelpScreen
         if not self.config:
             return
 
@@ -845,6 +1331,18 @@ class MTCPApp(App):
             self.push_screen(CreditsScreen(self.config))
         elif action == "show-debug":
             self.push_screen(DebugScreen(self.config, self.script_root))
+        elif action == "show-jobs":
+            self.action_show_jobs()
+        elif action == "show-search":
+            self.action_search()
+        elif action == "show-history":
+            self.action_show_history()
+        elif action == "show-monitor":
+            self.action_show_monitor()
+        elif action == "show-top":
+            self.action_show_top()
+        elif action == "show-fleet":
+            self.action_show_fleet()
         elif action == "show-version":
             self.notify(
                 f"v{self.config.version}", title="Version", severity="information"
@@ -874,12 +1372,14 @@ class MTCPApp(App):
                     severity="error",
                 )
         elif action == "run-command":
-            subprocess.Popen(
-                cmd.command,
-                shell=True,
-                creationflags=subprocess.CREATE_NEW_CONSOLE,
-            )
+            try:
+                start_detached(cmd.plan, self.script_root)
+            except OSError as e:
+                self.notify(f"Error: {e}", title="Failed", severity="error")
+                return
             self.notify(f"Launched: {command_name}", title="Running")
+        elif action == "run-pipeline":
+            self.run_pipeline(cmd.pipeline)
         elif action == "exit":
             self.action_request_exit()
         else:
@@ -940,9 +1440,12 @@ def main():
     """Entry point for the MTCP application."""
     # Set optimal console size for TUI
     _set_console_size(120, 42)
-    
+    startup.mark("console setup")
+
     app = MTCPApp()
+    startup.mark("app init")
     app.run()
+    startup.report()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,464 @@
+"""Headless command line for MTCP: ``python -m mtcp --headless <command>``.
+
+Collects the same system info and live metrics as the TUI and prints
+them as text, JSON or NDJSON, so scheduled tasks can gather inventory
+without a console UI. Nothing here imports Textual.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from typing import Optional
+
+from .config import AppConfig, ConfigError, load_config
+from .paths import find_script_root
+
+EXIT_USAGE = 2
+EXIT_TIMEOUT = 124
+EXIT_NOT_FOUND = 127
+
+
+def _load_config(script_root: str) -> Optional[AppConfig]:
+    """Load config.json and apply its settings; None if it is unusable."""
+    try:
+        config = load_config(os.path.join(script_root, "sfu-tools", "config.json"))
+    except (OSError, ConfigError) as e:
+        print(f"mtcp: {e}", file=sys.stderr)
+        return None
+    from .netprobe import get_connectivity_probe
+    get_connectivity_probe().configure(
+        targets=config.probe_targets,
+        timeout=config.probe_timeout,
+        ttl=config.probe_ttl,
+    )
+    return config
+
+
+def _local_agent(args: argparse.Namespace, config: Optional[AppConfig]):
+    """A client for this machine's agent, unless --no-agent or none runs."""
+    if args.no_agent:
+        return None
+    from .agent import connect_local_agent
+    return connect_local_agent(port=(config or AppConfig()).fleet_port)
+
+
+def _emit(obj: dict, pretty: bool = False) -> None:
+    if pretty:
+        print(json.dumps(obj, indent=2, ensure_ascii=False))
+    else:
+        print(json.dumps(obj, separators=(",", ":"), ensure_ascii=False), flush=True)
+
+
+# ── Commands ─────────────────────────────────────────────────
+
+
+def cmd_info(args: argparse.Namespace) -> int:
+    """Print SystemInfo once."""
+    from .sysinfo import collect_system_info
+
+    config = _load_config(args.script_root)
+    agent = _local_agent(args, config)
+    info = None
+    if agent is not None:
+        from .agent import AgentError
+        try:
+            info = agent.info(use_cache=not args.no_cache)
+        except AgentError as e:
+            print(f"mtcp: {e}; collecting locally", file=sys.stderr)
+        finally:
+            agent.close()
+    if info is None:
+        info = collect_system_info(use_cache=not args.no_cache)
+    if args.json:
+        _emit({"timestamp": round(time.time(), 3), **asdict(info)}, pretty=True)
+    else:
+        for name, value in asdict(info).items():
+            print(f"{name:<14} {value}")
+    return 0
+
+
+def cmd_metrics(args: argparse.Namespace) -> int:
+    """Stream LiveMetrics as NDJSON, one object per line."""
+    from .sysinfo import get_live_metrics
+
+    config = _load_config(args.script_root)
+    emitted = 0
+    if not args.detailed:
+        agent = _local_agent(args, config)
+        if agent is not None:
+            emitted = _stream_agent_metrics(agent, args)
+            if args.count and emitted >= args.count:
+                return 0
+    collector = None
+    if args.detailed:
+        from .monitor import DetailedCollector
+        collector = DetailedCollector()
+        collector.sample()
+    # The first reading only primes psutil's CPU and network counters
+    get_live_metrics()
+
+    next_at = time.monotonic() + args.interval
+    while args.count == 0 or emitted < args.count:
+        time.sleep(max(0.0, next_at - time.monotonic()))
+        next_at += args.interval
+        record = {"timestamp": round(time.time(), 3), **asdict(get_live_metrics())}
+        if collector is not None:
+            record["detail"] = asdict(collector.sample())
+        _emit(record)
+        emitted += 1
+    return 0
+
+
+def _stream_agent_metrics(agent, args: argparse.Namespace) -> int:
+    """Print the agent's metrics as it pushes them, at most one per --interval.
+
+    Returns how many were printed; if the agent fails before --count is
+    reached, the caller samples locally for the rest.
+    """
+    from .agent import AgentError
+
+    emitted = 0
+    last = 0.0
+    try:
+        for _, metrics, at in agent.subscribe(["metrics"]):
+            if at - last < args.interval * 0.9:
+                continue
+            last = at
+            _emit({"timestamp": round(at, 3), **asdict(metrics)})
+            emitted += 1
+            if args.count and emitted >= args.count:
+                break
+    except AgentError as e:
+        print(f"mtcp: {e}; sampling locally", file=sys.stderr)
+    finally:
+        agent.close()
+    return emitted
+
+
+def cmd_tools(args: argparse.Namespace) -> int:
+    """List the tool ids accepted by ``run``."""
+    config = _load_config(args.script_root)
+    if config is None:
+        return 1
+    for tool_id, tool in config.tools_by_id.items():
+        print(f"{tool_id:<40} {tool.name}")
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    """Run one tool, streaming its output; exit with its exit code."""
+    from .tools import stream_command
+
+    config = _load_config(args.script_root)
+    if config is None:
+        return 1
+    tool = config.tools_by_id.get(args.tool_id) or config.tools_by_name.get(args.tool_id)
+    if tool is None:
+        print(
+            f"mtcp: unknown tool {args.tool_id!r} (see 'mtcp --headless tools')",
+            file=sys.stderr,
+        )
+        return EXIT_USAGE
+
+    command = tool.plan.args(args.script_root)
+    timeout = tool.plan.timeout if args.timeout is None else args.timeout or None
+
+    def on_lines(lines: list[str]) -> None:
+        print("\n".join(lines), flush=True)
+
+    try:
+        return stream_command(command, on_lines, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        print(f"mtcp: {tool.name} timed out after {timeout:g}s", file=sys.stderr)
+        return EXIT_TIMEOUT
+    except OSError as e:
+        # Started directly, a missing program fails here rather than in a shell
+        print(f"mtcp: cannot start {tool.name}: {e}", file=sys.stderr)
+        return EXIT_NOT_FOUND
+
+
+def cmd_pipeline(args: argparse.Namespace) -> int:
+    """Run a pipeline, prefixing tool output with its step; exit 1 unless all went well."""
+    import threading
+    from .jobs import JobManager
+    from .pipelines import WAITING, PipelineRun, format_duration
+
+    config = _load_config(args.script_root)
+    if config is None:
+        return 1
+    if not args.pipeline_id:
+        for pipeline_id, pipeline in config.pipelines.items():
+            steps = ", ".join(step.id for step in pipeline.steps)
+            print(f"{pipeline_id:<24} {pipeline.name} ({steps})")
+        return 0
+    pipeline = config.pipelines.get(args.pipeline_id)
+    if pipeline is None:
+        print(
+            f"mtcp: unknown pipeline {args.pipeline_id!r} (see 'mtcp --headless pipeline')",
+            file=sys.stderr,
+        )
+        return EXIT_USAGE
+
+    # With --json, stdout carries only the report
+    out = sys.stderr if args.json else sys.stdout
+    jobs = JobManager(max_concurrent=args.concurrency or config.max_concurrent_jobs)
+    lock = threading.Lock()
+    shown: dict[str, str] = {}
+
+    def on_change(run: PipelineRun) -> None:
+        with lock:
+            for step in run.steps:
+                if step.status != WAITING and shown.get(step.step.id) != step.status:
+                    shown[step.step.id] = step.status
+                    detail = step.reason or (
+                        f"exit code {step.exit_code}" if step.finished and step.exit_code is not None else ""
+                    )
+                    detail = f" ({detail})" if detail else ""
+                    print(f"mtcp: {step.step.id}: {step.status}{detail}", file=sys.stderr, flush=True)
+
+    run = PipelineRun(pipeline, config, jobs, args.script_root, on_change=on_change)
+
+    def on_lines(job, lines: list[str], first_index: int) -> None:
+        if not lines:
+            return
+        step_id = next((s.step.id for s in run.steps if s.job is job), job.name)
+        with lock:
+            print("\n".join(f"[{step_id}] {line}" for line in lines), file=out, flush=True)
+
+    jobs.add_listener(on_lines)
+    run.start()
+    try:
+        # Short waits keep Ctrl+C responsive on Windows
+        while not run.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        run.cancel()
+        run.wait(10)
+        raise
+
+    report = run.report()
+    if args.json:
+        _emit(report, pretty=True)
+    else:
+        width = max(len("step"), *(len(s["id"]) for s in report["steps"]))
+        tool_width = max(len("tool"), *(len(s["tool"]) for s in report["steps"]))
+        print(f"\n{'step':<{width}}  {'tool':<{tool_width}}  {'status':<10} {'exit':>5}  time")
+        for s in report["steps"]:
+            exit_code = "-" if s["exit_code"] is None else s["exit_code"]
+            reason = f"  {s['reason']}" if s["reason"] else ""
+            print(
+                f"{s['id']:<{width}}  {s['tool']:<{tool_width}}  {s['status']:<10} {exit_code:>5}  "
+                f"{format_duration(s['seconds'])}{reason}"
+            )
+        print(
+            f"{pipeline.name}: {'ok' if run.ok else 'FAILED'} in {format_duration(run.elapsed)} "
+            f"(one at a time: {format_duration(report['serial_seconds'])})"
+        )
+    return 0 if run.ok else 1
+
+
+def _read_hosts(args: argparse.Namespace, config: Optional[AppConfig]) -> list[str]:
+    """Hosts from the command line and --hosts-file, else from config.json."""
+    hosts = list(args.hosts)
+    if args.hosts_file:
+        with open(args.hosts_file, encoding="utf-8") as f:
+            hosts += [
+                line.split("#", 1)[0].strip() for line in f
+                if line.split("#", 1)[0].strip()
+            ]
+    if not hosts and config is not None:
+        hosts = list(config.fleet_hosts)
+    return hosts
+
+
+def cmd_fleet(args: argparse.Namespace) -> int:
+    """Query SystemInfo from many hosts at once; exit 1 if any failed."""
+    import asyncio
+    from .fleet import AgentTransport, query_fleet
+
+    config = _load_config(args.script_root)
+    try:
+        hosts = _read_hosts(args, config)
+    except OSError as e:
+        print(f"mtcp: {e}", file=sys.stderr)
+        return 1
+    if not hosts:
+        print("mtcp: no hosts given and settings.fleet_hosts is empty", file=sys.stderr)
+        return EXIT_USAGE
+    config = config or AppConfig()
+    transport = AgentTransport(port=args.port or config.fleet_port, token=config.fleet_token)
+
+    async def run():
+        try:
+            return await query_fleet(
+                hosts,
+                transport,
+                concurrency=args.concurrency or config.fleet_concurrency,
+                timeout=args.timeout or config.fleet_timeout,
+            )
+        finally:
+            await transport.close()
+
+    results = asyncio.run(run())
+    if args.json:
+        _emit(
+            [
+                {
+                    "host": r.host,
+                    "ok": r.ok,
+                    "error": r.error,
+                    "latency_ms": None if r.latency_ms is None else round(r.latency_ms, 1),
+                    "info": asdict(r.info) if r.info else None,
+                }
+                for r in results
+            ],
+            pretty=True,
+        )
+    else:
+        width = max(len("host"), *(len(r.host) for r in results))
+        print(f"{'host':<{width}}  {'deep freeze':<13} {'disk free':>10}  {'uptime':<12} status")
+        for r in results:
+            if not r.ok:
+                print(f"{r.host:<{width}}  {'':<13} {'':>10}  {'':<12} {r.error}")
+                continue
+            info = r.info
+            print(
+                f"{r.host:<{width}}  {info.deep_freeze:<13} {info.disk_free_gb:>7.1f} GB  "
+                f"{info.uptime:<12} ok ({r.latency_ms:.0f} ms)"
+            )
+    return 0 if all(r.ok for r in results) else 1
+
+
+def cmd_agent(args: argparse.Namespace) -> int:
+    """Sample this machine and serve the results until interrupted."""
+    import asyncio
+    from .agent import Agent, AgentError
+
+    config = _load_config(args.script_root) or AppConfig()
+    port = args.port or config.fleet_port
+    agent = Agent(
+        interval=args.interval, info_interval=args.info_interval, token=config.fleet_token
+    )
+    print(f"mtcp: agent listening on {args.bind}:{port}", file=sys.stderr, flush=True)
+    try:
+        asyncio.run(agent.serve(args.bind, port, socket_path=args.socket))
+    except (OSError, AgentError) as e:
+        print(f"mtcp: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+# ── Entry point ──────────────────────────────────────────────
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="mtcp --headless",
+        description="Collect MTCP system info and metrics without the TUI.",
+    )
+    parser.add_argument(
+        "--root", dest="script_root", default=None,
+        help="MTCP root folder (the one containing sfu-tools)",
+    )
+    parser.add_argument(
+        "--no-agent", action="store_true",
+        help="collect locally even if an agent is running",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    info = commands.add_parser("info", help="print system information")
+    info.add_argument("--json", action="store_true", help="output a JSON object")
+    info.add_argument(
+        "--no-cache", action="store_true", help="ignore the cached hardware facts"
+    )
+    info.set_defaults(func=cmd_info)
+
+    metrics = commands.add_parser("metrics", help="stream live metrics as NDJSON")
+    metrics.add_argument(
+        "--interval", type=float, default=2.0, help="seconds between samples"
+    )
+    metrics.add_argument(
+        "--count", type=int, default=0, help="stop after N samples (0 = forever)"
+    )
+    metrics.add_argument(
+        "--detailed", action="store_true",
+        help="include per-core, per-disk and per-adapter figures",
+    )
+    metrics.set_defaults(func=cmd_metrics)
+
+    tools = commands.add_parser("tools", help="list tool ids")
+    tools.set_defaults(func=cmd_tools)
+
+    run = commands.add_parser("run", help="run a tool and print its output")
+    run.add_argument("tool_id", help="tool id (or exact name) from config.json")
+    run.add_argument(
+        "--timeout", type=float,
+        help="seconds before the tool is killed (default: the tool's own, 0 = none)",
+    )
+    run.set_defaults(func=cmd_run)
+
+    pipeline = commands.add_parser(
+        "pipeline", help="run a batch of tools from config.json (lists them without an id)"
+    )
+    pipeline.add_argument("pipeline_id", nargs="?", help="pipeline id from config.json")
+    pipeline.add_argument(
+        "--concurrency", type=int,
+        help="steps run at once (default: settings.max_concurrent_jobs)",
+    )
+    pipeline.add_argument("--json", action="store_true", help="output the report as JSON")
+    pipeline.set_defaults(func=cmd_pipeline)
+
+    fleet = commands.add_parser("fleet", help="query system info from many hosts")
+    fleet.add_argument("hosts", nargs="*", help="host or host:port (default: settings.fleet_hosts)")
+    fleet.add_argument("--hosts-file", help="file with one host per line")
+    fleet.add_argument("--port", type=int, help="agent port for hosts without one")
+    fleet.add_argument("--timeout", type=float, help="seconds per host")
+    fleet.add_argument("--concurrency", type=int, help="hosts queried at once")
+    fleet.add_argument("--json", action="store_true", help="output a JSON array")
+    fleet.set_defaults(func=cmd_fleet)
+
+    agent = commands.add_parser(
+        "agent", aliases=["serve"], help="sample this machine and serve the results"
+    )
+    agent.add_argument(
+        "--bind",
+        default="127.0.0.1",
+        help="address to listen on (0.0.0.0 for fleet queries, needs settings.fleet_token)",
+    )
+    agent.add_argument("--port", type=int, help="TCP port (default: settings.fleet_port)")
+    agent.add_argument(
+        "--socket", default=None, help="Unix socket path ('' for none; ignored on Windows)"
+    )
+    agent.add_argument(
+        "--interval", type=float, default=2.0, help="seconds between metrics samples"
+    )
+    agent.add_argument(
+        "--info-interval", type=float, default=60.0, help="seconds between system info refreshes"
+    )
+    agent.set_defaults(func=cmd_agent)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point for ``python -m mtcp --headless``."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "interval", 1.0) <= 0:
+        parser.error("--interval must be positive")
+    if getattr(args, "info_interval", 1.0) <= 0:
+        parser.error("--info-interval must be positive")
+    if getattr(args, "count", 0) < 0:
+        parser.error("--count must not be negative")
+    args.script_root = args.script_root or find_script_root()
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Output piped into e.g. `head`; stop quietly
+        sys.stderr.close()
+        return 0
@@ -0,0 +1,914 @@
+"""Configuration loading for MTCP TUI.
+
+``sfu-tools/config.json`` is validated against ``CONFIG_SCHEMA`` and
+compiled into an ``AppConfig`` (with its lookup and search indexes). The
+compiled result is cached in a small binary file so warm starts skip JSON
+parsing, validation and index building entirely.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import struct
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+from typing import Any, Optional
+
+from . import __version__
+from .agent import DEFAULT_AGENT_PORT
+from .fleet import DEFAULT_FLEET_CONCURRENCY, DEFAULT_FLEET_TIMEOUT
+from .launch import LaunchPlan, plan_command
+from .netprobe import DEFAULT_PROBE_TARGETS, DEFAULT_PROBE_TIMEOUT, DEFAULT_PROBE_TTL
+from .paths import cache_path, write_atomic
+from .search import SearchEntry, SearchIndex
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Data model
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@dataclass
+class Tool:
+    """A single tool/command entry.
+
+    ``plan`` is ``command`` parsed into how it is launched (see
+    mtcp.launch); ``timeout`` is the config value it was built with.
+    """
+    name: str
+    description: str = ""
+    command: str = ""
+    hotkey: str = ""
+    id: str = ""
+    timeout: Optional[float] = None
+    plan: Optional[LaunchPlan] = field(default=None, repr=False)
+
+
+@dataclass 
+class Subcategory:
+    """A subcategory within a category."""
+    name: str
+    tools: list[Tool] = field(default_factory=list)
+    id: str = ""
+
+
+@dataclass
+class Category:
+    """A top-level category of tools."""
+    name: str
+    description: str = ""
+    subcategories: list[Subcategory] = field(default_factory=list)
+    tools: list[Tool] = field(default_factory=list)
+    id: str = ""
+
+    @property
+    def has_subcategories(self) -> bool:
+        return len(self.subcategories) > 0
+
+
+@dataclass
+class SlashCommand:
+    """A slash command definition."""
+    name: str
+    description: str = ""
+    action: str = ""
+    script: str = ""
+    command: str = ""
+    pipeline: str = ""
+    plan: Optional[LaunchPlan] = field(default=None, repr=False)
+
+
+@dataclass
+class PipelineStep:
+    """One tool run within a pipeline.
+
+    ``timeout`` None keeps the tool's own; 0 means no limit.
+    """
+    id: str
+    tool_id: str
+    after: tuple[str, ...] = ()
+    when: str = "success"
+    ok_codes: tuple[int, ...] = (0,)
+    timeout: Optional[float] = None
+
+
+@dataclass
+class Pipeline:
+    """A batch of tool runs, ordered by the steps each one comes after."""
+    id: str
+    name: str
+    description: str = ""
+    steps: list[PipelineStep] = field(default_factory=list)
+
+
+@dataclass
+class AppConfig:
+    """Full application configuration."""
+    version: str = "0.0.0"
+    author: str = "Technical Assistants"
+    categories: list[Category] = field(default_factory=list)
+    commands: dict[str, SlashCommand] = field(default_factory=dict)
+    pipelines: dict[str, Pipeline] = field(default_factory=dict)
+    hotkey_map: dict[str, str] = field(default_factory=dict)
+    max_concurrent_jobs: int = 2
+    history_minutes: float = 10
+    history_resolution: float = 2.0
+    probe_targets: tuple[str, ...] = DEFAULT_PROBE_TARGETS
+    probe_timeout: float = DEFAULT_PROBE_TIMEOUT
+    probe_ttl: float = DEFAULT_PROBE_TTL
+    fleet_hosts: tuple[str, ...] = ()
+    fleet_port: int = DEFAULT_AGENT_PORT
+    fleet_timeout: float = DEFAULT_FLEET_TIMEOUT
+    fleet_concurrency: int = DEFAULT_FLEET_CONCURRENCY
+    fleet_token: str = ""
+
+    # Lookup indexes, filled by build_index()
+    categories_by_id: dict[str, Category] = field(default_factory=dict, repr=False)
+    subcategories_by_id: dict[str, Subcategory] = field(default_factory=dict, repr=False)
+    tools_by_id: dict[str, Tool] = field(default_factory=dict, repr=False)
+    tools_by_name: dict[str, Tool] = field(default_factory=dict, repr=False)
+    tools_by_hotkey: dict[str, Tool] = field(default_factory=dict, repr=False)
+    search_index: SearchIndex = field(default_factory=SearchIndex, repr=False)
+
+    def build_index(self) -> None:
+        """(Re)build the id/name/hotkey lookups and the search index."""
+        self.categories_by_id = {}
+        self.subcategories_by_id = {}
+        self.tools_by_id = {}
+        self.tools_by_name = {}
+        self.tools_by_hotkey = {}
+        for category in self.categories:
+            self.categories_by_id[category.id] = category
+            for sub in category.subcategories:
+                self.subcategories_by_id[sub.id] = sub
+            for tool in self.iter_tools(category):
+                self.tools_by_id[tool.id] = tool
+                self.tools_by_name.setdefault(tool.name, tool)
+                if tool.hotkey:
+                    self.tools_by_hotkey[tool.hotkey.upper()] = tool
+        self.search_index = self._build_search_index()
+
+    def _build_search_index(self) -> SearchIndex:
+        index = SearchIndex()
+        for category in self.categories:
+            containers = [(category.name, category.tools)] + [
+                (f"{category.name} › {sub.name}", sub.tools)
+                for sub in category.subcategories
+            ]
+            for path, tools in containers:
+                for tool in tools:
+                    index.add(SearchEntry(
+                        kind="tool",
+                        key=tool.id,
+                        title=tool.name,
+                        subtitle=path,
+                        description=tool.description,
+                    ))
+        for name, cmd in self.commands.items():
+            index.add(SearchEntry(
+                kind="command",
+                key=name,
+                title=f"/{name}",
+                subtitle="Command",
+                description=cmd.description,
+            ))
+        return index
+
+    @staticmethod
+    def iter_tools(category: Category):
+        """Yield a category's direct tools, then its subcategories' tools."""
+        yield from category.tools
+        for sub in category.subcategories:
+            yield from sub.tools
+
+    def all_tools(self):
+        """Yield every tool in config order."""
+        for category in self.categories:
+            yield from self.iter_tools(category)
+
+
+def _slugify(name: str) -> str:
+    """Turn a display name into an id segment ("Disk Cleanup" -> "disk-cleanup")."""
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    return slug or "item"
+
+
+def _unique_id(name: str, parent_id: str, taken: set[str]) -> str:
+    """Build a stable path id for a node, de-duplicating sibling names.
+
+    Ids are derived from names rather than positions so they survive
+    reordering and description edits in config.json.
+    """
+    base = f"{parent_id}/{_slugify(name)}" if parent_id else _slugify(name)
+    node_id = base
+    n = 2
+    while node_id in taken:
+        node_id = f"{base}-{n}"
+        n += 1
+    taken.add(node_id)
+    return node_id
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Schema
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# A small subset of JSON Schema: type, properties, required,
+# additionalProperties, items, enum, minLength, minimum, pattern.
+# Unknown keys are rejected so typos ("hotkye") are reported instead of
+# silently ignored.
+
+SLASH_ACTIONS = [
+    "show-help", "show-credits", "show-debug", "show-jobs", "show-search",
+    "show-history", "show-monitor", "show-top", "show-fleet", "show-version",
+    "check-update", "run-script", "run-command", "run-pipeline", "exit",
+]
+
+# When a pipeline step runs, given how the steps it comes after ended
+PIPELINE_CONDITIONS = ["success", "failure", "always"]
+
+_NAME = {"type": "string", "minLength": 1}
+_TEXT = {"type": "string"}
+
+TOOL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": _NAME,
+        "description": _TEXT,
+        "command": {"type": "string", "minLength": 1},
+        "hotkey": {"type": "string", "pattern": r"^[A-Za-z0-9]?$"},
+        "timeout": {"type": "number", "minimum": 0},
+    },
+    "required": ["name", "command"],
+    "additionalProperties": False,
+}
+
+SUBCATEGORY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": _NAME,
+        "description": _TEXT,
+        "tools": {"type": "array", "items": TOOL_SCHEMA},
+    },
+    "required": ["name"],
+    "additionalProperties": False,
+}
+
+CATEGORY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": _NAME,
+        "description": _TEXT,
+        "tools": {"type": "array", "items": TOOL_SCHEMA},
+        "subcategories": {"type": "array", "items": SUBCATEGORY_SCHEMA},
+    },
+    "required": ["name"],
+    "additionalProperties": False,
+}
+
+COMMAND_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "description": _TEXT,
+        "action": {"type": "string", "enum": SLASH_ACTIONS},
+        "script": {"type": "string", "minLength": 1},
+        "command": {"type": "string", "minLength": 1},
+        "pipeline": {"type": "string", "minLength": 1},
+    },
+    "required": ["action"],
+    "additionalProperties": False,
+}
+
+PIPELINE_STEP_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string", "pattern": r"^[a-z0-9][a-z0-9-]*$"},
+        "tool": _NAME,
+        "after": {"type": "array", "items": _NAME},
+        "when": {"type": "string", "enum": PIPELINE_CONDITIONS},
+        "ok_codes": {"type": "array", "minItems": 1, "items": {"type": "integer"}},
+        "timeout": {"type": "number", "minimum": 0},
+    },
+    "required": ["tool"],
+    "additionalProperties": False,
+}
+
+PIPELINE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": _NAME,
+        "description": _TEXT,
+        "steps": {"type": "array", "minItems": 1, "items": PIPELINE_STEP_SCHEMA},
+    },
+    "required": ["name", "steps"],
+    "additionalProperties": False,
+}
+
+CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "meta": {
+            "type": "object",
+            "properties": {
+                "version": {"type": "string", "pattern": r"^\d+(\.\d+)*$"},
+                "author": _TEXT,
+            },
+            "required": ["version"],
+            "additionalProperties": False,
+        },
+        "settings": {
+            "type": "object",
+            "properties": {
+                "max_concurrent_jobs": {"type": "integer", "minimum": 1},
+                "history_minutes": {"type": "number", "minimum": 1},
+                "history_resolution": {"type": "number", "minimum": 1},
+                "probe_targets": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {"type": "string", "pattern": r"^(\[[0-9A-Fa-f:.]+\]|[^\s:\[\]]+):\d{1,5}$"},
+                },
+                "probe_timeout": {"type": "number", "minimum": 0.1},
+                "probe_ttl": {"type": "number", "minimum": 1},
+                "fleet_hosts": {"type": "array", "items": _NAME},
+                "fleet_port": {"type": "integer", "minimum": 1},
+                "fleet_timeout": {"type": "number", "minimum": 0.1},
+                "fleet_concurrency": {"type": "integer", "minimum": 1},
+                "fleet_token": _TEXT,
+            },
+            "additionalProperties": False,
+        },
+        "commands": {
+            "type": "object",
+            "additionalProperties": COMMAND_SCHEMA,
+        },
+        "pipelines": {
+            "type": "object",
+            "additionalProperties": PIPELINE_SCHEMA,
+        },
+        "categories": {"type": "array", "items": CATEGORY_SCHEMA},
+    },
+    "required": ["meta", "categories"],
+    "additionalProperties": False,
+}
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+}
+
+JsonPath = tuple  # of str keys / int indexes
+
+
+class ConfigError(ValueError):
+    """config.json is malformed or does not match the schema.
+
+    ``errors`` holds one ``(line, column, message)`` per problem found;
+    the string form lists them all as ``file:line:col: message``.
+    """
+
+    def __init__(self, source: str, errors: list[tuple[int, int, str]]) -> None:
+        self.source = source
+        self.errors = errors
+        name = os.path.basename(source)
+        super().__init__(
+            "\n".join(f"{name}:{line}:{col}: {msg}" for line, col, msg in errors)
+        )
+
+
+def _format_path(path: JsonPath) -> str:
+    out = ""
+    for part in path:
+        out += f"[{part}]" if isinstance(part, int) else (f".{part}" if out else part)
+    return out or "(root)"
+
+
+def validate(value: Any, schema: dict, path: JsonPath = ()) -> list[tuple[JsonPath, str]]:
+    """Check ``value`` against ``schema``; return (path, message) problems."""
+    problems: list[tuple[JsonPath, str]] = []
+    expected = schema.get("type")
+    if expected:
+        py_type = _JSON_TYPES[expected]
+        # bool is an int subclass, but true is not a valid integer here
+        if not isinstance(value, py_type) or (
+            isinstance(value, bool) and expected != "boolean"
+        ):
+            problems.append((path, f"expected {expected}, got {_json_type(value)}"))
+            return problems
+
+    if "enum" in schema and value not in schema["enum"]:
+        problems.append((path, f"must be one of: {', '.join(map(str, schema['enum']))}"))
+    if "minLength" in schema and len(value) < schema["minLength"]:
+        problems.append((path, "must not be empty"))
+    if "minItems" in schema and len(value) < schema["minItems"]:
+        problems.append((path, f"must have at least {schema['minItems']} item(s)"))
+    if "minimum" in schema and value < schema["minimum"]:
+        problems.append((path, f"must be at least {schema['minimum']}"))
+    if "pattern" in schema and not re.search(schema["pattern"], value):
+        problems.append((path, f"does not match {schema['pattern']!r}"))
+
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        extra = schema.get("additionalProperties", True)
+        for key in schema.get("required", ()):
+            if key not in value:
+                problems.append((path, f"missing required key {key!r}"))
+        for key, item in value.items():
+            if key in properties:
+                problems += validate(item, properties[key], path + (key,))
+            elif extra is False:
+                problems.append((path + (key,), f"unknown key {key!r}"))
+            elif isinstance(extra, dict):
+                problems += validate(item, extra, path + (key,))
+    elif isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            problems += validate(item, schema["items"], path + (i,))
+    return problems
+
+
+def _json_type(value: Any) -> str:
+    for name, py_type in _JSON_TYPES.items():
+        if isinstance(value, py_type) and not (isinstance(value, bool) and name != "boolean"):
+            return name
+    return "null" if value is None else type(value).__name__
+
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+def _locate_paths(text: str) -> dict[JsonPath, int]:
+    """Map every JSON path in ``text`` to the offset where it starts.
+
+    For object members the offset is that of the key, which is where an
+    editor should jump. Only used to report errors, so it favours
+    simplicity over speed; ``text`` is assumed to be valid JSON.
+    """
+    positions: dict[JsonPath, int] = {}
+    decoder = json.JSONDecoder()
+
+    def walk(idx: int, path: JsonPath) -> int:
+        idx = _WS.match(text, idx).end()
+        positions.setdefault(path, idx)
+        char = text[idx]
+        if char == "{":
+            idx = _WS.match(text, idx + 1).end()
+            if text[idx] == "}":
+                return idx + 1
+            while True:
+                key_pos = idx
+                key, idx = scanstring(text, idx + 1)
+                positions[path + (key,)] = key_pos
+                idx = _WS.match(text, idx).end() + 1  # ':'
+                idx = walk(idx, path + (key,))
+                idx = _WS.match(text, idx).end()
+                if text[idx] == "}":
+                    return idx + 1
+                idx = _WS.match(text, idx + 1).end()  # ','
+        if char == "[":
+            idx = _WS.match(text, idx + 1).end()
+            if text[idx] == "]":
+                return idx + 1
+            i = 0
+            while True:
+                idx = walk(idx, path + (i,))
+                idx = _WS.match(text, idx).end()
+                if text[idx] == "]":
+                    return idx + 1
+                idx += 1
+                i += 1
+        _, end = decoder.raw_decode(text, idx)
+        return end
+
+    walk(0, ())
+    return positions
+
+
+def _line_col(text: str, offset: int) -> tuple[int, int]:
+    line = text.count("\n", 0, offset) + 1
+    col = offset - (text.rfind("\n", 0, offset) + 1) + 1
+    return line, col
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Compiler
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def compile_config(text: str, source: str = "config.json") -> AppConfig:
+    """Parse, validate and build an ``AppConfig`` from config.json text.
+
+    Raises ConfigError listing every problem with its line and column.
+    """
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ConfigError(source, [(e.lineno, e.colno, e.msg)]) from None
+
+    problems = validate(data, CONFIG_SCHEMA)
+    if not problems:
+        problems = _check_semantics(data)
+    if problems:
+        positions = _locate_paths(text)
+        errors = []
+        for path, message in problems:
+            # Fall back to the nearest ancestor that has a position
+            anchor = path
+            while anchor and anchor not in positions:
+                anchor = anchor[:-1]
+            line, col = _line_col(text, positions.get(anchor, 0))
+            errors.append((line, col, f"{_format_path(path)}: {message}"))
+        raise ConfigError(source, errors)
+
+    return _build_config(data)
+
+
+def _check_semantics(data: dict) -> list[tuple[JsonPath, str]]:
+    """Cross-field rules the schema cannot express."""
+    problems = []
+    for name, cmd in data.get("commands", {}).items():
+        path = ("commands", name)
+        if cmd["action"] == "run-script" and "script" not in cmd:
+            problems.append((path, "run-script needs a 'script'"))
+        if cmd["action"] == "run-command" and "command" not in cmd:
+            problems.append((path, "run-command needs a 'command'"))
+        if cmd["action"] == "run-pipeline":
+            if "pipeline" not in cmd:
+                problems.append((path, "run-pipeline needs a 'pipeline'"))
+            elif cmd["pipeline"] not in data.get("pipelines", {}):
+                problems.append((path + ("pipeline",), f"unknown pipeline {cmd['pipeline']!r}"))
+
+    hotkeys: dict[str, JsonPath] = {}
+    for ci, cat in enumerate(data["categories"]):
+        containers = [(("categories", ci), cat)] + [
+            (("categories", ci, "subcategories", si), sub)
+            for si, sub in enumerate(cat.get("subcategories", []))
+        ]
+        for base, container in containers:
+            for ti, tool in enumerate(container.get("tools", [])):
+                key = tool.get("hotkey", "").upper()
+                if not key:
+                    continue
+                path = base + ("tools", ti, "hotkey")
+                if key in hotkeys:
+                    problems.append((path, f"hotkey {key!r} is already used at "
+                                           f"{_format_path(hotkeys[key])}"))
+                else:
+                    hotkeys[key] = path
+
+    refs = _tool_refs(data)
+    for pipeline_id, pipeline in data.get("pipelines", {}).items():
+        problems += _check_pipeline(("pipelines", pipeline_id), pipeline, refs)
+    return problems
+
+
+def _tool_refs(data: dict) -> dict[str, str]:
+    """Map every tool id and tool name in ``data`` to the tool's id.
+
+    Assigns ids exactly as _build_config does, so pipelines can be checked
+    before the config is built. Ids win over names, as in ``mtcp run``.
+    """
+    taken: set[str] = set()
+    ids: list[str] = []
+    names: dict[str, str] = {}
+
+    def add(tools: list, parent_id: str) -> None:
+        for tool in tools:
+            tool_id = _unique_id(tool["name"], parent_id, taken)
+            ids.append(tool_id)
+            names.setdefault(tool["name"], tool_id)
+
+    for cat in data["categories"]:
+        cat_id = _unique_id(cat["name"], "", taken)
+        add(cat.get("tools", []), cat_id)
+        for sub in cat.get("subcategories", []):
+            add(sub.get("tools", []), _unique_id(sub["name"], cat_id, taken))
+    refs = dict(names)
+    refs.update((tool_id, tool_id) for tool_id in ids)
+    return refs
+
+
+def _pipeline_steps(steps: list[dict], refs: dict[str, str]) -> list[PipelineStep]:
+    """Resolve a pipeline's steps, filling in the defaults.
+
+    A step without an ``id`` is named after its tool; one without
+    ``after`` comes after the previous step, so a plain list runs in
+    order. Unknown tools resolve to an empty ``tool_id``.
+    """
+    resolved = []
+    for i, step in enumerate(steps):
+        tool_id = refs.get(step["tool"], "")
+        default_after = (resolved[-1].id,) if resolved else ()
+        resolved.append(PipelineStep(
+            id=step.get("id") or tool_id.rpartition("/")[2] or f"step-{i + 1}",
+            tool_id=tool_id,
+            after=tuple(step.get("after", default_after)),
+            when=step.get("when", "success"),
+            ok_codes=tuple(step.get("ok_codes", (0,))),
+            timeout=step.get("timeout"),
+        ))
+    return resolved
+
+
+def _check_pipeline(
+    base: JsonPath, pipeline: dict, refs: dict[str, str]
+) -> list[tuple[JsonPath, str]]:
+    """Tool references, step ids and the dependency graph of one pipeline."""
+    problems = []
+    steps = _pipeline_steps(pipeline["steps"], refs)
+    seen: set[str] = set()
+    for i, step in enumerate(steps):
+        path = base + ("steps", i)
+        if not step.tool_id:
+            problems.append((path + ("tool",), f"unknown tool {pipeline['steps'][i]['tool']!r}"))
+        if step.id in seen:
+            problems.append((path, f"step id {step.id!r} is used twice; give the step an 'id'"))
+        seen.add(step.id)
+        if step.when != "success" and not step.after:
+            problems.append((path + ("when",), f"'{step.when}' needs steps to come 'after'"))
+    for i, step in enumerate(steps):
+        for dep in step.after:
+            if dep not in seen:
+                problems.append((base + ("steps", i, "after"), f"unknown step {dep!r}"))
+    if problems:
+        return problems
+
+    # Depth-first search for a step that (indirectly) comes after itself
+    after = {step.id: step.after for step in steps}
+    state: dict[str, int] = {}  # 1 = on the current path, 2 = done
+
+    def visit(step_id: str) -> Optional[str]:
+        state[step_id] = 1
+        for dep in after[step_id]:
+            if state.get(dep) == 1:
+                return dep
+            if dep not in state:
+                found = visit(dep)
+                if found:
+                    return found
+        state[step_id] = 2
+        return None
+
+    for i, step in enumerate(steps):
+        if step.id not in state:
+            cycle = visit(step.id)
+            if cycle:
+                problems.append((base + ("steps", i, "after"),
+                                 f"steps depend on each other in a cycle (through {cycle!r})"))
+                break
+    return problems
+
+
+def _build_config(data: dict) -> AppConfig:
+    """Build an AppConfig from data that has passed validation."""
+    config = AppConfig()
+
+    meta = data["meta"]
+    config.version = meta["version"]
+    config.author = meta.get("author", config.author)
+
+    settings = data.get("settings", {})
+    config.max_concurrent_jobs = settings.get("max_concurrent_jobs", config.max_concurrent_jobs)
+    config.history_minutes = settings.get("history_minutes", config.history_minutes)
+    config.history_resolution = settings.get("history_resolution", config.history_resolution)
+    config.probe_targets = tuple(settings.get("probe_targets", config.probe_targets))
+    config.probe_timeout = settings.get("probe_timeout", config.probe_timeout)
+    config.probe_ttl = settings.get("probe_ttl", config.probe_ttl)
+    config.fleet_hosts = tuple(settings.get("fleet_hosts", config.fleet_hosts))
+    config.fleet_port = settings.get("fleet_port", config.fleet_port)
+    config.fleet_timeout = settings.get("fleet_timeout", config.fleet_timeout)
+    config.fleet_concurrency = settings.get("fleet_concurrency", config.fleet_concurrency)
+    config.fleet_token = settings.get("fleet_token", config.fleet_token)
+
+    taken: set[str] = set()
+
+    def make_tool(tool_data: dict, parent_id: str) -> Tool:
+        tool = Tool(
+            name=tool_data["name"],
+            description=tool_data.get("description", ""),
+            command=tool_data["command"],
+            hotkey=tool_data.get("hotkey", ""),
+            timeout=tool_data.get("timeout"),
+        )
+        tool.plan = plan_command(tool.command, tool.timeout)
+        tool.id = _unique_id(tool.name, parent_id, taken)
+        if tool.hotkey:
+            config.hotkey_map[tool.hotkey.upper()] = tool.command
+        return tool
+
+    for cat_data in data["categories"]:
+        category = Category(
+            name=cat_data["name"],
+            description=cat_data.get("description", ""),
+        )
+        category.id = _unique_id(category.name, "", taken)
+        category.tools = [make_tool(t, category.id) for t in cat_data.get("tools", [])]
+
+        for subcat_data in cat_data.get("subcategories", []):
+            subcat = Subcategory(name=subcat_data["name"])
+            subcat.id = _unique_id(subcat.name, category.id, taken)
+            subcat.tools = [make_tool(t, subcat.id) for t in subcat_data.get("tools", [])]
+            category.subcategories.append(subcat)
+
+        config.categories.append(category)
+
+    for cmd_name, cmd_data in data.get("commands", {}).items():
+        config.commands[cmd_name] = SlashCommand(
+            name=cmd_name,
+            description=cmd_data.get("description", ""),
+            action=cmd_data["action"],
+            script=cmd_data.get("script", ""),
+            command=cmd_data.get("command", ""),
+            pipeline=cmd_data.get("pipeline", ""),
+        )
+        if cmd_data["action"] == "run-command":
+            config.commands[cmd_name].plan = plan_command(cmd_data["command"])
+
+    config.build_index()
+
+    refs = {name: tool.id for name, tool in config.tools_by_name.items()}
+    refs.update((tool_id, tool_id) for tool_id in config.tools_by_id)
+    for pipeline_id, pipeline_data in data.get("pipelines", {}).items():
+        config.pipelines[pipeline_id] = Pipeline(
+            id=pipeline_id,
+            name=pipeline_data["name"],
+            description=pipeline_data.get("description", ""),
+            steps=_pipeline_steps(pipeline_data["steps"], refs),
+        )
+    return config
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Diffing (hot reload)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@dataclass
+class ConfigDiff:
+    """What changed between two compiled configs, by stable node id.
+
+    ``containers`` holds the ids of nodes whose list of children changed
+    (added, removed or reordered); ``""`` stands for the top level.
+    ``changed`` holds nodes that kept their place but whose own fields
+    (description, command, hotkey, ...) differ.
+    """
+    added: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    containers: set[str] = field(default_factory=set)
+    commands: set[str] = field(default_factory=set)
+    pipelines: set[str] = field(default_factory=set)
+    hotkeys_changed: bool = False
+    meta_changed: bool = False
+
+    @property
+    def empty(self) -> bool:
+        return not (
+            self.added or self.removed or self.changed or self.containers
+            or self.commands or self.pipelines or self.hotkeys_changed or self.meta_changed
+        )
+
+
+def _flatten(config: AppConfig) -> tuple[dict[str, tuple], dict[str, list[str]]]:
+    """Return ({node id: fields}, {container id: [child ids]})."""
+    nodes: dict[str, tuple] = {}
+    children: dict[str, list[str]] = {"": []}
+    for category in config.categories:
+        children[""].append(category.id)
+        nodes[category.id] = ("category", category.name, category.description)
+        children[category.id] = [t.id for t in category.tools] + [
+            s.id for s in category.subcategories
+        ]
+        for tool in category.tools:
+            nodes[tool.id] = _tool_fields(tool)
+        for sub in category.subcategories:
+            nodes[sub.id] = ("subcategory", sub.name)
+            children[sub.id] = [t.id for t in sub.tools]
+            for tool in sub.tools:
+                nodes[tool.id] = _tool_fields(tool)
+    return nodes, children
+
+
+def _tool_fields(tool: Tool) -> tuple:
+    return ("tool", tool.name, tool.description, tool.command, tool.hotkey, tool.timeout)
+
+
+def _meta_of(config: AppConfig) -> tuple:
+    return (
+        config.version,
+        config.author,
+        config.max_concurrent_jobs,
+        config.history_minutes,
+        config.history_resolution,
+        config.probe_targets,
+        config.probe_timeout,
+        config.probe_ttl,
+        config.fleet_hosts,
+        config.fleet_port,
+        config.fleet_timeout,
+        config.fleet_concurrency,
+        config.fleet_token,
+    )
+
+
+def diff_configs(old: AppConfig, new: AppConfig) -> ConfigDiff:
+    """Compare two configs so a reload can patch only what changed."""
+    diff = ConfigDiff()
+    old_nodes, old_children = _flatten(old)
+    new_nodes, new_children = _flatten(new)
+
+    diff.added = new_nodes.keys() - old_nodes.keys()
+    diff.removed = old_nodes.keys() - new_nodes.keys()
+    diff.changed = {
+        node_id for node_id in old_nodes.keys() & new_nodes.keys()
+        if old_nodes[node_id] != new_nodes[node_id]
+    }
+    diff.containers = {
+        node_id for node_id in old_children.keys() | new_children.keys()
+        if old_children.get(node_id) != new_children.get(node_id)
+    }
+    diff.commands = {
+        name for name in old.commands.keys() | new.commands.keys()
+        if old.commands.get(name) != new.commands.get(name)
+    }
+    diff.pipelines = {
+        pipeline_id for pipeline_id in old.pipelines.keys() | new.pipelines.keys()
+        if old.pipelines.get(pipeline_id) != new.pipelines.get(pipeline_id)
+    }
+    diff.hotkeys_changed = old.hotkey_map != new.hotkey_map
+    diff.meta_changed = _meta_of(old) != _meta_of(new)
+    return diff
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Compiled config cache
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Layout: magic, format version, the MTCP version that wrote it, source
+# size, sha256(source), then the pickled AppConfig. Bump the format
+# version whenever the dataclasses or the schema change between releases;
+# a new MTCP version invalidates the cache anyway.
+CONFIG_CACHE_FILE = "config.bin"
+CONFIG_CACHE_MAGIC = b"MTCPCFG\0"
+CONFIG_CACHE_VERSION = 8
+_CACHE_HEADER = struct.Struct("<8sH32sq32s")
+
+
+def _cache_header(raw: bytes) -> bytes:
+    return _CACHE_HEADER.pack(
+        CONFIG_CACHE_MAGIC,
+        CONFIG_CACHE_VERSION,
+        __version__.encode("utf-8"),
+        len(raw),
+        hashlib.sha256(raw).digest(),
+    )
+
+
+def _read_cache(cache_file: str, raw: bytes) -> Optional[AppConfig]:
+    """Return the cached config if it was compiled from exactly ``raw``.
+
+    The source's content hash is always checked: mtime cannot be trusted
+    on FAT32/exFAT sticks (2 s resolution), and hashing a config.json
+    costs far less than compiling it. Only a cache whose header matches
+    is unpickled.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            if f.read(_CACHE_HEADER.size) != _cache_header(raw):
+                return None
+            config = pickle.load(f)
+    except Exception:
+        return None
+    return config if isinstance(config, AppConfig) else None
+
+
+def _write_cache(cache_file: str, raw: bytes, config: AppConfig) -> None:
+    try:
+        write_atomic(cache_file, _cache_header(raw) + pickle.dumps(config, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        pass
+
+
+def load_config(config_path: str, use_cache: bool = True) -> AppConfig:
+    """Load config.json, using the compiled cache when it is current."""
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    with open(config_path, "rb") as f:
+        raw = f.read()
+    cache_file = cache_path(CONFIG_CACHE_FILE)
+    if use_cache:
+        config = _read_cache(cache_file, raw)
+        if config is not None:
+            return config
+
+    config = compile_config(raw.decode("utf-8-sig"), source=config_path)
+    if use_cache:
+        _write_cache(cache_file, raw, config)
+    return config
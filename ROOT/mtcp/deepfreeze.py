@@ -0,0 +1,161 @@
+"""Deep Freeze status, read once and shared.
+
+``DFC.exe get /ISFROZEN`` is slow to spawn and its answer only changes
+across a reboot, so a single ``DeepFreezeProvider`` caches it for ``ttl``
+seconds and everyone (the header, system info, the agent) asks the
+provider. ``refresh()`` re-reads just this one value, e.g. once the
+toggle script has finished, and subscribers are told when the state
+actually changes.
+
+The state is also exported to child processes as ``MTCP_DEEP_FREEZE``,
+with the Unix time it was read in ``MTCP_DEEP_FREEZE_AT``, so scripts
+launched from MTCP (Invoke-DelProf2.ps1) need not run DFC again. Such a
+script should only trust FROZEN or THAWED read within ``ENV_MAX_AGE``
+seconds and ask DFC itself otherwise; ``status(max_age=ENV_MAX_AGE)``
+before a launch keeps the exported state that fresh.
+
+Reading the state goes through a ``DeepFreezeBackend``. ``DfcBackend``
+runs DFC.exe; its path can be overridden with ``MTCP_DFC_PATH``, which
+is how a fake DFC (see benchmarks/fakes.py) is used on Linux.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+DEFAULT_DFC_PATH = r"C:\Windows\SysWOW64\DFC.exe"
+DEFAULT_DF_TTL = 300.0
+DFC_TIMEOUT = 5.0
+ENV_VAR = "MTCP_DEEP_FREEZE"
+ENV_TIME_VAR = "MTCP_DEEP_FREEZE_AT"
+# Keep in step with Invoke-DelProf2.ps1
+ENV_MAX_AGE = 60.0
+
+FROZEN = "FROZEN"
+THAWED = "THAWED"
+NOT_INSTALLED = "Not Installed"
+ERROR = "Error"
+
+_COLORS = {FROZEN: "cyan", THAWED: "red", NOT_INSTALLED: "grey"}
+
+
+@dataclass(frozen=True)
+class DeepFreezeStatus:
+    """One reading of the Deep Freeze state."""
+    state: str
+    checked_at: float = 0.0
+
+    @property
+    def color(self) -> str:
+        return _COLORS.get(self.state, "yellow")
+
+    @property
+    def fields(self) -> dict:
+        """The matching SystemInfo fields."""
+        return {"deep_freeze": self.state, "df_color": self.color}
+
+
+class DeepFreezeBackend:
+    """How the Deep Freeze state is read."""
+
+    def query(self) -> str:
+        """Return FROZEN, THAWED, NOT_INSTALLED or another status text."""
+        raise NotImplementedError
+
+
+class DfcBackend(DeepFreezeBackend):
+    """Asks ``DFC.exe get /ISFROZEN``: exit code 1 is frozen, 0 thawed."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.environ.get("MTCP_DFC_PATH") or DEFAULT_DFC_PATH
+
+    def query(self) -> str:
+        if not os.path.exists(self.path):
+            return NOT_INSTALLED
+        try:
+            result = subprocess.run(
+                [self.path, "get", "/ISFROZEN"],
+                capture_output=True, timeout=DFC_TIMEOUT
+            )
+        except Exception:
+            return ERROR
+        if result.returncode == 1:
+            return FROZEN
+        if result.returncode == 0:
+            return THAWED
+        return f"Unknown ({result.returncode})"
+
+
+class DeepFreezeProvider:
+    """The cached Deep Freeze state, refreshed on demand.
+
+    ``status()`` returns the cached reading while it is younger than
+    ``ttl`` (or ``max_age``, if given) and otherwise reads it again;
+    concurrent callers share one DFC run. Listeners added with
+    ``subscribe`` are called on the reading thread whenever the state
+    differs from the previous reading.
+    """
+
+    def __init__(self, backend: Optional[DeepFreezeBackend] = None, ttl: float = DEFAULT_DF_TTL) -> None:
+        self.backend = backend or DfcBackend()
+        self.ttl = ttl
+        self._status: Optional[DeepFreezeStatus] = None
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[DeepFreezeStatus], None]] = []
+
+    @property
+    def latest(self) -> Optional[DeepFreezeStatus]:
+        """The last reading, without querying (None before the first)."""
+        return self._status
+
+    def status(self, force: bool = False, max_age: Optional[float] = None) -> DeepFreezeStatus:
+        requested = time.time()
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            status = self._status
+            # A forced read is satisfied by one that started after it was asked for
+            fresh = status is not None and (
+                status.checked_at >= requested if force
+                else requested - status.checked_at < max_age
+            )
+            if fresh:
+                return status
+            started = time.time()
+            new = DeepFreezeStatus(self.backend.query(), checked_at=started)
+            self._status = new
+        os.environ[ENV_VAR] = new.state
+        os.environ[ENV_TIME_VAR] = str(int(new.checked_at))
+        if status is None or status.state != new.state:
+            for listener in list(self._listeners):
+                try:
+                    listener(new)
+                except Exception:
+                    pass
+        return new
+
+    def refresh(self) -> DeepFreezeStatus:
+        """Read the state again now, notifying listeners if it changed."""
+        return self.status(force=True)
+
+    def subscribe(self, listener: Callable[[DeepFreezeStatus], None]) -> Callable[[], None]:
+        """Call ``listener`` on every change; returns a function that stops it."""
+        self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+        return unsubscribe
+
+
+_provider: Optional[DeepFreezeProvider] = None
+
+
+def get_deep_freeze() -> DeepFreezeProvider:
+    """Return the provider shared by system info, the header and the agent."""
+    global _provider
+    if _provider is None:
+        _provider = DeepFreezeProvider()
+    return _provider
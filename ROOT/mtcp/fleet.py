@@ -0,0 +1,196 @@
+"""Fleet mode: gather SystemInfo from many lab machines at once.
+
+Each host runs an agent (``mtcp --headless agent``, see mtcp.agent) that
+serves its cached SystemInfo over TCP. ``query_fleet`` asks every host
+concurrently through a ``Transport``, at most ``concurrency`` at a time
+and each bounded by its own timeout, so one dead machine never holds up
+the rest.
+
+The transport is pluggable: ``AgentTransport`` speaks the agent protocol
+and keeps one connection per host open between refreshes; tests and
+benchmarks can pass any object with async ``fetch(host)`` and ``close()``.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from .agent import (
+    CODEC_JSON,
+    CODEC_MSGPACK,
+    DEFAULT_AGENT_PORT,
+    AgentError,
+    encode_frame,
+    info_from_dict,
+    local_codecs,
+    read_frame,
+)
+from .sysinfo import SystemInfo
+
+DEFAULT_FLEET_TIMEOUT = 5.0
+DEFAULT_FLEET_CONCURRENCY = 16
+
+
+@dataclass(frozen=True)
+class HostStatus:
+    """Outcome of querying one host."""
+    host: str
+    ok: bool
+    info: Optional[SystemInfo] = None
+    error: str = ""
+    latency_ms: Optional[float] = None
+    checked_at: float = 0.0
+
+
+def parse_host(text: str, default_port: int = DEFAULT_AGENT_PORT) -> tuple[str, int]:
+    """Split ``host``, ``host:port`` or ``[v6]:port`` into its parts."""
+    text = text.strip()
+    if text.startswith("["):
+        host, _, rest = text[1:].partition("]")
+        return host, int(rest[1:]) if rest.startswith(":") else default_port
+    host, sep, port = text.rpartition(":")
+    if sep and host and ":" not in host and port.isdigit():
+        return host, int(port)
+    return text, default_port
+
+
+# ── Transports ───────────────────────────────────────────────
+
+
+class Transport:
+    """How fleet queries reach a host."""
+
+    async def fetch(self, host: str) -> dict:
+        """Return the host's SystemInfo fields; raise on any failure."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release any connections held open."""
+
+
+class AgentTransport(Transport):
+    """Talks to ``mtcp --headless agent`` over TCP.
+
+    The connection to each host stays open for the next refresh; a stale
+    one (the agent restarted, the PC rebooted) is replaced once before
+    giving up. Connections belong to the event loop that opened them.
+    """
+
+    def __init__(self, port: int = DEFAULT_AGENT_PORT, token: str = "") -> None:
+        self.port = port
+        self.token = token
+        self._conns: dict[str, tuple[asyncio.StreamReader, asyncio.StreamWriter, bytes]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def fetch(self, host: str) -> dict:
+        async with self._locks.setdefault(host, asyncio.Lock()):
+            reused = host in self._conns
+            try:
+                return await self._request(host, {"op": "info"})
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self._drop(host)
+                if not reused:
+                    raise
+            except BaseException:
+                # Timed out or cancelled mid-request: the stream is unusable
+                self._drop(host)
+                raise
+            try:
+                return await self._request(host, {"op": "info"})
+            except BaseException:
+                self._drop(host)
+                raise
+
+    async def _connect(self, host: str) -> tuple:
+        name, port = parse_host(host, self.port)
+        reader, writer = await asyncio.open_connection(name, port)
+        hello = {"op": "hello", "codecs": local_codecs()}
+        if self.token:
+            hello["token"] = self.token
+        writer.write(encode_frame(hello))
+        await writer.drain()
+        hello = await read_frame(reader)
+        if not hello.get("ok"):
+            writer.close()
+            raise AgentError(hello.get("error") or "agent refused hello")
+        codec = CODEC_MSGPACK if hello.get("codec") == "msgpack" else CODEC_JSON
+        return reader, writer, codec
+
+    async def _request(self, host: str, request: dict) -> dict:
+        conn = self._conns.get(host)
+        if conn is None:
+            conn = self._conns[host] = await self._connect(host)
+        reader, writer, codec = conn
+        writer.write(encode_frame(request, codec))
+        await writer.drain()
+        response = await read_frame(reader)
+        if not response.get("ok"):
+            raise AgentError(response.get("error") or "agent error")
+        return response["info"]
+
+    def _drop(self, host: str) -> None:
+        conn = self._conns.pop(host, None)
+        if conn is not None:
+            conn[1].close()
+
+    async def close(self) -> None:
+        for host in list(self._conns):
+            self._drop(host)
+
+
+# ── Queries ──────────────────────────────────────────────────
+
+
+def _describe(error: BaseException) -> str:
+    if isinstance(error, asyncio.TimeoutError):
+        return "timed out"
+    if isinstance(error, ConnectionRefusedError):
+        return "no agent"
+    if isinstance(error, OSError) and error.strerror:
+        return error.strerror
+    return str(error) or type(error).__name__
+
+
+async def query_host(transport: Transport, host: str, timeout: float) -> HostStatus:
+    """Query one host, turning every failure into a HostStatus."""
+    start = time.perf_counter()
+    try:
+        data = await asyncio.wait_for(transport.fetch(host), timeout)
+        info = info_from_dict(data)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        return HostStatus(host=host, ok=False, error=_describe(e), checked_at=time.time())
+    return HostStatus(
+        host=host,
+        ok=True,
+        info=info,
+        latency_ms=(time.perf_counter() - start) * 1000,
+        checked_at=time.time(),
+    )
+
+
+async def query_fleet(
+    hosts: Iterable[str],
+    transport: Transport,
+    concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+    timeout: float = DEFAULT_FLEET_TIMEOUT,
+    on_result: Optional[Callable[[HostStatus], None]] = None,
+) -> list[HostStatus]:
+    """Query every host, at most ``concurrency`` at a time.
+
+    ``on_result`` is called as each host answers (or fails), so a UI can
+    fill in rows as they arrive. Returns the results in ``hosts`` order.
+    """
+    hosts = list(dict.fromkeys(hosts))
+    gate = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(host: str) -> HostStatus:
+        async with gate:
+            status = await query_host(transport, host, timeout)
+        if on_result is not None:
+            on_result(status)
+        return status
+
+    return list(await asyncio.gather(*(one(host) for host in hosts)))
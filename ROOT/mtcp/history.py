@@ -0,0 +1,164 @@
+"""Time-series history of live metrics for MTCP TUI."""
+
+import math
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+from .sysinfo import LiveMetrics
+
+# Series recorded from each LiveMetrics sample: name -> (label, unit)
+SERIES = {
+    "cpu": ("CPU", "%"),
+    "memory": ("RAM", "%"),
+    "disk": ("Disk", "%"),
+    "net_sent": ("Net ↑", "KB/s"),
+    "net_recv": ("Net ↓", "KB/s"),
+}
+
+DEFAULT_HISTORY_SECONDS = 600.0
+DEFAULT_HISTORY_RESOLUTION = 2.0
+
+
+@dataclass(frozen=True)
+class SeriesStats:
+    """Min/avg/max rollup of one series over a window."""
+    minimum: float = 0.0
+    average: float = 0.0
+    maximum: float = 0.0
+    peak_at: Optional[float] = None  # timestamp of the maximum
+    samples: int = 0
+
+
+def _values_of(metrics: LiveMetrics) -> tuple[float, ...]:
+    return (
+        metrics.cpu_percent,
+        metrics.memory_percent,
+        metrics.disk_percent,
+        metrics.net_sent_rate,
+        metrics.net_recv_rate,
+    )
+
+
+class MetricsHistory:
+    """Fixed-size ring buffers holding the last few minutes of metrics.
+
+    Each series is one ``array('d')`` of ``capacity`` slots plus a shared
+    array of bucket timestamps, so memory is a few kilobytes regardless of
+    uptime and nothing is allocated per sample. Samples are averaged into
+    buckets of ``resolution`` seconds; with a resolution equal to the
+    sampler interval every sample gets its own slot.
+
+    ``record`` is called from the sampler thread and the readers from the
+    UI thread, so access goes through a lock.
+    """
+
+    def __init__(
+        self,
+        duration: float = DEFAULT_HISTORY_SECONDS,
+        resolution: float = DEFAULT_HISTORY_RESOLUTION,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._allocate(duration, resolution)
+
+    def _allocate(self, duration: float, resolution: float) -> None:
+        self.duration = duration
+        self.resolution = max(0.1, resolution)
+        self.capacity = max(2, math.ceil(duration / self.resolution))
+        self._times = array("d", bytes(8 * self.capacity))
+        self._series = {
+            name: array("d", bytes(8 * self.capacity)) for name in SERIES
+        }
+        self._head = 0        # next slot to write
+        self._count = 0       # filled slots
+        self._bucket: Optional[int] = None
+        self._sums = [0.0] * len(SERIES)
+        self._samples = 0
+        self.version = 0      # bumped whenever a bucket is committed
+
+    def configure(self, duration: float, resolution: float) -> None:
+        """Change the window/resolution, keeping recent data if possible."""
+        with self._lock:
+            if (duration, resolution) == (self.duration, self.resolution):
+                return
+            keep_resolution = resolution == self.resolution
+            old = {name: self._ordered(values) for name, values in self._series.items()}
+            old_times = self._ordered(self._times)
+            self._allocate(duration, resolution)
+            if keep_resolution:
+                for i in range(max(0, len(old_times) - self.capacity), len(old_times)):
+                    self._commit(old_times[i], [old[name][i] for name in SERIES])
+
+    # ── Writing ──────────────────────────────────────────────
+
+    def record(self, metrics: LiveMetrics, timestamp: Optional[float] = None) -> None:
+        """Add one sample, closing the previous bucket if it has ended.
+
+        A bucket is committed when the first sample of the next one
+        arrives, so the newest slot always holds a complete average.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        bucket = int(timestamp // self.resolution)
+        values = _values_of(metrics)
+        with self._lock:
+            if self._bucket is not None and bucket != self._bucket and self._samples:
+                self._commit(
+                    self._bucket * self.resolution,
+                    [s / self._samples for s in self._sums],
+                )
+                self._sums = [0.0] * len(SERIES)
+                self._samples = 0
+            self._bucket = bucket
+            for i, value in enumerate(values):
+                self._sums[i] += value
+            self._samples += 1
+
+    def _commit(self, timestamp: float, values: list[float]) -> None:
+        head = self._head
+        self._times[head] = timestamp
+        for name, value in zip(SERIES, values):
+            self._series[name][head] = value
+        self._head = (head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.version += 1
+
+    # ── Reading ──────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _ordered(self, buffer: array, last: Optional[int] = None) -> list[float]:
+        """Oldest-first copy of the filled part of a ring buffer."""
+        count = self._count if last is None else min(last, self._count)
+        start = (self._head - count) % self.capacity
+        if start + count <= self.capacity:
+            return buffer[start:start + count].tolist()
+        return buffer[start:].tolist() + buffer[:self._head].tolist()
+
+    def values(self, name: str, last: Optional[int] = None) -> list[float]:
+        """Oldest-first values of a series (optionally only the newest ``last``)."""
+        with self._lock:
+            return self._ordered(self._series[name], last)
+
+    def timestamps(self, last: Optional[int] = None) -> list[float]:
+        with self._lock:
+            return self._ordered(self._times, last)
+
+    def stats(self, name: str, window: Optional[float] = None) -> SeriesStats:
+        """Min/avg/max of a series over the last ``window`` seconds (or all)."""
+        with self._lock:
+            last = None if window is None else max(1, math.ceil(window / self.resolution))
+            values = self._ordered(self._series[name], last)
+            times = self._ordered(self._times, last)
+        if not values:
+            return SeriesStats()
+        peak = max(range(len(values)), key=values.__getitem__)
+        return SeriesStats(
+            minimum=min(values),
+            average=sum(values) / len(values),
+            maximum=values[peak],
+            peak_at=times[peak],
+            samples=len(values),
+        )
@@ -0,0 +1,257 @@
+"""Background job tracking for tools launched from MTCP."""
+
+import itertools
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Sequence, Union
+
+from .tools import kill_process_tree, stream_command
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timed out"
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED, TIMED_OUT)
+
+DEFAULT_MAX_OUTPUT_LINES = 5000
+
+
+@dataclass
+class Job:
+    """A tool launch tracked by the JobManager.
+
+    ``command`` is a string for the shell or an argv list started
+    directly (see mtcp.launch).
+    ``output`` is a ring buffer of the last lines the tool printed;
+    ``total_lines`` counts every line ever received so listeners can tell
+    which lines they have already seen.
+    """
+    id: int
+    name: str
+    command: Union[str, Sequence[str]]
+    capture: bool = True
+    timeout: Optional[float] = 300
+    status: str = QUEUED
+    pid: Optional[int] = None
+    queued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    ended_at: Optional[float] = None
+    exit_code: Optional[int] = None
+    error: str = ""
+    output: deque = field(default_factory=lambda: deque(maxlen=DEFAULT_MAX_OUTPUT_LINES))
+    total_lines: int = 0
+    cancel_requested: bool = False
+    _proc: Optional[subprocess.Popen] = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent running (so far, if still running)."""
+        if self.started_at is None:
+            return 0.0
+        end = self.ended_at if self.ended_at is not None else time.time()
+        return end - self.started_at
+
+    def snapshot_output(self) -> tuple[list[str], int]:
+        """Return (buffered lines, total line count) consistently."""
+        with self._lock:
+            return list(self.output), self.total_lines
+
+
+# Called with (job, new_lines, index_of_first_new_line). new_lines is empty
+# for pure status changes. Listeners run on job threads.
+JobListener = Callable[[Job, list[str], int], None]
+
+
+class JobManager:
+    """Runs tool commands as tracked jobs with a concurrency limit.
+
+    Jobs beyond ``max_concurrent`` wait in a FIFO queue. Each running job
+    gets its own thread; output is streamed into the job's ring buffer and
+    fanned out to listeners (e.g. the jobs screen or an output tail).
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 2,
+        max_output_lines: int = DEFAULT_MAX_OUTPUT_LINES,
+    ) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_output_lines = max_output_lines
+        self._jobs: dict[int, Job] = {}
+        self._queue: deque[Job] = deque()
+        self._running = 0
+        self._ids = itertools.count(1)
+        self._listeners: list[JobListener] = []
+        self._lock = threading.Lock()
+
+    # ── Queries ──────────────────────────────────────────────
+
+    def jobs(self) -> list[Job]:
+        """All jobs, newest first."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: j.id, reverse=True)
+
+    def get(self, job_id: int) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    @property
+    def active_count(self) -> int:
+        with self._lock:
+            return sum(1 for j in self._jobs.values() if j.is_active)
+
+    # ── Listeners ────────────────────────────────────────────
+
+    def add_listener(self, listener: JobListener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: JobListener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, job: Job, lines: list[str], first_index: int) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(job, lines, first_index)
+            except Exception:
+                pass
+
+    # ── Control ──────────────────────────────────────────────
+
+    def submit(
+        self,
+        name: str,
+        command: Union[str, Sequence[str]],
+        capture: bool = True,
+        timeout: Optional[float] = 300,
+    ) -> Job:
+        """Queue a command; it starts as soon as a slot is free.
+
+        With ``capture`` the output is streamed into the job; otherwise the
+        command gets its own console window (interactive scripts) and only
+        its lifetime and exit code are tracked.
+        """
+        with self._lock:
+            job = Job(
+                id=next(self._ids),
+                name=name,
+                command=command,
+                capture=capture,
+                timeout=timeout,
+                output=deque(maxlen=self.max_output_lines),
+            )
+            self._jobs[job.id] = job
+            self._queue.append(job)
+        self._notify(job, [], job.total_lines)
+        self._dispatch()
+        return job
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a queued job or kill a running one (and its children)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.is_active:
+                return False
+            job.cancel_requested = True
+            if job.status == QUEUED:
+                self._queue.remove(job)
+                job.status = CANCELLED
+                job.ended_at = time.time()
+                proc = None
+            else:
+                proc = job._proc
+        if proc is not None:
+            kill_process_tree(proc)
+        else:
+            self._notify(job, [], job.total_lines)
+        return True
+
+    def clear_finished(self) -> None:
+        """Forget jobs that are no longer running."""
+        with self._lock:
+            self._jobs = {i: j for i, j in self._jobs.items() if j.is_active}
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while there are free slots."""
+        to_start = []
+        with self._lock:
+            while self._queue and self._running < self.max_concurrent:
+                job = self._queue.popleft()
+                job.status = RUNNING
+                job.started_at = time.time()
+                self._running += 1
+                to_start.append(job)
+        for job in to_start:
+            threading.Thread(
+                target=self._run_job, args=(job,), name=f"mtcp-job-{job.id}", daemon=True
+            ).start()
+
+    def _run_job(self, job: Job) -> None:
+        self._notify(job, [], job.total_lines)
+        try:
+            if job.capture:
+                job.exit_code = stream_command(
+                    job.command,
+                    lambda lines: self._append_output(job, lines),
+                    timeout=job.timeout,
+                    on_start=lambda proc: self._attach(job, proc),
+                )
+            else:
+                proc = subprocess.Popen(
+                    job.command,
+                    shell=isinstance(job.command, str),
+                    creationflags=getattr(subprocess, "CREATE_NEW_CONSOLE", 0),
+                )
+                self._attach(job, proc)
+                job.exit_code = proc.wait(timeout=job.timeout)
+            if job.cancel_requested:
+                job.status = CANCELLED
+            elif job.exit_code == 0:
+                job.status = COMPLETED
+            else:
+                job.status = FAILED
+        except subprocess.TimeoutExpired:
+            if job._proc is not None:
+                kill_process_tree(job._proc)
+            job.status = TIMED_OUT
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+        finally:
+            job.ended_at = time.time()
+            job._proc = None
+            with self._lock:
+                self._running -= 1
+            self._notify(job, [], job.total_lines)
+            self._dispatch()
+
+    def _attach(self, job: Job, proc: subprocess.Popen) -> None:
+        job._proc = proc
+        job.pid = proc.pid
+        self._notify(job, [], job.total_lines)
+        if job.cancel_requested:
+            kill_process_tree(proc)
+
+    def _append_output(self, job: Job, lines: list[str]) -> None:
+        with job._lock:
+            first_index = job.total_lines
+            job.output.extend(lines)
+            job.total_lines += len(lines)
+        self._notify(job, lines, first_index)
+
@@ -0,0 +1,185 @@
+"""Launch plans: how each tool command is started, decided up front.
+
+``plan_command`` parses a config.json command once, when the config is
+compiled, into a ``LaunchPlan``:
+
+- ``argv``: the program and its arguments, started directly. Empty when
+  the command needs a shell (``&``, pipes, redirection, variables or a
+  cmd built-in such as ``pause``), which then runs it as before.
+- ``mode``: ``gui`` for programs with a window of their own (.msc
+  snap-ins, bare ``.exe`` launchers), started detached from the menu;
+  ``console`` for interactive scripts, which get a console window and
+  are tracked without capturing output; ``capture`` for the rest, whose
+  output is streamed into a job.
+- ``timeout``: seconds before a tracked launch is killed (None: never).
+
+Starting programs directly skips the cmd.exe hop ``shell=True`` costs on
+every launch, and quoting is worked out once, here. Nothing in the
+parser is Windows-only: on Linux the same rules turn POSIX commands into
+plans (``sh`` stands in for cmd.exe), which is how the benchmarks
+exercise them.
+"""
+
+import os
+import subprocess
+from dataclasses import dataclass
+from typing import Optional, Union
+
+SCRIPT_ROOT = "$PSScriptRoot"
+DEFAULT_TIMEOUT = 300.0
+
+# Launch modes
+CAPTURE = "capture"
+CONSOLE = "console"
+GUI = "gui"
+
+# Characters cmd.exe or sh give a meaning of their own
+_SHELL_CHARS = frozenset("&|<>^%;$`(){}*?\n")
+
+# cmd.exe and sh built-ins: there is no program to start directly
+_SHELL_BUILTINS = frozenset({
+    "assoc", "call", "cd", "chdir", "cls", "copy", "date", "del", "dir",
+    "echo", "erase", "exit", "export", "ftype", "md", "mkdir", "mklink",
+    "move", "path", "pause", "popd", "pushd", "rd", "ren", "rename",
+    "rmdir", "set", "source", "start", "time", "title", "type", "ver", "vol",
+})
+
+_POWERSHELL = frozenset({"powershell", "powershell.exe", "pwsh", "pwsh.exe"})
+_POWERSHELL_SCRIPT = ("powershell", "-NoProfile", "-ExecutionPolicy", "Bypass")
+
+# Launchers that open a window even when given arguments
+GUI_PROGRAMS = frozenset({
+    "taskmgr.exe", "msinfo32.exe", "dfrgui.exe", "cleanmgr.exe", "mdsched.exe", "mmc.exe",
+})
+
+
+@dataclass(frozen=True)
+class LaunchPlan:
+    """How to start one tool command.
+
+    ``$PSScriptRoot`` stays in ``command`` and ``argv`` until launch,
+    since where MTCP runs from is only known then.
+    """
+    command: str
+    argv: tuple[str, ...] = ()
+    mode: str = CAPTURE
+    timeout: Optional[float] = DEFAULT_TIMEOUT
+
+    @property
+    def shell(self) -> bool:
+        """Whether the command has to go through cmd.exe / sh."""
+        return not self.argv
+
+    @property
+    def capture(self) -> bool:
+        return self.mode == CAPTURE
+
+    @property
+    def needs_console(self) -> bool:
+        return self.mode == CONSOLE
+
+    @property
+    def gui(self) -> bool:
+        return self.mode == GUI
+
+    def args(self, script_root: str) -> Union[str, list[str]]:
+        """What to hand to Popen: an argv list, or a string for the shell."""
+        if self.argv:
+            return [arg.replace(SCRIPT_ROOT, script_root) for arg in self.argv]
+        return self.command.replace(SCRIPT_ROOT, script_root)
+
+
+def split_command(command: str) -> Optional[list[str]]:
+    """Split a command line the way Windows programs split theirs.
+
+    Whitespace separates arguments except inside double quotes, which are
+    dropped. Returns None when the line cannot be split safely (an
+    unclosed quote, or single quotes, which only sh would honour).
+    """
+    args: list[str] = []
+    current: list[str] = []
+    quoted = False
+    pending = False
+    for char in command:
+        if char == '"':
+            quoted = not quoted
+            pending = True
+        elif char == "'" and not quoted:
+            return None
+        elif char in " \t" and not quoted:
+            if pending:
+                args.append("".join(current))
+                current = []
+                pending = False
+        else:
+            current.append(char)
+            pending = True
+    if quoted:
+        return None
+    if pending:
+        args.append("".join(current))
+    return args
+
+
+def _program(arg: str) -> str:
+    """The lower-case file name of a program path (Windows or POSIX)."""
+    return os.path.basename(arg.replace("\\", "/")).lower()
+
+
+def plan_command(command: str, timeout: Optional[float] = None) -> LaunchPlan:
+    """Work out how to launch ``command``.
+
+    ``timeout`` overrides the default for the plan's mode (0 means no
+    limit). Interactive and GUI launches wait on the user, so by default
+    only captured ones time out.
+    """
+    text = command.strip()
+    argv = None
+    if text.startswith("&"):
+        # A PowerShell call expression ("& '...\\Script.ps1'")
+        argv = [*_POWERSHELL_SCRIPT, "-Command", text]
+    elif not _SHELL_CHARS & set(text.replace(SCRIPT_ROOT, "")):
+        argv = split_command(text)
+        if argv and _program(argv[0]) in _SHELL_BUILTINS:
+            argv = None
+
+    if not argv:
+        argv = []
+        lowered = text.lower()
+        console = "powershell" in lowered or "-File" in text
+        gui = lowered.endswith((".msc", ".exe")) or lowered in GUI_PROGRAMS
+        mode = CONSOLE if console else GUI if gui else CAPTURE
+    else:
+        program = _program(argv[0])
+        if program.endswith(".ps1"):
+            argv = [*_POWERSHELL_SCRIPT, "-File", *argv]
+            program = "powershell"
+        if program.endswith(".msc"):
+            argv = ["mmc", *argv]
+            mode = GUI
+        elif program in _POWERSHELL or "-File" in argv:
+            mode = CONSOLE
+        elif program in GUI_PROGRAMS or (len(argv) == 1 and program.endswith(".exe")):
+            mode = GUI
+        else:
+            mode = CAPTURE
+
+    if timeout is None:
+        timeout = DEFAULT_TIMEOUT if mode == CAPTURE else None
+    return LaunchPlan(command=text, argv=tuple(argv), mode=mode, timeout=timeout or None)
+
+
+def popen(plan: LaunchPlan, script_root: str, **kwargs) -> subprocess.Popen:
+    """Start a plan, directly or through the shell as it requires."""
+    args = plan.args(script_root)
+    return subprocess.Popen(args, shell=isinstance(args, str), **kwargs)
+
+
+def start_detached(plan: LaunchPlan, script_root: str) -> subprocess.Popen:
+    """Start a plan without waiting for it.
+
+    GUI programs open their own window; anything else gets a new console
+    so its output and prompts stay visible.
+    """
+    flags = 0 if plan.gui else getattr(subprocess, "CREATE_NEW_CONSOLE", 0)
+    return popen(plan, script_root, creationflags=flags)
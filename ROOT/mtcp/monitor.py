@@ -0,0 +1,213 @@
+"""Per-core, per-disk and per-NIC metrics for the expanded monitor."""
+
+import time
+from array import array
+from dataclasses import dataclass
+from operator import sub
+from typing import Optional, Sequence
+
+
+@dataclass(frozen=True)
+class DiskRates:
+    """I/O rates of one physical disk."""
+    name: str
+    read_bps: float = 0.0
+    write_bps: float = 0.0
+    read_iops: float = 0.0
+    write_iops: float = 0.0
+    busy_percent: float = 0.0
+
+
+@dataclass(frozen=True)
+class NicRates:
+    """Throughput of one network adapter."""
+    name: str
+    sent_bps: float = 0.0
+    recv_bps: float = 0.0
+    errors_ps: float = 0.0
+    drops_ps: float = 0.0
+    is_up: bool = False
+    speed_mbps: int = 0
+
+    @property
+    def utilization(self) -> Optional[float]:
+        """Busiest direction as a percentage of link speed, if known."""
+        if not self.speed_mbps:
+            return None
+        busiest = max(self.sent_bps, self.recv_bps) * 8
+        return min(100.0, busiest / (self.speed_mbps * 1_000_000) * 100)
+
+
+@dataclass(frozen=True)
+class VolumeUsage:
+    """Space used on one mounted volume."""
+    mountpoint: str
+    percent: float = 0.0
+    used_gb: float = 0.0
+    total_gb: float = 0.0
+
+
+@dataclass(frozen=True)
+class DetailedMetrics:
+    """One snapshot of the expanded monitor. Rates are per second."""
+    per_cpu: tuple[float, ...] = ()
+    disks: tuple[DiskRates, ...] = ()
+    nics: tuple[NicRates, ...] = ()
+    volumes: tuple[VolumeUsage, ...] = ()
+    timestamp: float = 0.0
+
+
+class CounterDeltas:
+    """Turns monotonically increasing counters into per-second rates.
+
+    Counters for every device are laid out in one flat ``array('d')``
+    (``fields`` values per device). Each update subtracts the previous
+    array in a single pass instead of looping over per-device objects.
+    If the set of devices changes (a USB disk or VPN adapter appears)
+    the previous sample no longer lines up and that tick reports zeros.
+    """
+
+    def __init__(self, fields: int) -> None:
+        self.fields = fields
+        self._names: tuple[str, ...] = ()
+        self._values = array("d")
+        self._time: Optional[float] = None
+
+    def update(
+        self, names: Sequence[str], values: array, now: float
+    ) -> array:
+        """Return the rate of each counter since the previous update."""
+        names = tuple(names)
+        prev_time, prev_names, prev_values = self._time, self._names, self._values
+        self._names, self._values, self._time = names, values, now
+
+        elapsed = now - prev_time if prev_time is not None else 0.0
+        if names != prev_names or elapsed <= 0:
+            return array("d", bytes(8 * len(values)))
+        scale = 1.0 / elapsed
+        # Counters can go backwards after a driver reset; clamp at zero
+        return array(
+            "d", (d * scale if d > 0 else 0.0 for d in map(sub, values, prev_values))
+        )
+
+
+class DetailedCollector:
+    """Samples per-CPU, per-disk and per-NIC counters with psutil."""
+
+    DISK_FIELDS = ("read_bytes", "write_bytes", "read_count", "write_count", "busy_ms")
+    NIC_FIELDS = ("bytes_sent", "bytes_recv", "errors", "drops")
+
+    VOLUME_REFRESH = 30.0  # seconds between disk_partitions() calls
+
+    def __init__(self) -> None:
+        self._disks = CounterDeltas(len(self.DISK_FIELDS))
+        self._nics = CounterDeltas(len(self.NIC_FIELDS))
+        self._mountpoints: list[str] = []
+        self._mountpoints_at = float("-inf")
+
+    def sample(self) -> DetailedMetrics:
+        try:
+            import psutil
+        except ImportError:
+            return DetailedMetrics()
+
+        now = time.monotonic()
+        try:
+            per_cpu = tuple(psutil.cpu_percent(interval=None, percpu=True))
+        except Exception:
+            per_cpu = ()
+        return DetailedMetrics(
+            per_cpu=per_cpu,
+            disks=self._sample_disks(psutil, now),
+            nics=self._sample_nics(psutil, now),
+            volumes=self._sample_volumes(psutil, now),
+            timestamp=time.time(),
+        )
+
+    def _sample_volumes(self, psutil, now: float) -> tuple[VolumeUsage, ...]:
+        if now - self._mountpoints_at > self.VOLUME_REFRESH:
+            try:
+                self._mountpoints = [
+                    p.mountpoint for p in psutil.disk_partitions(all=False)
+                    if "cdrom" not in p.opts
+                ]
+            except Exception:
+                self._mountpoints = []
+            self._mountpoints_at = now
+        volumes = []
+        for mountpoint in self._mountpoints:
+            try:
+                usage = psutil.disk_usage(mountpoint)
+            except Exception:
+                continue
+            volumes.append(VolumeUsage(
+                mountpoint=mountpoint,
+                percent=usage.percent,
+                used_gb=round(usage.used / (1024**3), 1),
+                total_gb=round(usage.total / (1024**3), 1),
+            ))
+        return tuple(volumes)
+
+    def _sample_disks(self, psutil, now: float) -> tuple[DiskRates, ...]:
+        try:
+            counters = psutil.disk_io_counters(perdisk=True) or {}
+        except Exception:
+            return ()
+        names = sorted(counters)
+        values = array("d")
+        for name in names:
+            c = counters[name]
+            # busy_time is Linux-only; elsewhere read+write time is the
+            # closest thing (it can exceed wall time with queued I/O)
+            busy = getattr(c, "busy_time", None)
+            if busy is None:
+                busy = c.read_time + c.write_time
+            values.extend((c.read_bytes, c.write_bytes, c.read_count, c.write_count, busy))
+        rates = self._disks.update(names, values, now)
+
+        n = self._disks.fields
+        return tuple(
+            DiskRates(
+                name=name,
+                read_bps=rates[i * n],
+                write_bps=rates[i * n + 1],
+                read_iops=rates[i * n + 2],
+                write_iops=rates[i * n + 3],
+                # busy ms per second -> percent of the interval
+                busy_percent=min(100.0, rates[i * n + 4] / 10),
+            )
+            for i, name in enumerate(names)
+        )
+
+    def _sample_nics(self, psutil, now: float) -> tuple[NicRates, ...]:
+        try:
+            counters = psutil.net_io_counters(pernic=True) or {}
+            stats = psutil.net_if_stats()
+        except Exception:
+            return ()
+        names = sorted(counters)
+        values = array("d")
+        for name in names:
+            c = counters[name]
+            values.extend((
+                c.bytes_sent,
+                c.bytes_recv,
+                c.errin + c.errout,
+                c.dropin + c.dropout,
+            ))
+        rates = self._nics.update(names, values, now)
+
+        n = self._nics.fields
+        nics = []
+        for i, name in enumerate(names):
+            st = stats.get(name)
+            nics.append(NicRates(
+                name=name,
+                sent_bps=rates[i * n],
+                recv_bps=rates[i * n + 1],
+                errors_ps=rates[i * n + 2],
+                drops_ps=rates[i * n + 3],
+                is_up=bool(st and st.isup),
+                speed_mbps=st.speed if st else 0,
+            ))
+        return tuple(nics)
@@ -0,0 +1,261 @@
+"""Network adapter inventory for MTCP TUI."""
+
+import os
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+WIFI = "WiFi"
+ETHERNET = "Ethernet"
+BLUETOOTH = "Bluetooth"
+LOOPBACK = "Loopback"
+VIRTUAL = "Virtual"
+OTHER = "Other"
+
+# Matched against the lowercased adapter name and description, first hit
+# wins. Virtual comes before Ethernet so "vEthernet (Default Switch)" and
+# "Hyper-V Virtual Ethernet Adapter" are not counted as a real link.
+_LINK_KEYWORDS = (
+    (LOOPBACK, ("loopback",)),
+    (BLUETOOTH, ("bluetooth",)),
+    (VIRTUAL, (
+        "virtual", "vethernet", "vmware", "virtualbox", "hyper-v", "tap-",
+        "tunnel", "vpn", "wan miniport", "local area connection*",
+        "docker", "veth", "virbr", "br-", "tun", "wg",
+    )),
+    (WIFI, ("wi-fi", "wifi", "wireless", "802.11", "wlan")),
+    (ETHERNET, ("ethernet", "gigabit", "lan", "realtek pcie gbe")),
+)
+
+# Kernel-style interface name prefixes (Linux, and psutil's names there)
+_NAME_PREFIXES = (
+    (LOOPBACK, ("lo",)),
+    (WIFI, ("wl",)),
+    (ETHERNET, ("en", "eth", "em")),
+)
+
+
+@dataclass(frozen=True)
+class Adapter:
+    """One network interface as seen by the OS."""
+    name: str
+    link_type: str = OTHER
+    description: str = ""
+    is_up: bool = False
+    speed_mbps: int = 0
+    mtu: int = 0
+    mac: str = ""
+    ipv4: tuple[str, ...] = ()
+    ipv6: tuple[str, ...] = ()
+
+    @property
+    def is_physical(self) -> bool:
+        return self.link_type in (WIFI, ETHERNET)
+
+
+def classify(name: str, description: str = "") -> str:
+    """Guess the link type of an adapter from its name and description."""
+    text = f"{name} {description}".lower()
+    for link_type, words in _LINK_KEYWORDS:
+        if any(w in text for w in words):
+            return link_type
+    lowered = name.lower()
+    for link_type, prefixes in _NAME_PREFIXES:
+        if lowered.startswith(prefixes):
+            return link_type
+    return OTHER
+
+
+# ── Platform enrichment ──────────────────────────────────────
+# psutil only knows interface names. These optional layers add the
+# hardware description and an authoritative link type where the OS can
+# tell us without spawning a process. Each returns
+# {name: (description, link_type or "")} and may raise; failures just
+# mean the keyword guess in classify() is used.
+
+_WIN_NET_CLASS = "{4D36E972-E325-11CE-BFC1-08002BE10318}"
+# IANA ifType values stored by NDIS drivers as *IfType
+_WIN_IF_TYPES = {6: ETHERNET, 71: WIFI, 24: LOOPBACK, 131: VIRTUAL}
+
+
+def _enrich_windows(names: set[str]) -> dict[str, tuple[str, str]]:
+    import winreg
+
+    found: dict[str, tuple[str, str]] = {}
+    class_path = rf"SYSTEM\CurrentControlSet\Control\Class\{_WIN_NET_CLASS}"
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, class_path) as class_key:
+        for i in range(winreg.QueryInfoKey(class_key)[0]):
+            sub = winreg.EnumKey(class_key, i)
+            try:
+                with winreg.OpenKey(class_key, sub) as key:
+                    guid = winreg.QueryValueEx(key, "NetCfgInstanceId")[0]
+                    desc = winreg.QueryValueEx(key, "DriverDesc")[0]
+                    try:
+                        if_type = int(winreg.QueryValueEx(key, "*IfType")[0])
+                    except OSError:
+                        if_type = 0
+                conn_path = (
+                    rf"SYSTEM\CurrentControlSet\Control\Network\{_WIN_NET_CLASS}"
+                    rf"\{guid}\Connection"
+                )
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, conn_path) as key:
+                    name = winreg.QueryValueEx(key, "Name")[0]
+            except OSError:
+                continue
+            if name in names:
+                link_type = _WIN_IF_TYPES.get(if_type, "")
+                # Hyper-V and VPN adapters report ifType 6 as well
+                guess = classify("", desc)
+                if guess in (VIRTUAL, BLUETOOTH):
+                    link_type = guess
+                found[name] = (desc, link_type)
+    return found
+
+
+def _enrich_linux(names: set[str]) -> dict[str, tuple[str, str]]:
+    found: dict[str, tuple[str, str]] = {}
+    for name in names:
+        base = os.path.join("/sys/class/net", name)
+        if not os.path.isdir(base):
+            continue
+        device = os.path.join(base, "device")
+        driver = os.path.join(device, "driver")
+        desc = os.path.basename(os.path.realpath(driver)) if os.path.exists(driver) else ""
+        if os.path.isdir(os.path.join(base, "wireless")):
+            link_type = WIFI
+        elif not os.path.exists(device):
+            # No backing device: loopback, bridges, veth pairs, tunnels
+            link_type = LOOPBACK if name == "lo" else VIRTUAL
+        else:
+            link_type = ETHERNET
+        found[name] = (desc, link_type)
+    return found
+
+
+_ENRICHERS: dict[str, Callable[[set[str]], dict[str, tuple[str, str]]]] = {
+    "win32": _enrich_windows,
+    "linux": _enrich_linux,
+}
+
+
+class NetworkInventory:
+    """Keeps a table of adapters built from psutil.
+
+    ``refresh`` reads ``net_if_stats()`` and ``net_if_addrs()`` (cheap,
+    in-process calls) and only rebuilds the adapters whose raw entries
+    changed; ``version`` is bumped when anything did, so readers can skip
+    redrawing. The platform enrichment runs only when names appear that
+    it has not seen yet.
+    """
+
+    def __init__(self, enricher: Optional[Callable] = None) -> None:
+        self._enricher = enricher if enricher is not None else _ENRICHERS.get(sys.platform)
+        self._raw: dict[str, tuple] = {}
+        self._adapters: dict[str, Adapter] = {}
+        self._enriched: dict[str, tuple[str, str]] = {}
+        self._refreshed_at = float("-inf")
+        self._lock = threading.Lock()
+        self.version = 0
+
+    @property
+    def adapters(self) -> tuple[Adapter, ...]:
+        return tuple(self._adapters.values())
+
+    def refresh(self, max_age: float = 0.0) -> bool:
+        """Re-read the adapters unless the last read is under ``max_age`` old.
+
+        Returns True if any adapter appeared, disappeared or changed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._refreshed_at < max_age:
+                return False
+            self._refreshed_at = now
+            try:
+                import psutil
+                stats = psutil.net_if_stats()
+                addrs = psutil.net_if_addrs()
+            except Exception:
+                return False
+            return self._update(psutil, stats, addrs)
+
+    def _update(self, psutil, stats: dict, addrs: dict) -> bool:
+        raw = {
+            name: (stats.get(name), tuple(addrs.get(name, ())))
+            for name in stats.keys() | addrs.keys()
+        }
+        changed = {n for n in raw if raw[n] != self._raw.get(n)}
+        removed = self._raw.keys() - raw.keys()
+        if not changed and not removed:
+            return False
+
+        new_names = changed - self._enriched.keys()
+        if new_names and self._enricher is not None:
+            try:
+                self._enriched.update(self._enricher(new_names))
+            except Exception:
+                pass
+        # Don't ask again for names the enricher could not place
+        for name in new_names:
+            self._enriched.setdefault(name, ("", ""))
+
+        # Readers on other threads may be iterating the old table, so
+        # build a new one and swap it in
+        adapters = {n: a for n, a in self._adapters.items() if n not in removed}
+        for name in changed:
+            adapters[name] = self._build(psutil, name, *raw[name])
+        self._adapters = dict(sorted(adapters.items()))
+        self._raw = raw
+        self.version += 1
+        return True
+
+    def _build(self, psutil, name: str, st, addrs: tuple) -> Adapter:
+        desc, link_type = self._enriched.get(name, ("", ""))
+        ipv4, ipv6, mac = [], [], ""
+        for addr in addrs:
+            if addr.family == socket.AF_INET:
+                ipv4.append(addr.address)
+            elif addr.family == socket.AF_INET6:
+                ipv6.append(addr.address.split("%", 1)[0])
+            elif addr.family == psutil.AF_LINK:
+                mac = addr.address.replace("-", ":").upper()
+        return Adapter(
+            name=name,
+            link_type=link_type or classify(name, desc),
+            description=desc,
+            is_up=bool(st and st.isup),
+            speed_mbps=st.speed if st else 0,
+            mtu=st.mtu if st else 0,
+            mac=mac,
+            ipv4=tuple(ipv4),
+            ipv6=tuple(ipv6),
+        )
+
+    def connection_type(self) -> str:
+        """Link types of the active physical adapters, e.g. "WiFi + Ethernet"."""
+        types: list[str] = []
+        for adapter in self._adapters.values():
+            if adapter.is_up and adapter.is_physical and adapter.link_type not in types:
+                types.append(adapter.link_type)
+        return " + ".join(types)
+
+    def primary_ipv4(self) -> str:
+        """First IPv4 address of an active physical adapter, if any."""
+        for adapter in self._adapters.values():
+            if adapter.is_up and adapter.is_physical and adapter.ipv4:
+                return adapter.ipv4[0]
+        return ""
+
+
+_inventory: Optional[NetworkInventory] = None
+
+
+def get_network_inventory() -> NetworkInventory:
+    """Return the inventory shared by the header and the live panel."""
+    global _inventory
+    if _inventory is None:
+        _inventory = NetworkInventory()
+    return _inventory
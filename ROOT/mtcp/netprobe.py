@@ -0,0 +1,196 @@
+"""Internet connectivity probing for MTCP TUI."""
+
+import asyncio
+import ipaddress
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+# host:port pairs tried in parallel; any one answering means "online".
+# IP literals come first so a broken DNS server does not read as offline.
+DEFAULT_PROBE_TARGETS = ("1.1.1.1:443", "8.8.8.8:53", "www.google.com:443")
+DEFAULT_PROBE_TIMEOUT = 1.0  # seconds, per target
+DEFAULT_PROBE_TTL = 10.0  # seconds an online result is trusted
+MIN_OFFLINE_RETRY = 2.0
+MAX_OFFLINE_RETRY = 60.0
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of one round of probes."""
+    online: bool = False
+    local_ip: str = ""  # address of the interface the probe went out on
+    target: str = ""  # first target that answered
+    latency_ms: float = 0.0
+    checked_at: float = 0.0
+
+
+def parse_target(target: str) -> tuple[str, int]:
+    """Split ``host:port`` (or ``[v6]:port``) into its parts."""
+    host, sep, port = target.rpartition(":")
+    if not sep or not host:
+        raise ValueError(f"expected host:port, got {target!r}")
+    return host.strip("[]"), int(port)
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class ConnectivityProbe:
+    """Decides whether the machine is online, cheaply and without blocking.
+
+    Each refresh opens a TCP connection to every target at once on a
+    short-lived asyncio loop, each bounded by its own ``timeout``, and
+    stops at the first one that answers. Every socket is closed again and
+    no process-wide socket defaults are touched.
+
+    Results are cached: an online answer for ``ttl`` seconds, an offline
+    one for a retry delay that doubles on each consecutive failure (up to
+    ``max_retry``) so a machine without a network is not hammered with
+    connection attempts. Concurrent callers share one in-flight probe.
+    """
+
+    def __init__(
+        self,
+        targets: tuple[str, ...] = DEFAULT_PROBE_TARGETS,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        ttl: float = DEFAULT_PROBE_TTL,
+        min_retry: float = MIN_OFFLINE_RETRY,
+        max_retry: float = MAX_OFFLINE_RETRY,
+    ) -> None:
+        self.targets = tuple(targets)
+        self.timeout = timeout
+        self.ttl = ttl
+        self.min_retry = min_retry
+        self.max_retry = max_retry
+        self._result: Optional[ProbeResult] = None
+        self._expires = 0.0
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def latest(self) -> Optional[ProbeResult]:
+        """The cached result, however stale, or None before the first probe."""
+        return self._result
+
+    def configure(
+        self,
+        targets: Optional[tuple[str, ...]] = None,
+        timeout: Optional[float] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Apply new settings; a changed target list invalidates the cache."""
+        with self._lock:
+            if targets is not None and tuple(targets) != self.targets:
+                self.targets = tuple(targets)
+                self._expires = 0.0
+                self._failures = 0
+            if timeout is not None:
+                self.timeout = timeout
+            if ttl is not None:
+                self.ttl = ttl
+
+    def status(self, force: bool = False) -> ProbeResult:
+        """Return the cached result, probing first if it has expired."""
+        with self._lock:
+            if force or self._result is None or time.monotonic() >= self._expires:
+                self._result = self._refresh()
+            return self._result
+
+    def _refresh(self) -> ProbeResult:
+        try:
+            result = asyncio.run(self.probe())
+        except Exception:
+            result = ProbeResult(checked_at=time.time())
+
+        if result.online:
+            self._failures = 0
+            delay = self.ttl
+        else:
+            delay = min(self.min_retry * 2 ** self._failures, self.max_retry)
+            self._failures += 1
+            if not result.local_ip:
+                result = ProbeResult(local_ip=self._route_ip(), checked_at=result.checked_at)
+        self._expires = time.monotonic() + delay
+        return result
+
+    async def probe(self) -> ProbeResult:
+        """Probe all targets concurrently; resolve on the first success."""
+        tasks = [asyncio.ensure_future(self._probe_one(t)) for t in self.targets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result is not None:
+                    return result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return ProbeResult(checked_at=time.time())
+
+    async def _probe_one(self, target: str) -> Optional[ProbeResult]:
+        try:
+            host, port = parse_target(target)
+        except ValueError:
+            return None
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return None
+        latency = (time.perf_counter() - start) * 1000
+        sockname = writer.get_extra_info("sockname")
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return ProbeResult(
+            online=True,
+            local_ip=sockname[0] if sockname else "",
+            target=target,
+            latency_ms=latency,
+            checked_at=time.time(),
+        )
+
+    def _route_ip(self) -> str:
+        """Local address the OS would route the first IP target through.
+
+        A UDP ``connect`` only consults the routing table and sends nothing,
+        so this still reports the LAN address while the internet is down.
+        """
+        for target in self.targets:
+            try:
+                host, port = parse_target(target)
+            except ValueError:
+                continue
+            if not _is_ip(host):
+                continue
+            family = socket.AF_INET6 if ":" in host else socket.AF_INET
+            try:
+                with socket.socket(family, socket.SOCK_DGRAM) as s:
+                    s.connect((host, port))
+                    return s.getsockname()[0]
+            except OSError:
+                continue
+        return ""
+
+
+_probe: Optional[ConnectivityProbe] = None
+
+
+def get_connectivity_probe() -> ConnectivityProbe:
+    """Return the probe shared by the header and the live metrics panel."""
+    global _probe
+    if _probe is None:
+        _probe = ConnectivityProbe()
+    return _probe
@@ -0,0 +1,104 @@
+"""Filesystem locations used by MTCP (install root, caches, state)."""
+
+import os
+import sys
+from pathlib import Path
+
+
+def get_cache_dir() -> str:
+    """Return the per-machine cache directory, without creating it.
+
+    ``MTCP_CACHE_DIR`` overrides the default, which is
+    ``%LOCALAPPDATA%\\MTCP`` on Windows and ``$XDG_CACHE_HOME/mtcp``
+    (or ``~/.cache/mtcp``) elsewhere.
+    """
+    override = os.environ.get("MTCP_CACHE_DIR")
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base, "MTCP")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "mtcp")
+
+
+def cache_path(name: str) -> str:
+    """Return the path of a file inside the cache directory."""
+    return os.path.join(get_cache_dir(), name)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file so readers never see a
+    partially written cache."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def bundle_mode() -> str:
+    """How MTCP is running: "source", "onefile" or "onedir" (PyInstaller).
+
+    A onefile exe unpacks itself into a temp ``_MEIxxxx`` dir on every
+    launch; a onedir build runs from files next to (or in ``_internal``
+    below) the exe.
+    """
+    if not getattr(sys, 'frozen', False):
+        return "source"
+    exe_dir = Path(sys.executable).resolve().parent
+    bundle_dir = Path(sys._MEIPASS).resolve()
+    if bundle_dir == exe_dir or exe_dir in bundle_dir.parents:
+        return "onedir"
+    return "onefile"
+
+
+def get_bundle_dir() -> Path:
+    """Get the base directory for bundled resources (PyInstaller or source)."""
+    if getattr(sys, 'frozen', False):
+        # Frozen: the onefile temp extraction folder, or the onedir's
+        # own resource folder (which persists between launches)
+        return Path(sys._MEIPASS)
+    else:
+        # Running from source - mtcp package directory
+        return Path(__file__).resolve().parent
+
+
+def find_script_root() -> str:
+    """Find the ROOT directory (parent of mtcp package or exe location)."""
+    # When frozen, config is bundled inside the exe but we also need
+    # to check the exe's directory for external config. A onefile build
+    # prefers its bundled copy; a onedir build is installed as a folder,
+    # so an sfu-tools folder next to MTCP.exe overrides the bundled one.
+    if getattr(sys, 'frozen', False):
+        bundle_dir = Path(sys._MEIPASS)
+        exe_dir = Path(sys.executable).resolve().parent
+        candidates = [bundle_dir, exe_dir]
+        if bundle_mode() == "onedir":
+            candidates.reverse()
+        for candidate in candidates:
+            config = candidate / "sfu-tools" / "config.json"
+            if config.exists():
+                return str(candidate)
+
+        # Fallback to bundled
+        return str(bundle_dir)
+
+    # Running from source
+    # Try relative to this file
+    pkg_dir = Path(__file__).resolve().parent          # mtcp/
+    root_dir = pkg_dir.parent                          # ROOT/
+    config = root_dir / "sfu-tools" / "config.json"
+    if config.exists():
+        return str(root_dir)
+
+    # Try CWD
+    cwd = Path.cwd()
+    config = cwd / "sfu-tools" / "config.json"
+    if config.exists():
+        return str(cwd)
+
+    # Fallback
+    return str(root_dir)
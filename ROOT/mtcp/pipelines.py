@@ -0,0 +1,278 @@
+"""Pipelines: run a batch of tools in dependency order.
+
+A pipeline (the ``pipelines`` section of config.json) is a list of steps,
+each running one tool once the steps it comes ``after`` have finished and
+its ``when`` condition holds:
+
+- ``success`` (the default): every one of them succeeded
+- ``failure``: at least one of them failed
+- ``always``: however they ended
+
+A step succeeds when its exit code is one of its ``ok_codes`` (``[0]``
+unless given; SFC, for one, exits non-zero after repairing files). A
+step whose condition can no longer hold is skipped, which in turn skips
+the steps waiting on its success.
+
+``PipelineRun`` hands ready steps to the app's JobManager, so independent
+steps run side by side (up to ``max_concurrent_jobs``) and every step
+shows up in the jobs screen like any other tool.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .config import AppConfig, Pipeline, PipelineStep
+from .jobs import CANCELLED, FAILED, FINISHED_STATES, RUNNING, TIMED_OUT, Job, JobManager
+from .launch import LaunchPlan
+
+# Step states, besides the RUNNING, FAILED and CANCELLED shared with jobs
+WAITING = "waiting"
+SUCCEEDED = "succeeded"
+SKIPPED = "skipped"
+
+STEP_FINISHED_STATES = (SUCCEEDED, FAILED, SKIPPED, CANCELLED)
+
+
+@dataclass
+class StepRun:
+    """Progress of one step: its state, job and why it ended that way."""
+    step: PipelineStep
+    name: str
+    plan: LaunchPlan
+    status: str = WAITING
+    job: Optional[Job] = None
+    reason: str = ""
+
+    @property
+    def finished(self) -> bool:
+        return self.status in STEP_FINISHED_STATES
+
+    @property
+    def exit_code(self) -> Optional[int]:
+        return self.job.exit_code if self.job else None
+
+    @property
+    def elapsed(self) -> float:
+        return self.job.elapsed if self.job else 0.0
+
+
+# Called with the run after any step changes state, on a job thread.
+RunListener = Callable[["PipelineRun"], None]
+
+
+class PipelineRun:
+    """One execution of a pipeline.
+
+    Every JobManager event for one of the run's jobs is checked against
+    the waiting steps; those whose dependencies have all finished are
+    started or skipped at once. ``wait()`` blocks until every step has
+    finished and ``report()`` summarises the outcome.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        config: AppConfig,
+        jobs: JobManager,
+        script_root: str,
+        on_change: Optional[RunListener] = None,
+    ) -> None:
+        self.pipeline = pipeline
+        self.jobs = jobs
+        self.script_root = script_root
+        self.on_change = on_change
+        self.steps = []
+        for step in pipeline.steps:
+            tool = config.tools_by_id[step.tool_id]
+            self.steps.append(StepRun(step=step, name=tool.name, plan=tool.plan))
+        self._by_id = {run.step.id: run for run in self.steps}
+        self._by_job: dict[int, StepRun] = {}
+        # Reentrant: submitting a job notifies listeners on this thread
+        self._lock = threading.RLock()
+        self._done = threading.Event()
+        self.started_at: Optional[float] = None
+        self.ended_at: Optional[float] = None
+
+    # ── Queries ──────────────────────────────────────────────
+
+    @property
+    def done(self) -> bool:
+        return self.ended_at is not None
+
+    @property
+    def ok(self) -> bool:
+        """Finished without a failed or cancelled step."""
+        return self.done and not any(r.status in (FAILED, CANCELLED) for r in self.steps)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.ended_at if self.ended_at is not None else time.time()
+        return end - self.started_at
+
+    def counts(self) -> dict[str, int]:
+        """Number of steps in each state."""
+        counts: dict[str, int] = {}
+        for run in self.steps:
+            counts[run.status] = counts.get(run.status, 0) + 1
+        return counts
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every step has finished; False on timeout."""
+        return self._done.wait(timeout)
+
+    # ── Control ──────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start every step that depends on nothing."""
+        self.jobs.add_listener(self._on_job_event)
+        with self._lock:
+            self.started_at = time.time()
+            self._advance()
+        self._changed()
+
+    def cancel(self) -> None:
+        """Cancel the steps still waiting and kill the running ones."""
+        with self._lock:
+            running = []
+            for run in self.steps:
+                if run.status == WAITING:
+                    run.status = CANCELLED
+                    run.reason = "pipeline cancelled"
+                elif run.status == RUNNING:
+                    running.append(run.job.id)
+            self._check_done()
+        for job_id in running:
+            self.jobs.cancel(job_id)
+        self._changed()
+
+    def _on_job_event(self, job: Job, lines: list[str], first_index: int) -> None:
+        """JobManager listener (runs on the job's thread)."""
+        if lines or job.status not in FINISHED_STATES:
+            return
+        with self._lock:
+            run = self._by_job.get(job.id)
+            if run is None or run.status != RUNNING:
+                return
+            self._finish(run, job)
+            self._advance()
+        self._changed()
+
+    def _finish(self, run: StepRun, job: Job) -> None:
+        if job.status == CANCELLED:
+            run.status = CANCELLED
+        elif job.exit_code is not None and job.exit_code in run.step.ok_codes:
+            run.status = SUCCEEDED
+        else:
+            run.status = FAILED
+            run.reason = "timed out" if job.status == TIMED_OUT else job.error
+
+    def _advance(self) -> None:
+        """Start or skip every waiting step whose dependencies have finished.
+
+        Skipping a step can settle the ones after it, so this repeats
+        until nothing changes. Called with the lock held.
+        """
+        progressed = True
+        while progressed:
+            progressed = False
+            for run in self.steps:
+                if run.status != WAITING:
+                    continue
+                deps = [self._by_id[dep] for dep in run.step.after]
+                if not all(dep.finished for dep in deps):
+                    continue
+                progressed = True
+                reason = self._unmet(run.step, deps)
+                if reason:
+                    run.status = SKIPPED
+                    run.reason = reason
+                else:
+                    self._submit(run)
+        self._check_done()
+
+    @staticmethod
+    def _unmet(step: PipelineStep, deps: list[StepRun]) -> str:
+        """Why ``step`` must not run after ``deps``, or "" if it may."""
+        if step.when == "always":
+            return ""
+        if step.when == "failure":
+            if any(dep.status == FAILED for dep in deps):
+                return ""
+            return "nothing failed"
+        not_ok = [dep.step.id for dep in deps if dep.status != SUCCEEDED]
+        return f"{', '.join(not_ok)} did not succeed" if not_ok else ""
+
+    def _submit(self, run: StepRun) -> None:
+        # GUI tools run uncaptured too, but unlike from the menu they are
+        # waited on: the next step may need them to have finished
+        plan = run.plan
+        timeout = plan.timeout if run.step.timeout is None else run.step.timeout or None
+        run.status = RUNNING
+        run.job = self.jobs.submit(
+            run.name,
+            plan.args(self.script_root),
+            capture=plan.capture,
+            timeout=timeout,
+        )
+        self._by_job[run.job.id] = run
+        if not run.job.is_active:
+            # Finished before we could map it (rare); its event was dropped
+            self._finish(run, run.job)
+
+    def _check_done(self) -> None:
+        if self.ended_at is None and all(run.finished for run in self.steps):
+            self.ended_at = time.time()
+
+    def _changed(self) -> None:
+        """Tell ``on_change``; once the run is over, release ``wait()``."""
+        if self.on_change is not None:
+            try:
+                self.on_change(self)
+            except Exception:
+                pass
+        if self.done and not self._done.is_set():
+            self.jobs.remove_listener(self._on_job_event)
+            self._done.set()
+
+    # ── Report ───────────────────────────────────────────────
+
+    def report(self) -> dict:
+        """The outcome of every step, plus wall-clock time saved.
+
+        ``serial_seconds`` is how long the steps took added up, i.e.
+        roughly what running them one at a time would have cost.
+        """
+        return {
+            "pipeline": self.pipeline.id,
+            "name": self.pipeline.name,
+            "ok": self.ok,
+            "seconds": round(self.elapsed, 1),
+            "serial_seconds": round(sum(run.elapsed for run in self.steps), 1),
+            "steps": [
+                {
+                    "id": run.step.id,
+                    "tool": run.name,
+                    "status": run.status,
+                    "exit_code": run.exit_code,
+                    "seconds": round(run.elapsed, 1),
+                    "reason": run.reason,
+                }
+                for run in self.steps
+            ],
+        }
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. "42s", "3m 05s" or "1h 02m"."""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
@@ -0,0 +1,169 @@
+"""Incremental process sampling for the Top screen."""
+
+import heapq
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ProcessInfo:
+    """One row of the Top screen."""
+    pid: int
+    name: str
+    cpu_percent: float = 0.0      # share of the whole machine, like Task Manager
+    rss: int = 0                  # bytes
+    io_read_bps: float = 0.0
+    io_write_bps: float = 0.0
+    threads: int = 0
+    status: str = ""
+    username: str = ""
+
+    @property
+    def io_bps(self) -> float:
+        return self.io_read_bps + self.io_write_bps
+
+
+SORT_KEYS = {
+    "cpu": lambda p: p.cpu_percent,
+    "memory": lambda p: p.rss,
+    "io": lambda p: p.io_bps,
+}
+
+
+class _Tracked:
+    """A psutil.Process plus what we remember about it between samples."""
+
+    __slots__ = ("proc", "name", "username", "io", "io_time")
+
+    def __init__(self, proc) -> None:
+        self.proc = proc
+        self.name = ""
+        self.username = ""
+        self.io: Optional[tuple[int, int]] = None
+        self.io_time = 0.0
+
+
+class ProcessTable:
+    """Keeps ``psutil.Process`` objects alive across samples.
+
+    psutil's per-process ``cpu_percent`` is a delta against the previous
+    call on the *same* object, and I/O rates need the previous counters,
+    so recreating every process each tick would both cost more and lose
+    that state. Instead each sample only adds pids that appeared and drops
+    pids that went away; the survivors are read inside ``oneshot()`` so
+    their attributes come from a single batch of system calls. Names and
+    users, which never change for a pid, are fetched once.
+    """
+
+    def __init__(self) -> None:
+        self._tracked: dict[int, _Tracked] = {}
+        self._cpu_count = os.cpu_count() or 1
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def sample(self) -> list[ProcessInfo]:
+        """Refresh the table and return a row for every live process."""
+        with self._lock:
+            return self._sample()
+
+    def _sample(self) -> list[ProcessInfo]:
+        import psutil
+
+        pids = set(psutil.pids())
+        pids.discard(0)  # System Idle Process: "busy" doing nothing
+        tracked = self._tracked
+        for pid in tracked.keys() - pids:
+            del tracked[pid]
+        for pid in pids - tracked.keys():
+            try:
+                tracked[pid] = _Tracked(psutil.Process(pid))
+            except psutil.Error:
+                pass
+
+        rows = []
+        gone = []
+        now = time.monotonic()
+        for pid, entry in tracked.items():
+            try:
+                rows.append(self._read(entry, now))
+            except psutil.NoSuchProcess:
+                gone.append(pid)
+            except psutil.Error:
+                pass
+        for pid in gone:
+            del tracked[pid]
+        return rows
+
+    def _read(self, entry: _Tracked, now: float) -> ProcessInfo:
+        import psutil
+
+        proc = entry.proc
+        with proc.oneshot():
+            if not entry.name:
+                entry.name = proc.name()
+                try:
+                    entry.username = proc.username()
+                except psutil.Error:
+                    entry.username = ""
+            # The first call for a new process returns 0.0 and primes it
+            cpu = proc.cpu_percent(None) / self._cpu_count
+            rss = proc.memory_info().rss
+            threads = proc.num_threads()
+            status = proc.status()
+            try:
+                io = proc.io_counters()
+                io = (io.read_bytes, io.write_bytes)
+            except (psutil.AccessDenied, AttributeError):
+                io = None
+
+        read_bps = write_bps = 0.0
+        if io is not None and entry.io is not None:
+            elapsed = now - entry.io_time
+            if elapsed > 0:
+                read_bps = max(0, io[0] - entry.io[0]) / elapsed
+                write_bps = max(0, io[1] - entry.io[1]) / elapsed
+        entry.io, entry.io_time = io, now
+
+        return ProcessInfo(
+            pid=proc.pid,
+            name=entry.name,
+            cpu_percent=cpu,
+            rss=rss,
+            io_read_bps=read_bps,
+            io_write_bps=write_bps,
+            threads=threads,
+            status=status,
+            username=entry.username,
+        )
+
+    # ── Actions ──────────────────────────────────────────────
+    # These go through the tracked Process objects, which psutil checks
+    # against the original creation time, so a pid that was reused by a
+    # new process since the last sample is never signalled by mistake.
+
+    def _process(self, pid: int):
+        import psutil
+
+        entry = self._tracked.get(pid)
+        if entry is None:
+            raise psutil.NoSuchProcess(pid)
+        return entry.proc
+
+    def kill(self, pid: int) -> None:
+        self._process(pid).kill()
+
+    def suspend(self, pid: int) -> None:
+        self._process(pid).suspend()
+
+    def resume(self, pid: int) -> None:
+        self._process(pid).resume()
+
+
+def top(rows: list[ProcessInfo], key: str = "cpu", limit: int = 50) -> list[ProcessInfo]:
+    """The ``limit`` heaviest processes by ``key`` (see SORT_KEYS)."""
+    return heapq.nlargest(limit, rows, key=SORT_KEYS[key])
@@ -1,12 +1,15 @@
-"""Modal screens for MTCP TUI - Help, Credits, Debug, Update, Exit, Tool Output."""
+"""Modal screens for MTCP TUI - Help, Credits, Debug, Update, Exit, Tool Output, Jobs, History, Monitor, Top."""
 
 from __future__ import annotations
 
 import os
 import subprocess
 import sys
+from collections import deque
+from datetime import datetime
 from typing import Optional
 
+from rich.text import Text
 from textual import on, work
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -14,6 +17,7 @@ from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import (
     Button,
+    DataTable,
     Footer,
     Header,
     Input,
@@ -22,11 +26,18 @@ from textual.widgets import (
     ListView,
     OptionList,
     RichLog,
+    Sparkline,
     Static,
 )
 from textual.widgets.option_list import Option
 
-from .tools import AppConfig, SlashCommand
+from .jobs import CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING, TIMED_OUT, Job, JobManager
+from .config import AppConfig, SlashCommand
+from .fleet import AgentTransport, HostStatus, Transport, query_fleet
+from .history import SERIES, MetricsHistory
+from .monitor import DetailedMetrics
+from .pipelines import SKIPPED, SUCCEEDED, WAITING, PipelineRun, format_duration
+from .procs import ProcessInfo, ProcessTable, top
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -73,6 +84,12 @@ class HelpScreen(ModalScreen):
                 yield Static("  [cyan]/[/cyan]          Open command palette")
                 yield Static("  [cyan]W[/cyan]          Update wallpaper")
                 yield Static("  [cyan]D[/cyan]          Toggle Deep Freeze")
+                yield Static("  [cyan]S[/cyan]          Search tools and commands")
+                yield Static("  [cyan]J[/cyan]          Show running jobs")
+                yield Static("  [cyan]H[/cyan]          Show metrics history")
+                yield Static("  [cyan]M[/cyan]          Per-core / disk / adapter monitor")
+                yield Static("  [cyan]T[/cyan]          Top processes (kill / suspend)")
+                yield Static("  [cyan]F[/cyan]          Lab fleet status")
                 yield Static("  [cyan]Q / E[/cyan]      Exit application")
                 yield Static("")
                 yield Static(
@@ -170,16 +187,6 @@ class DebugScreen(ModalScreen):
         self.dismiss()
 
     def compose(self) -> ComposeResult:
-        import psutil
-        proc = psutil.Process(os.getpid())
-
-        mem_mb = round(proc.memory_info().rss / (1024 * 1024), 2)
-        cpu_pct = proc.cpu_percent(interval=0.1)
-        threads = proc.num_threads()
-        start_time = proc.create_time()
-        from datetime import datetime
-        start_str = datetime.fromtimestamp(start_time).strftime("%Y-%m-%d %H:%M:%S")
-
         with Container(id="debug-dialog"):
             yield Static("🐛  DEBUG MENU", id="debug-title")
             with VerticalScroll(id="debug-content"):
@@ -188,10 +195,7 @@ class DebugScreen(ModalScreen):
                 yield Static("")
                 yield Static("  [yellow]📊 Process Information[/yellow]")
                 yield Static("  " + "─" * 50, classes="separator")
-                yield Static(f"    [cyan]💻 CPU Usage:[/cyan]     {cpu_pct}%")
-                yield Static(f"    [cyan]💾 Memory:[/cyan]        {mem_mb} MB")
-                yield Static(f"    [cyan]🧵 Threads:[/cyan]       {threads}")
-                yield Static(f"    [cyan]⏰ Start Time:[/cyan]    {start_str}")
+                yield Static("    [dim]Reading process stats...[/dim]", id="debug-proc")
                 yield Static(f"    [cyan]🆔 Process ID:[/cyan]    {os.getpid()}")
                 yield Static(f"    [cyan]🐍 Python:[/cyan]        {sys.version.split()[0]}")
                 yield Static("")
@@ -203,6 +207,35 @@ class DebugScreen(ModalScreen):
                 yield Button("📊 System Diagnostics", id="debug-sysdiag", variant="default")
                 yield Button("❌ Close", id="debug-close", variant="error")
 
+    def on_mount(self) -> None:
+        self.load_process_stats()
+
+    @work(thread=True, exclusive=True, group="debug")
+    def load_process_stats(self) -> None:
+        """Read our own process stats off the UI thread (cpu_percent sleeps)."""
+        try:
+            import psutil
+            proc = psutil.Process(os.getpid())
+            mem_mb = round(proc.memory_info().rss / (1024 * 1024), 2)
+            cpu_pct = proc.cpu_percent(interval=0.1)
+            threads = proc.num_threads()
+            start_str = datetime.fromtimestamp(proc.create_time()).strftime("%Y-%m-%d %H:%M:%S")
+        except Exception as e:
+            text = f"    [#ff4444]Unavailable: {e}[/#ff4444]"
+        else:
+            text = (
+                f"    [cyan]💻 CPU Usage:[/cyan]     {cpu_pct}%\n"
+                f"    [cyan]💾 Memory:[/cyan]        {mem_mb} MB\n"
+                f"    [cyan]🧵 Threads:[/cyan]       {threads}\n"
+                f"    [cyan]⏰ Start Time:[/cyan]    {start_str}"
+            )
+        self.app.call_from_thread(self._show_process_stats, text)
+
+    def _show_process_stats(self, text: str) -> None:
+        # The screen may have been dismissed while the worker ran
+        if self.is_mounted:
+            self.query_one("#debug-proc", Static).update(text)
+
     @on(Button.Pressed, "#debug-close")
     def close_debug(self) -> None:
         self.dismiss()
@@ -226,8 +259,11 @@ class DebugScreen(ModalScreen):
 
     @on(Button.Pressed, "#debug-sysdiag")
     def sys_diagnostics(self) -> None:
-        from .sysinfo import get_system_info
-        info = get_system_info()
+        # Reuse the header's info instead of re-querying WMI
+        info = getattr(self.app, "sys_info", None)
+        if info is None:
+            from .sysinfo import get_system_info
+            info = get_system_info()
         diag = (
             f"Hostname:     {info.hostname_display}\n"
             f"Model:        {info.model}\n"
@@ -250,34 +286,933 @@ class DebugScreen(ModalScreen):
 
 
 class ToolOutputScreen(ModalScreen):
-    """Displays output from a tool execution."""
+    """Displays output from a tool execution.
+
+    Output can be given up front, or the screen can tail a running
+    :class:`~mtcp.jobs.Job`. Only the last ``max_lines`` lines are kept,
+    both here and in the RichLog, so huge outputs stay bounded.
+    """
 
     BINDINGS = [
         Binding("escape", "close_screen", "Close", priority=True),
         Binding("q", "close_screen", "Close"),
+        Binding("k", "kill_job", "Kill"),
     ]
 
-    def __init__(self, title: str, output: str) -> None:
+    DEFAULT_MAX_LINES = 5000
+
+    def __init__(
+        self,
+        title: str,
+        output: str = "",
+        max_lines: int = DEFAULT_MAX_LINES,
+        job: Optional[Job] = None,
+    ) -> None:
         super().__init__()
         self.title_text = title
         self.output_text = output
+        self.max_lines = max_lines
+        self.job = job
+        self.lines: deque[str] = deque(maxlen=max_lines)
+        self.total_lines = 0
+        self.status_text = "[dim]Press ESC to close[/dim]"
 
     def action_close_screen(self) -> None:
         """Close the output screen."""
         self.dismiss()
 
+    def action_kill_job(self) -> None:
+        """Kill the tailed job, if any."""
+        if self.job and self.job.is_active:
+            self.app.jobs.cancel(self.job.id)
+
     def compose(self) -> ComposeResult:
         with Container(id="output-dialog"):
             yield Static(self.title_text, id="output-title")
-            yield RichLog(id="output-log", highlight=True, markup=True)
-            yield Static(
-                "[dim]Press ESC to close[/dim]", id="output-footer"
+            yield RichLog(
+                id="output-log", highlight=True, markup=True, max_lines=self.max_lines
             )
+            yield Static(self.status_text, id="output-footer")
 
     def on_mount(self) -> None:
         log = self.query_one("#output-log", RichLog)
-        for line in self.output_text.split("\n"):
-            log.write(line)
+        if self.output_text:
+            for line in self.output_text.split("\n"):
+                log.write(line)
+        if self.job:
+            # Subscribe before snapshotting; overlap is dropped by index
+            self.app.jobs.add_listener(self._on_job_event)
+            lines, total = self.job.snapshot_output()
+            self.lines.extend(lines)
+            self.total_lines = total
+            self._show_job_status()
+            self.set_interval(1.0, self._tick_job_status)
+        if self.lines:
+            log.write(Text("\n".join(self.lines)))
+
+    def on_unmount(self) -> None:
+        if self.job:
+            self.app.jobs.remove_listener(self._on_job_event)
+
+    def append_lines(self, lines: list[str], first_index: Optional[int] = None) -> None:
+        """Append a batch of output lines (UI thread only).
+
+        ``first_index`` is the stream position of ``lines[0]``; lines this
+        screen has already shown are skipped.
+        """
+        if first_index is not None and first_index < self.total_lines:
+            lines = lines[self.total_lines - first_index:]
+        if not lines:
+            return
+        self.lines.extend(lines)
+        self.total_lines += len(lines)
+        if self.is_mounted:
+            # Plain Text so tool output is never parsed as markup
+            self.query_one("#output-log", RichLog).write(Text("\n".join(lines)))
+
+    def set_status(self, status: str) -> None:
+        """Update the footer line (e.g. running / exit code)."""
+        if self.total_lines > self.max_lines:
+            status += f"  [dim](showing last {self.max_lines} of {self.total_lines} lines)[/dim]"
+        self.status_text = status
+        if self.is_mounted:
+            self.query_one("#output-footer", Static).update(status)
+
+    def _on_job_event(self, job: Job, lines: list[str], first_index: int) -> None:
+        """JobManager listener (runs on the job's thread)."""
+        if job is not self.job:
+            return
+        try:
+            self.app.call_from_thread(self._apply_job_event, lines, first_index)
+        except Exception:
+            pass
+
+    def _apply_job_event(self, lines: list[str], first_index: int) -> None:
+        self.append_lines(lines, first_index)
+        self._show_job_status()
+
+    def _tick_job_status(self) -> None:
+        if self.job.is_active:
+            self._show_job_status()
+
+    def _show_job_status(self) -> None:
+        job = self.job
+        if job.status == QUEUED:
+            status = "[#ffc107]⏳ Queued[/#ffc107]"
+        elif job.status == RUNNING:
+            status = f"[#ffc107]⏳ Running ({job.elapsed:.0f}s)[/#ffc107]  [dim]K to kill[/dim]"
+        elif job.status == COMPLETED:
+            status = "[#4caf50]✔ Completed[/#4caf50]"
+        elif job.status == FAILED:
+            detail = job.error or f"code {job.exit_code}"
+            status = f"[#ff4444]✘ Failed ({detail})[/#ff4444]"
+        elif job.status == TIMED_OUT:
+            status = "[#ff4444]Timed out - process killed[/#ff4444]"
+        else:
+            status = "[#ff9800]Cancelled[/#ff9800]"
+        if not job.is_active and not self.total_lines:
+            status += "  [dim](no output)[/dim]"
+        self.set_status(f"{status}  [dim]Press ESC to close[/dim]")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Jobs Screen
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class JobsScreen(ModalScreen):
+    """Lists tool jobs with options to tail output or kill them."""
+
+    BINDINGS = [
+        Binding("escape", "close_screen", "Close", priority=True),
+        Binding("t", "tail_job", "Tail"),
+        Binding("k", "kill_job", "Kill"),
+        Binding("c", "clear_finished", "Clear finished"),
+    ]
+
+    STATUS_STYLES = {
+        QUEUED: "#ffc107",
+        RUNNING: "#00d4ff",
+        COMPLETED: "#4caf50",
+        FAILED: "#ff4444",
+        TIMED_OUT: "#ff4444",
+        CANCELLED: "#ff9800",
+    }
+
+    def __init__(self, manager: JobManager) -> None:
+        super().__init__()
+        self.manager = manager
+
+    def action_close_screen(self) -> None:
+        """Close the jobs screen."""
+        self.dismiss()
+
+    def compose(self) -> ComposeResult:
+        with Container(id="jobs-dialog"):
+            yield Static("⚙️  JOBS", id="jobs-title")
+            yield DataTable(id="jobs-table", cursor_type="row", zebra_stripes=True)
+            yield Static(
+                "[dim][bold]Enter[/bold] Tail  [bold]K[/bold] Kill  "
+                "[bold]C[/bold] Clear finished  [bold]Esc[/bold] Close[/dim]",
+                id="jobs-footer",
+            )
+
+    def on_mount(self) -> None:
+        table = self.query_one("#jobs-table", DataTable)
+        table.add_columns("#", "Tool", "Status", "PID", "Started", "Elapsed", "Exit")
+        self._refresh_table()
+        self.set_interval(1.0, self._refresh_table)
+        table.focus()
+
+    def _refresh_table(self) -> None:
+        table = self.query_one("#jobs-table", DataTable)
+        selected = self._selected_job_id()
+        table.clear()
+        for job in self.manager.jobs():
+            color = self.STATUS_STYLES.get(job.status, "#888888")
+            started = (
+                datetime.fromtimestamp(job.started_at).strftime("%H:%M:%S")
+                if job.started_at else "-"
+            )
+            table.add_row(
+                str(job.id),
+                job.name,
+                f"[{color}]{job.status}[/{color}]",
+                str(job.pid or "-"),
+                started,
+                f"{job.elapsed:.0f}s" if job.started_at else "-",
+                "-" if job.exit_code is None else str(job.exit_code),
+                key=str(job.id),
+            )
+        if selected is not None and str(selected) in table.rows:
+            table.move_cursor(row=table.get_row_index(str(selected)))
+
+    def _selected_job_id(self) -> Optional[int]:
+        table = self.query_one("#jobs-table", DataTable)
+        if table.row_count == 0:
+            return None
+        try:
+            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        except Exception:
+            return None
+        return int(row_key.value)
+
+    @on(DataTable.RowSelected, "#jobs-table")
+    def on_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Enter on a row tails that job."""
+        self.action_tail_job()
+
+    def action_tail_job(self) -> None:
+        job_id = self._selected_job_id()
+        job = self.manager.get(job_id) if job_id is not None else None
+        if job:
+            self.app.push_screen(ToolOutputScreen(f"📋 {job.name}", job=job))
+
+    def action_kill_job(self) -> None:
+        job_id = self._selected_job_id()
+        if job_id is not None and self.manager.cancel(job_id):
+            self.app.notify(f"Job #{job_id} cancelled.", title="Jobs")
+        self._refresh_table()
+
+    def action_clear_finished(self) -> None:
+        self.manager.clear_finished()
+        self._refresh_table()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# History Screen
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class HistoryScreen(ModalScreen):
+    """Sparklines and min/avg/max rollups of the recorded metrics."""
+
+    BINDINGS = [
+        Binding("escape", "close_screen", "Close", priority=True),
+        Binding("1", "set_window(60)", "Last minute"),
+        Binding("5", "set_window(300)", "Last 5 minutes"),
+        Binding("a", "set_window(0)", "All"),
+    ]
+
+    def __init__(self, history: MetricsHistory) -> None:
+        super().__init__()
+        self.history = history
+        self.window: Optional[float] = None  # seconds, None = everything kept
+        self._shown_version = -1
+
+    def action_close_screen(self) -> None:
+        """Close the history screen."""
+        self.dismiss()
+
+    def action_set_window(self, seconds: int) -> None:
+        self.window = seconds or None
+        self._shown_version = -1
+        self._refresh_history()
+
+    def compose(self) -> ComposeResult:
+        with Container(id="history-dialog"):
+            yield Static("📈  HISTORY", id="history-title")
+            yield Static("", id="history-window")
+            yield DataTable(id="history-table", cursor_type="none", zebra_stripes=True)
+            with Vertical(id="history-sparks"):
+                for name, (label, _unit) in SERIES.items():
+                    with Horizontal(classes="history-spark-row"):
+                        yield Static(label, classes="history-spark-label")
+                        yield Sparkline([], id=f"history-spark-{name}")
+            yield Static(
+                "[dim][bold]1[/bold] Last minute  [bold]5[/bold] Last 5 min  "
+                "[bold]A[/bold] All  [bold]Esc[/bold] Close[/dim]",
+                id="history-footer",
+            )
+
+    def on_mount(self) -> None:
+        table = self.query_one("#history-table", DataTable)
+        table.add_columns("Metric", "Now", "Min", "Avg", "Max", "Peak at")
+        self._refresh_history()
+        self.set_interval(1.0, self._refresh_history)
+
+    def _refresh_history(self) -> None:
+        history = self.history
+        if history.version == self._shown_version:
+            return
+        self._shown_version = history.version
+
+        window = self.window
+        last = None if window is None else max(1, int(window / history.resolution))
+        span = window if window is not None else history.duration
+        samples = min(len(history), last or len(history))
+        self.query_one("#history-window", Static).update(
+            f"[dim]Last {span / 60:g} min · {samples} samples at "
+            f"{history.resolution:g}s resolution[/dim]"
+        )
+
+        table = self.query_one("#history-table", DataTable)
+        table.clear()
+        for name, (label, unit) in SERIES.items():
+            values = history.values(name, last)
+            stats = history.stats(name, window)
+            peak = (
+                datetime.fromtimestamp(stats.peak_at).strftime("%H:%M:%S")
+                if stats.peak_at else "-"
+            )
+            now = f"{values[-1]:.1f} {unit}" if values else "-"
+            table.add_row(
+                label,
+                now,
+                f"{stats.minimum:.1f}",
+                f"{stats.average:.1f}",
+                f"[bold]{stats.maximum:.1f}[/bold]",
+                peak,
+            )
+            self.query_one(f"#history-spark-{name}", Sparkline).data = values
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Monitor Screen
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def _format_rate(bytes_per_sec: float) -> str:
+    """Human-readable byte rate (B/s, KB/s, MB/s, GB/s)."""
+    value = bytes_per_sec
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B/s" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB/s"
+
+
+def _load_color(percent: float) -> str:
+    if percent >= 90:
+        return "#ff4444"
+    if percent >= 70:
+        return "#ffc107"
+    return "#4caf50"
+
+
+class MonitorScreen(ModalScreen):
+    """Per-core CPU, per-disk I/O and per-adapter network throughput.
+
+    Turns on the sampler's detailed collection while open and off again
+    when closed, so the extra psutil calls only run when someone looks.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close_screen", "Close", priority=True),
+        Binding("i", "toggle_idle", "Show/hide idle devices"),
+    ]
+
+    CORE_COLUMNS = 4
+    CORE_BAR_WIDTH = 10
+
+    def __init__(self, sampler) -> None:
+        super().__init__()
+        self.sampler = sampler
+        self.show_idle = False
+        self._shown: Optional[DetailedMetrics] = None
+
+    def action_close_screen(self) -> None:
+        """Close the monitor screen."""
+        self.dismiss()
+
+    def action_toggle_idle(self) -> None:
+        self.show_idle = not self.show_idle
+        self._shown = None
+        self._refresh_monitor()
+
+    def compose(self) -> ComposeResult:
+        with Container(id="expanded-monitor-dialog"):
+            yield Static("🖥️  MONITOR", id="expanded-monitor-title")
+            yield Static("[dim]⏳ Sampling...[/dim]", id="monitor-cores")
+            yield DataTable(id="monitor-disks", cursor_type="none", zebra_stripes=True)
+            yield Static("", id="monitor-volumes")
+            yield DataTable(id="monitor-nics", cursor_type="none", zebra_stripes=True)
+            yield Static(
+                "[dim][bold]I[/bold] Show/hide idle devices  "
+                "[bold]Esc[/bold] Close[/dim]",
+                id="expanded-monitor-footer",
+            )
+
+    def on_mount(self) -> None:
+        self.query_one("#monitor-disks", DataTable).add_columns(
+            "Disk", "Read", "Write", "Read IOPS", "Write IOPS", "Busy"
+        )
+        self.query_one("#monitor-nics", DataTable).add_columns(
+            "Adapter", "State", "Sent", "Received", "Link", "Util", "Errors/s", "Drops/s"
+        )
+        self.sampler.set_detailed(True)
+        self._refresh_monitor()
+        self.set_interval(0.5, self._refresh_monitor)
+
+    def on_unmount(self) -> None:
+        self.sampler.set_detailed(False)
+
+    def _refresh_monitor(self) -> None:
+        metrics = self.sampler.latest_detail
+        if metrics is None or metrics is self._shown:
+            return
+        self._shown = metrics
+        self._render_cores(metrics)
+        self._render_disks(metrics)
+        self._render_nics(metrics)
+
+    def _render_cores(self, metrics: DetailedMetrics) -> None:
+        cells = []
+        width = self.CORE_BAR_WIDTH
+        for i, pct in enumerate(metrics.per_cpu):
+            filled = round(pct / 100 * width)
+            color = _load_color(pct)
+            cells.append(
+                f"[#00d4ff]{i:>3}[/#00d4ff] [{color}]{'█' * filled}[/{color}]"
+                f"[#333333]{'░' * (width - filled)}[/#333333] {pct:>3.0f}%"
+            )
+        cols = self.CORE_COLUMNS
+        lines = ["    ".join(cells[i:i + cols]) for i in range(0, len(cells), cols)]
+        self.query_one("#monitor-cores", Static).update(
+            "\n".join(lines) or "[dim]No per-core data[/dim]"
+        )
+
+    def _render_disks(self, metrics: DetailedMetrics) -> None:
+        table = self.query_one("#monitor-disks", DataTable)
+        table.clear()
+        for disk in metrics.disks:
+            active = disk.read_bps or disk.write_bps or disk.busy_percent
+            if not active and not self.show_idle:
+                continue
+            color = _load_color(disk.busy_percent)
+            table.add_row(
+                disk.name,
+                _format_rate(disk.read_bps),
+                _format_rate(disk.write_bps),
+                f"{disk.read_iops:.0f}",
+                f"{disk.write_iops:.0f}",
+                f"[{color}]{disk.busy_percent:.0f}%[/{color}]",
+            )
+        volumes = "  ".join(
+            f"[#00d4ff]{v.mountpoint}[/#00d4ff] "
+            f"[{_load_color(v.percent)}]{v.percent:.0f}%[/] "
+            f"[dim]({v.used_gb:.0f}/{v.total_gb:.0f}G)[/dim]"
+            for v in metrics.volumes
+        )
+        self.query_one("#monitor-volumes", Static).update(volumes)
+
+    def _render_nics(self, metrics: DetailedMetrics) -> None:
+        table = self.query_one("#monitor-nics", DataTable)
+        table.clear()
+        for nic in metrics.nics:
+            if not nic.is_up and not self.show_idle:
+                continue
+            util = nic.utilization
+            table.add_row(
+                nic.name,
+                "[#4caf50]up[/#4caf50]" if nic.is_up else "[#ff4444]down[/#ff4444]",
+                _format_rate(nic.sent_bps),
+                _format_rate(nic.recv_bps),
+                f"{nic.speed_mbps} Mb/s" if nic.speed_mbps else "-",
+                "-" if util is None else f"[{_load_color(util)}]{util:.0f}%[/]",
+                f"{nic.errors_ps:.0f}",
+                f"{nic.drops_ps:.0f}",
+            )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Top Processes Screen
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit in ("B", "KB") else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} TB"
+
+
+class TopScreen(ModalScreen):
+    """The heaviest processes by CPU, memory or disk I/O.
+
+    Sampling runs on a worker thread against a ProcessTable kept for the
+    lifetime of the screen, so each refresh only pays for what changed.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close_screen", "Close", priority=True),
+        Binding("c", "sort('cpu')", "Sort by CPU"),
+        Binding("m", "sort('memory')", "Sort by memory"),
+        Binding("i", "sort('io')", "Sort by I/O"),
+        Binding("k", "kill_process", "Kill"),
+        Binding("s", "suspend_process", "Suspend/Resume"),
+    ]
+
+    REFRESH_INTERVAL = 2.0
+    SORT_LABELS = {"cpu": "CPU", "memory": "memory", "io": "disk I/O"}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.table = ProcessTable()
+        self.sort_key = "cpu"
+        self.rows: list[ProcessInfo] = []
+
+    def action_close_screen(self) -> None:
+        """Close the top screen."""
+        self.dismiss()
+
+    def compose(self) -> ComposeResult:
+        with Container(id="top-dialog"):
+            yield Static("📊  TOP PROCESSES", id="top-title")
+            yield Static("", id="top-summary")
+            yield DataTable(id="top-table", cursor_type="row", zebra_stripes=True)
+            yield Static(
+                "[dim][bold]C[/bold]/[bold]M[/bold]/[bold]I[/bold] Sort by CPU/memory/I/O  "
+                "[bold]K[/bold] Kill  [bold]S[/bold] Suspend/Resume  "
+                "[bold]Esc[/bold] Close[/dim]",
+                id="top-footer",
+            )
+
+    def on_mount(self) -> None:
+        table = self.query_one("#top-table", DataTable)
+        table.add_columns("PID", "Name", "CPU", "Memory", "Disk I/O", "Threads", "Status", "User")
+        self.refresh_processes()
+        self.set_interval(self.REFRESH_INTERVAL, self.refresh_processes)
+        table.focus()
+
+    @work(thread=True, exclusive=True, group="top")
+    def refresh_processes(self) -> None:
+        """Sample processes off the UI thread."""
+        try:
+            rows = self.table.sample()
+        except Exception as e:
+            self.app.call_from_thread(self._show_error, str(e))
+            return
+        self.app.call_from_thread(self._show_rows, rows)
+
+    def _show_error(self, message: str) -> None:
+        self.query_one("#top-summary", Static).update(
+            f"[#ff4444]Cannot list processes: {message}[/#ff4444]"
+        )
+
+    def action_sort(self, key: str) -> None:
+        self.sort_key = key
+        self._show_rows(self.rows)
+
+    def _show_rows(self, rows: list[ProcessInfo]) -> None:
+        self.rows = rows
+        table = self.query_one("#top-table", DataTable)
+        selected = self._selected_pid()
+        table.clear()
+        for proc in top(rows, self.sort_key):
+            cpu_color = _load_color(proc.cpu_percent)
+            table.add_row(
+                str(proc.pid),
+                proc.name,
+                f"[{cpu_color}]{proc.cpu_percent:.1f}%[/]",
+                _format_bytes(proc.rss),
+                _format_rate(proc.io_bps),
+                str(proc.threads),
+                proc.status,
+                proc.username.rpartition("\\")[2],
+                key=str(proc.pid),
+            )
+        if selected is not None and str(selected) in table.rows:
+            table.move_cursor(row=table.get_row_index(str(selected)))
+
+        total_cpu = sum(p.cpu_percent for p in rows)
+        self.query_one("#top-summary", Static).update(
+            f"[dim]{len(rows)} processes · {total_cpu:.0f}% CPU in use · "
+            f"sorted by {self.SORT_LABELS[self.sort_key]}[/dim]"
+        )
+
+    def _selected_pid(self) -> Optional[int]:
+        table = self.query_one("#top-table", DataTable)
+        if table.row_count == 0:
+            return None
+        try:
+            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        except Exception:
+            return None
+        return int(row_key.value)
+
+    def _selected_process(self) -> Optional[ProcessInfo]:
+        pid = self._selected_pid()
+        return next((p for p in self.rows if p.pid == pid), None)
+
+    def action_kill_process(self) -> None:
+        proc = self._selected_process()
+        if proc is None:
+            return
+
+        def on_confirm(confirmed: bool) -> None:
+            if confirmed:
+                self._signal(proc, self.table.kill, "killed")
+
+        self.app.push_screen(
+            ConfirmScreen(f"⚠️  Kill {proc.name} (PID {proc.pid})?", "Yes, Kill"),
+            on_confirm,
+        )
+
+    def action_suspend_process(self) -> None:
+        proc = self._selected_process()
+        if proc is None:
+            return
+        if proc.status == "stopped":
+            self._signal(proc, self.table.resume, "resumed")
+        else:
+            self._signal(proc, self.table.suspend, "suspended")
+
+    def _signal(self, proc: ProcessInfo, action, verb: str) -> None:
+        try:
+            action(proc.pid)
+        except Exception as e:
+            self.app.notify(
+                f"Could not act on {proc.name}: {e.__class__.__name__}",
+                title="Top",
+                severity="error",
+            )
+            return
+        self.app.notify(f"{proc.name} (PID {proc.pid}) {verb}.", title="Top")
+        self.refresh_processes()
+
+
+class FleetScreen(ModalScreen):
+    """System info from every lab machine in ``settings.fleet_hosts``.
+
+    Queries run as an async worker on the app's event loop, so the
+    transport's connections stay open between refreshes, and rows fill
+    in as each host answers.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close_screen", "Close", priority=True),
+        Binding("r", "refresh_fleet", "Refresh"),
+        Binding("n", "sort('host')", "Sort by host"),
+        Binding("f", "sort('deep_freeze')", "Sort by Deep Freeze"),
+        Binding("d", "sort('disk')", "Sort by disk free"),
+        Binding("u", "sort('uptime')", "Sort by uptime"),
+        Binding("l", "sort('latency')", "Sort by latency"),
+    ]
+
+    REFRESH_INTERVAL = 60.0
+    SORT_LABELS = {
+        "host": "host",
+        "deep_freeze": "Deep Freeze",
+        "disk": "disk free",
+        "uptime": "uptime",
+        "latency": "latency",
+    }
+
+    def __init__(self, config: AppConfig, transport: Optional[Transport] = None) -> None:
+        super().__init__()
+        self.config = config
+        self.hosts = list(dict.fromkeys(config.fleet_hosts))
+        self.transport = transport or AgentTransport(
+            port=config.fleet_port, token=config.fleet_token
+        )
+        self.results: dict[str, HostStatus] = {}
+        self.pending: set[str] = set()
+        self.sort_key = "host"
+
+    def action_close_screen(self) -> None:
+        """Close the fleet screen."""
+        self.dismiss()
+
+    def compose(self) -> ComposeResult:
+        with Container(id="fleet-dialog"):
+            yield Static("🏫  LAB FLEET", id="fleet-title")
+            yield Static("", id="fleet-summary")
+            yield DataTable(id="fleet-table", cursor_type="row", zebra_stripes=True)
+            yield Static(
+                "[dim][bold]N[/bold]/[bold]F[/bold]/[bold]D[/bold]/[bold]U[/bold]/[bold]L[/bold] "
+                "Sort by name/Deep Freeze/disk/uptime/latency  "
+                "[bold]R[/bold] Refresh  [bold]Esc[/bold] Close[/dim]",
+                id="fleet-footer",
+            )
+
+    def on_mount(self) -> None:
+        table = self.query_one("#fleet-table", DataTable)
+        table.add_columns("Host", "Status", "Deep Freeze", "Disk Free", "Uptime", "IP", "Model", "Latency")
+        table.focus()
+        if not self.hosts:
+            self.query_one("#fleet-summary", Static).update(
+                "[dim]No hosts configured. Add them to [bold]settings.fleet_hosts[/bold] "
+                "in config.json and run [bold]mtcp --headless agent --bind 0.0.0.0[/bold] "
+                "on each machine.[/dim]"
+            )
+            return
+        self._show_rows()
+        self.refresh_fleet()
+        self.set_interval(self.REFRESH_INTERVAL, self.refresh_fleet)
+
+    async def on_unmount(self) -> None:
+        await self.transport.close()
+
+    def action_refresh_fleet(self) -> None:
+        if self.hosts:
+            self.refresh_fleet()
+
+    @work(exclusive=True, group="fleet")
+    async def refresh_fleet(self) -> None:
+        """Query every host, updating rows as answers arrive."""
+        self.pending = set(self.hosts)
+        self._show_rows()
+        await query_fleet(
+            self.hosts,
+            self.transport,
+            concurrency=self.config.fleet_concurrency,
+            timeout=self.config.fleet_timeout,
+            on_result=self._on_result,
+        )
+
+    def _on_result(self, status: HostStatus) -> None:
+        self.results[status.host] = status
+        self.pending.discard(status.host)
+        self._show_rows()
+
+    def action_sort(self, key: str) -> None:
+        self.sort_key = key
+        self._show_rows()
+
+    def _sort_value(self, host: str) -> tuple:
+        status = self.results.get(host)
+        if self.sort_key == "host":
+            return False, host.lower()
+        if status is None or not status.ok:
+            # Unreachable and not-yet-answered hosts sink to the bottom
+            return True, host.lower()
+        info = status.info
+        value = {
+            "deep_freeze": info.deep_freeze,
+            "disk": info.disk_free_gb,
+            "uptime": info.boot_time or "~",
+            "latency": status.latency_ms or 0.0,
+        }[self.sort_key]
+        return False, value
+
+    def _show_rows(self) -> None:
+        table = self.query_one("#fleet-table", DataTable)
+        selected = self._selected_host()
+        table.clear()
+        for host in sorted(self.hosts, key=self._sort_value):
+            table.add_row(*self._row(host), key=host)
+        if selected is not None and selected in table.rows:
+            table.move_cursor(row=table.get_row_index(selected))
+
+        online = sum(1 for s in self.results.values() if s.ok)
+        frozen = sum(1 for s in self.results.values() if s.ok and s.info.deep_freeze == "FROZEN")
+        waiting = f" · {len(self.pending)} waiting" if self.pending else ""
+        self.query_one("#fleet-summary", Static).update(
+            f"[dim]{online}/{len(self.hosts)} online · {frozen} frozen{waiting} · "
+            f"sorted by {self.SORT_LABELS[self.sort_key]}[/dim]"
+        )
+
+    def _row(self, host: str) -> tuple:
+        status = self.results.get(host)
+        waiting = host in self.pending
+        if status is None or not status.ok:
+            text = "[dim]querying...[/dim]" if waiting else f"[#ff4444]{status.error if status else ''}[/#ff4444]"
+            return (host, text, "", "", "", "", "", "")
+        info = status.info
+        used = 100 - info.disk_free_gb / info.disk_total_gb * 100 if info.disk_total_gb else 0.0
+        return (
+            host,
+            "[dim]refreshing...[/dim]" if waiting else "[#4caf50]online[/#4caf50]",
+            f"[{info.df_color}]{info.deep_freeze}[/]",
+            f"[{_load_color(used)}]{info.disk_free_gb:.1f} GB[/]",
+            info.uptime,
+            info.net_ip,
+            info.model,
+            f"{status.latency_ms:.0f} ms",
+        )
+
+    def _selected_host(self) -> Optional[str]:
+        table = self.query_one("#fleet-table", DataTable)
+        if table.row_count == 0:
+            return None
+        try:
+            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        except Exception:
+            return None
+        return row_key.value
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Pipeline Screen
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class PipelineScreen(ModalScreen):
+    """Progress of a pipeline run, one row per step, then its report.
+
+    Closing the screen does not stop the run; its steps keep going as
+    ordinary jobs and running the pipeline again reopens this view.
+    """
+
+    BINDINGS = [
+        Binding("escape", "close_screen", "Close", priority=True),
+        Binding("t", "tail_step", "Tail"),
+        Binding("k", "kill_step", "Kill"),
+        Binding("c", "cancel_run", "Cancel pipeline"),
+    ]
+
+    STATUS_STYLES = {
+        WAITING: "#888888",
+        RUNNING: "#00d4ff",
+        SUCCEEDED: "#4caf50",
+        FAILED: "#ff4444",
+        SKIPPED: "#ff9800",
+        CANCELLED: "#ff9800",
+    }
+
+    def __init__(self, run: PipelineRun) -> None:
+        super().__init__()
+        self.run = run
+
+    def action_close_screen(self) -> None:
+        """Close the pipeline screen (the run carries on)."""
+        self.dismiss()
+
+    def compose(self) -> ComposeResult:
+        with Container(id="pipeline-dialog"):
+            yield Static(f"🧰  {self.run.pipeline.name.upper()}", id="pipeline-title")
+            yield Static("", id="pipeline-summary")
+            yield DataTable(id="pipeline-table", cursor_type="row", zebra_stripes=True)
+            yield Static(
+                "[dim][bold]Enter[/bold] Tail  [bold]K[/bold] Kill step  "
+                "[bold]C[/bold] Cancel pipeline  [bold]Esc[/bold] Close[/dim]",
+                id="pipeline-footer",
+            )
+
+    def on_mount(self) -> None:
+        table = self.query_one("#pipeline-table", DataTable)
+        table.add_columns("Step", "Tool", "After", "Status", "Time", "Exit", "Last output")
+        self._refresh_table()
+        self.set_interval(1.0, self._refresh_table)
+        table.focus()
+
+    def _refresh_table(self) -> None:
+        table = self.query_one("#pipeline-table", DataTable)
+        selected = self._selected_step()
+        table.clear()
+        for step in self.run.steps:
+            color = self.STATUS_STYLES.get(step.status, "#888888")
+            status = step.status
+            if step.status == RUNNING and step.job.status == QUEUED:
+                status = "queued"
+            if step.reason:
+                status += f" ({step.reason})"
+            if step.job is None:
+                last = ""
+            elif not step.job.capture:
+                last = "[dim](own window)[/dim]" if step.plan.gui else "[dim](own console)[/dim]"
+            else:
+                # Plain Text so tool output is never parsed as markup
+                last = Text(step.job.output[-1][:60]) if step.job.output else ""
+            table.add_row(
+                step.step.id,
+                step.name,
+                ", ".join(step.step.after) or "-",
+                f"[{color}]{status}[/{color}]",
+                format_duration(step.elapsed) if step.job and step.job.started_at else "-",
+                "-" if step.exit_code is None else str(step.exit_code),
+                last,
+                key=step.step.id,
+            )
+        if selected is not None and selected in table.rows:
+            table.move_cursor(row=table.get_row_index(selected))
+        self.query_one("#pipeline-summary", Static).update(self._summary())
+
+    def _summary(self) -> str:
+        run = self.run
+        report = run.report()
+        counts = run.counts()
+        parts = [
+            f"{counts[state]} {state}"
+            for state in (RUNNING, WAITING, SUCCEEDED, FAILED, SKIPPED, CANCELLED)
+            if counts.get(state)
+        ]
+        if not run.done:
+            return f"[dim]{' · '.join(parts)} · {format_duration(run.elapsed)} elapsed[/dim]"
+        verdict = "[#4caf50]✔ Done[/#4caf50]" if run.ok else "[#ff4444]✘ Finished with problems[/#ff4444]"
+        return (
+            f"{verdict}  [dim]{' · '.join(parts)} · took {format_duration(run.elapsed)}, "
+            f"{format_duration(report['serial_seconds'])} one at a time[/dim]"
+        )
+
+    def _selected_step(self) -> Optional[str]:
+        table = self.query_one("#pipeline-table", DataTable)
+        if table.row_count == 0:
+            return None
+        try:
+            row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+        except Exception:
+            return None
+        return row_key.value
+
+    def _selected_job(self) -> Optional[Job]:
+        step_id = self._selected_step()
+        step = next((s for s in self.run.steps if s.step.id == step_id), None)
+        return step.job if step else None
+
+    @on(DataTable.RowSelected, "#pipeline-table")
+    def on_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Enter on a row tails that step's job."""
+        self.action_tail_step()
+
+    def action_tail_step(self) -> None:
+        job = self._selected_job()
+        if job is not None:
+            self.app.push_screen(ToolOutputScreen(f"📋 {job.name}", job=job))
+
+    def action_kill_step(self) -> None:
+        job = self._selected_job()
+        if job is not None and self.app.jobs.cancel(job.id):
+            self.app.notify(f"{job.name} cancelled.", title=self.run.pipeline.name)
+        self._refresh_table()
+
+    def action_cancel_run(self) -> None:
+        if not self.run.done:
+            self.run.cancel()
+            self.app.notify("Pipeline cancelled.", title=self.run.pipeline.name, severity="warning")
+        self._refresh_table()
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -387,13 +1322,53 @@ class ExitConfirmScreen(ModalScreen[bool]):
         self.dismiss(False)
 
 
+class ConfirmScreen(ModalScreen[bool]):
+    """Generic yes/no confirmation for destructive actions."""
+
+    BINDINGS = [
+        Binding("y", "confirm", "Yes"),
+        Binding("n", "cancel", "No"),
+        Binding("escape", "cancel", "Cancel", priority=True),
+    ]
+
+    def __init__(self, message: str, confirm_label: str = "Yes") -> None:
+        super().__init__()
+        self.message = message
+        self.confirm_label = confirm_label
+
+    def compose(self) -> ComposeResult:
+        with Container(id="confirm-dialog"):
+            yield Static(self.message, id="confirm-title")
+            with Horizontal(id="confirm-buttons"):
+                yield Button(self.confirm_label, id="btn-confirm-yes", variant="error")
+                yield Button("No, Go Back", id="btn-confirm-no", variant="primary")
+
+    def action_confirm(self) -> None:
+        self.dismiss(True)
+
+    def action_cancel(self) -> None:
+        self.dismiss(False)
+
+    @on(Button.Pressed, "#btn-confirm-yes")
+    def on_yes(self) -> None:
+        self.dismiss(True)
+
+    @on(Button.Pressed, "#btn-confirm-no")
+    def on_no(self) -> None:
+        self.dismiss(False)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Deep Freeze Toggle Screen
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
-class DeepFreezeScreen(ModalScreen[bool]):
-    """Toggle Deep Freeze between frozen and thawed states."""
+class DeepFreezeScreen(ModalScreen[Optional[subprocess.Popen]]):
+    """Toggle Deep Freeze between frozen and thawed states.
+
+    Dismisses with the toggle script's process (None if nothing was
+    launched) so the app can re-read the state once it exits.
+    """
 
     BINDINGS = [
         Binding("y", "confirm", "Yes"),
@@ -442,14 +1417,15 @@ class DeepFreezeScreen(ModalScreen[bool]):
 
     def action_confirm(self) -> None:
         if self.current_status == "Not Installed":
-            self.dismiss(False)
+            self.dismiss(None)
             return
 
         toggle_script = os.path.join(
             self.script_root, "sfu-tools", "Toggle-DeepFreeze.ps1"
         )
+        toggle = None
         if os.path.exists(toggle_script):
-            subprocess.Popen(
+            toggle = subprocess.Popen(
                 [
                     "powershell",
                     "-NoProfile",
@@ -468,13 +1444,13 @@ class DeepFreezeScreen(ModalScreen[bool]):
             self.app.notify(
                 "Toggle script not found!", title="Error", severity="error"
             )
-        self.dismiss(True)
+        self.dismiss(toggle)
 
     def action_cancel(self) -> None:
-        self.dismiss(False)
+        self.dismiss(None)
 
     def on_key(self, event) -> None:
         """Handle key presses - ensure ESC always works."""
         if event.key == "escape":
             event.stop()
-            self.dismiss(False)
+            self.dismiss(None)
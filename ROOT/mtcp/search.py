@@ -0,0 +1,107 @@
+"""Fuzzy search over tools and slash commands for MTCP TUI."""
+
+import heapq
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    """Something the user can find and run from search mode."""
+    kind: str        # "tool" or "command"
+    key: str         # tool id or command name
+    title: str
+    subtitle: str = ""
+    description: str = ""
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _trigrams(text: str) -> set[str]:
+    """Trigrams of each word, padded so short words and prefixes count."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """Trigram index over search entries.
+
+    The index maps each trigram of an entry's title and description to
+    the entries containing it, so a query only scores entries that share
+    at least one trigram with it instead of scanning everything. Results
+    are memoized per query string, which makes backspacing free.
+    """
+
+    MEMO_SIZE = 64
+
+    def __init__(self, entries: Iterable[SearchEntry] = ()) -> None:
+        self.entries: list[SearchEntry] = []
+        self._titles: list[str] = []
+        self._texts: list[str] = []
+        self._postings: dict[str, list[int]] = {}
+        self._memo: OrderedDict[tuple[str, int], list[SearchEntry]] = OrderedDict()
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry: SearchEntry) -> None:
+        index = len(self.entries)
+        title = _normalize(entry.title).lstrip("/")
+        text = _normalize(f"{entry.title} {entry.subtitle} {entry.description}")
+        self.entries.append(entry)
+        self._titles.append(title)
+        self._texts.append(text)
+        for gram in _trigrams(text):
+            self._postings.setdefault(gram, []).append(index)
+        self._memo.clear()
+
+    def search(self, query: str, limit: int = 50) -> list[SearchEntry]:
+        """Return up to ``limit`` entries ranked best-first."""
+        query = _normalize(query).lstrip("/")
+        if not query:
+            return []
+        memo_key = (query, limit)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            self._memo.move_to_end(memo_key)
+            return cached
+
+        grams = _trigrams(query)
+        postings = self._postings
+        hits = Counter(chain.from_iterable(postings.get(g, ()) for g in grams))
+
+        # Require a reasonable share of the query's trigrams to match so
+        # typos still hit but unrelated entries sharing one gram do not.
+        min_hits = max(1, len(grams) // 2)
+        titles = self._titles
+        texts = self._texts
+        n_grams = len(grams)
+        scored = []
+        for index, count in hits.items():
+            if count < min_hits:
+                continue
+            title = titles[index]
+            score = count / n_grams
+            if title.startswith(query):
+                score += 2.0
+            elif query in title:
+                score += 1.0
+            elif query in texts[index]:
+                score += 0.5
+            scored.append((-score, len(title), index))
+        best = heapq.nsmallest(limit, scored)
+        results = [self.entries[index] for _, _, index in best]
+
+        self._memo[memo_key] = results
+        if len(self._memo) > self.MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return results
@@ -0,0 +1,58 @@
+"""Startup phase timings for ``python -m mtcp --profile-startup``.
+
+``mark`` records how long after interpreter start each phase finished;
+``report`` prints them once the TUI has exited. Both are no-ops unless
+profiling was enabled, so the marks can stay in the startup path.
+"""
+
+import sys
+import time
+from typing import Optional, TextIO
+
+_enabled = False
+# Set by --exit-after-startup: quit once the first frame is up (benchmarks)
+exit_after_first_frame = False
+_marks: list[tuple[str, float]] = []
+_seen: set[str] = set()
+
+
+def _process_start() -> float:
+    """perf_counter() value at process start (or at first import of this module)."""
+    now = time.perf_counter()
+    try:
+        import psutil
+        return now - max(0.0, time.time() - psutil.Process().create_time())
+    except Exception:
+        return now
+
+
+_t0 = _process_start() if "--profile-startup" in sys.argv else time.perf_counter()
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def mark(phase: str) -> None:
+    """Record that ``phase`` just finished (only its first occurrence)."""
+    if _enabled and phase not in _seen:
+        _seen.add(phase)
+        _marks.append((phase, time.perf_counter()))
+
+
+def report(stream: Optional[TextIO] = None) -> None:
+    """Print each phase's finish time and its own duration in ms."""
+    if not _enabled or not _marks:
+        return
+    stream = stream or sys.stderr
+    width = max(len("phase"), *(len(phase) for phase, _ in _marks))
+    print(f"{'phase':<{width}}  {'at ms':>9}  {'took ms':>9}", file=stream)
+    previous = _t0
+    # Background phases (config, sysinfo) finish out of order
+    for phase, at in sorted(_marks, key=lambda m: m[1]):
+        print(
+            f"{phase:<{width}}  {(at - _t0) * 1000:>9.1f}  {(at - previous) * 1000:>9.1f}",
+            file=stream,
+        )
+        previous = at
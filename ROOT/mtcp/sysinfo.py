@@ -1,12 +1,22 @@
 """System information gathering for MTCP TUI."""
 
+import json
 import os
 import platform
-import socket
-import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional
+
+from .deepfreeze import DeepFreezeStatus, DfcBackend, get_deep_freeze
+from .netinfo import get_network_inventory
+from .netprobe import get_connectivity_probe
+from .paths import cache_path, write_atomic
 
 
 @dataclass
@@ -70,104 +80,390 @@ class SystemInfo:
         return "Unknown"
 
 
-def get_system_info(df_path: str = r"C:\Windows\SysWOW64\DFC.exe") -> SystemInfo:
+def get_system_info(df_path: Optional[str] = None) -> SystemInfo:
     """Gather system information using WMI and other Windows APIs."""
+    return collect_system_info(df_path=df_path)
+
+
+def collect_system_info(
+    on_update: Optional[Callable[[SystemInfo], None]] = None,
+    df_path: Optional[str] = None,
+    max_workers: int = 4,
+    use_cache: bool = True,
+    on_static_change: Optional[Callable[[dict], None]] = None,
+) -> SystemInfo:
+    """Gather system information, running each section concurrently.
+
+    Every collector returns a dict of ``SystemInfo`` fields. Collectors are
+    submitted to a thread pool and merged on the calling thread as they
+    complete; ``on_update`` (if given) receives a copy of the partially
+    filled ``SystemInfo`` after each merge so the UI can render fast
+    sections before slow WMI classes finish.
+
+    With ``use_cache``, static hardware facts are served from the on-disk
+    cache (see :func:`load_static_cache`) and only the dynamic collectors
+    run before returning. The WMI collectors then revalidate the cache on
+    a background thread and, if any static field changed, hand just those
+    fields to ``on_static_change``. It gets a dict rather than a whole
+    ``SystemInfo``, because the caller's copy may have moved on since
+    (e.g. a new Deep Freeze state), and it is called on that thread.
+
+    Deep Freeze comes from the shared, cached provider (mtcp.deepfreeze)
+    unless ``df_path`` names a specific DFC.exe to run.
+    """
     info = SystemInfo()
-    
-    # Get current username
-    info.username = os.environ.get("USERNAME", "Unknown")
+    # Cheap fields first so the header has something to show immediately
+    _apply(info, _collect_identity())
+
+    cache_key = _static_cache_key(info.hostname) if use_cache else None
+    cached = load_static_cache(cache_key) if cache_key else None
+    if cached:
+        _apply(info, cached)
+        _apply(info, _uptime_fields(info.boot_time))
+    if on_update:
+        on_update(replace(info))
+
+    collectors = [*_DYNAMIC_COLLECTORS, partial(_collect_deep_freeze, df_path)]
+    if not cached:
+        collectors.extend(_STATIC_COLLECTORS)
+    _run_collectors(info, collectors, on_update, max_workers)
+
+    if cached:
+        threading.Thread(
+            target=_revalidate_static_cache,
+            args=(replace(info), cache_key, cached, on_static_change, max_workers),
+            name="mtcp-sysinfo-revalidate",
+            daemon=True,
+        ).start()
+    elif cache_key:
+        save_static_cache(cache_key, info)
+
+    return info
 
+
+def _run_collectors(
+    info: SystemInfo,
+    collectors: list[Callable[[], dict]],
+    on_update: Optional[Callable[[SystemInfo], None]],
+    max_workers: int,
+) -> None:
+    """Run collectors on a pool, merging each result into ``info``."""
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="mtcp-sysinfo"
+    ) as pool:
+        futures = [pool.submit(collector) for collector in collectors]
+        for future in as_completed(futures):
+            try:
+                fields = future.result()
+            except Exception:
+                continue
+            if not fields:
+                continue
+            _apply(info, fields)
+            if on_update:
+                on_update(replace(info))
+
+
+def _apply(info: SystemInfo, fields: dict) -> None:
+    """Copy collector results onto ``info``."""
+    for name, value in fields.items():
+        setattr(info, name, value)
+
+
+# ── Static info cache ────────────────────────────────────────
+
+# Bump when STATIC_FIELDS or the collectors' formatting changes.
+STATIC_CACHE_VERSION = 1
+STATIC_CACHE_FILE = "sysinfo-static.json"
+
+# Fields that cannot change without a reboot or firmware update.
+STATIC_FIELDS = (
+    "domain",
+    "model",
+    "ram_gb",
+    "os_name",
+    "os_build",
+    "boot_time",
+    "motherboard",
+    "cpu_name",
+    "cpu_cores",
+    "cpu_threads",
+    "gpu_name",
+    "bios_version",
+)
+
+
+def _static_cache_key(hostname: str) -> Optional[dict]:
+    """Build the cache key for this machine and boot.
+
+    Both parts are read without WMI: boot time from psutil and the BIOS
+    version from the registry (or DMI on Linux). A reboot or BIOS flash
+    therefore invalidates the cached entry.
+    """
     try:
-        import pythoncom
-        import wmi
+        import psutil
+        # psutil's boot time jitters by a second or so on Windows
+        boot = int(psutil.boot_time()) // 60
+    except Exception:
+        return None
+    return {"machine": hostname, "boot": boot, "bios": _read_bios_version()}
+
 
-        # Initialize COM for this thread (worker threads need their own apartment)
-        pythoncom.CoInitialize()
+def _read_bios_version() -> str:
+    """Read the BIOS version cheaply, or "" if unavailable."""
+    if sys.platform == "win32":
         try:
-            c = wmi.WMI()
+            import winreg
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\BIOS"
+            ) as key:
+                return str(winreg.QueryValueEx(key, "BIOSVersion")[0])
+        except Exception:
+            return ""
+    try:
+        with open("/sys/class/dmi/id/bios_version", "r") as f:
+            return f.read().strip()
+    except Exception:
+        return ""
 
-            # Computer system
-            for cs in c.Win32_ComputerSystem():
-                info.hostname = os.environ.get("COMPUTERNAME", cs.Name)
-                info.domain = cs.Domain or ""
-                info.model = f"{cs.Manufacturer} {cs.Model}".strip()
-                info.ram_gb = round(int(cs.TotalPhysicalMemory) / (1024**3), 1)
 
-            # OS
-            for os_info in c.Win32_OperatingSystem():
-                info.os_name = os_info.Caption.strip()
-                info.os_build = os_info.BuildNumber
-                boot_dt = _parse_wmi_datetime(os_info.LastBootUpTime)
-                if boot_dt:
-                    info.boot_time = boot_dt.strftime("%Y-%m-%d %H:%M:%S")
-                    delta = datetime.now() - boot_dt
-                    days = delta.days
-                    hours, remainder = divmod(delta.seconds, 3600)
-                    minutes = remainder // 60
-                    info.uptime = f"{days}d {hours}h {minutes}m"
-
-            # Motherboard
-            for board in c.Win32_BaseBoard():
-                sn = board.SerialNumber or "N/A"
-                info.motherboard = f"{board.Product} (S/N: {sn})"
-            
-            # CPU
-            for cpu in c.Win32_Processor():
-                name = cpu.Name.strip()
-                # Shorten common names
-                name = name.replace("Intel(R) Core(TM) ", "Intel ")
-                name = name.replace("AMD Ryzen ", "Ryzen ")
-                name = name.replace(" CPU", "")
-                name = name.replace(" Processor", "")
-                name = name.replace("  ", " ")
-                info.cpu_name = name[:35] if name else "Unknown"
-                info.cpu_cores = cpu.NumberOfCores or 0
-                info.cpu_threads = cpu.NumberOfLogicalProcessors or 0
-                break  # Only first CPU
-            
-            # GPU
-            for gpu in c.Win32_VideoController():
-                name = gpu.Name or "Unknown"
-                # Shorten common names
-                name = name.replace("NVIDIA ", "")
-                name = name.replace("AMD ", "")
-                name = name.replace("Intel(R) ", "Intel ")
-                name = name.replace("Graphics", "").strip()
-                info.gpu_name = name[:35] if name else "Unknown"
-                break  # Only first GPU
-            
-            # BIOS
-            for bios in c.Win32_BIOS():
-                info.bios_version = bios.SMBIOSBIOSVersion or "Unknown"
-                break
+def _read_cpu_name() -> str:
+    """Read the CPU's marketing name cheaply, or "" if unavailable.
+
+    The same string Win32_Processor reports, from the registry (or
+    /proc/cpuinfo on Linux), so the live panel has it on its first tick.
+    """
+    if sys.platform == "win32":
+        try:
+            import winreg
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+            ) as key:
+                return str(winreg.QueryValueEx(key, "ProcessorNameString")[0]).strip()
+        except Exception:
+            return ""
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.partition(":")[2].strip()
+    except Exception:
+        pass
+    return ""
+
+
+def _read_static_cache_file(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STATIC_CACHE_VERSION:
+        return {}
+    return data
+
+
+def load_static_cache(key: dict) -> Optional[dict]:
+    """Return cached static fields for ``key``, or None on a miss."""
+    data = _read_static_cache_file(cache_path(STATIC_CACHE_FILE))
+    entry = data.get("machines", {}).get(key["machine"])
+    if not entry:
+        return None
+    if entry.get("boot") != key["boot"] or entry.get("bios") != key["bios"]:
+        return None
+    fields = entry.get("fields", {})
+    return {name: fields[name] for name in STATIC_FIELDS if name in fields}
+
+
+def save_static_cache(key: dict, info: SystemInfo) -> None:
+    """Persist the static fields of ``info`` under ``key``."""
+    path = cache_path(STATIC_CACHE_FILE)
+    data = _read_static_cache_file(path)
+    machines = data.get("machines", {})
+    machines[key["machine"]] = {
+        "boot": key["boot"],
+        "bios": key["bios"],
+        "fields": {name: getattr(info, name) for name in STATIC_FIELDS},
+    }
+    payload = {"version": STATIC_CACHE_VERSION, "machines": machines}
+    try:
+        write_atomic(path, json.dumps(payload, indent=2).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def _revalidate_static_cache(
+    info: SystemInfo,
+    key: dict,
+    cached: dict,
+    on_change: Optional[Callable[[dict], None]],
+    max_workers: int,
+) -> None:
+    """Re-run the WMI collectors and refresh the cache if anything moved."""
+    try:
+        _run_collectors(info, list(_STATIC_COLLECTORS), None, max_workers)
+        changed = {
+            name: getattr(info, name)
+            for name in STATIC_FIELDS
+            if cached.get(name) != getattr(info, name)
+        }
+        if not changed:
+            return
+        save_static_cache(key, info)
+        if on_change:
+            on_change(changed)
+    except Exception:
+        pass
+
+
+@contextmanager
+def _wmi_connection():
+    """Yield a WMI connection with COM initialized for the current thread.
 
+    Raises ImportError when wmi/pywin32 are unavailable (non-Windows).
+    """
+    import pythoncom
+    import wmi
+
+    # Initialize COM for this thread (worker threads need their own apartment)
+    pythoncom.CoInitialize()
+    try:
+        c = wmi.WMI()
+        try:
+            yield c
+        finally:
             # Explicitly release COM objects before CoUninitialize
             del c
-        finally:
-            pythoncom.CoUninitialize()
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def _collect_identity() -> dict:
+    """Hostname and username from the environment (no WMI needed)."""
+    return {
+        "hostname": os.environ.get("COMPUTERNAME", platform.node()),
+        "username": os.environ.get("USERNAME", "Unknown"),
+    }
 
+
+def _collect_computer_system() -> dict:
+    """Domain, model and RAM from Win32_ComputerSystem."""
+    fields = {}
+    try:
+        with _wmi_connection() as c:
+            for cs in c.Win32_ComputerSystem():
+                fields["hostname"] = os.environ.get("COMPUTERNAME", cs.Name)
+                fields["domain"] = cs.Domain or ""
+                fields["model"] = f"{cs.Manufacturer} {cs.Model}".strip()
+                fields["ram_gb"] = round(int(cs.TotalPhysicalMemory) / (1024**3), 1)
     except ImportError:
         # WMI not available, use fallback
-        info.hostname = os.environ.get("COMPUTERNAME", platform.node())
-        info.os_name = platform.platform()
-        info.ram_gb = _get_ram_fallback()
-    
-    # Disk info via psutil (faster than WMI)
+        fields["ram_gb"] = _get_ram_fallback()
+    return fields
+
+
+def _collect_operating_system() -> dict:
+    """OS caption, build, boot time and uptime from Win32_OperatingSystem."""
+    fields = {}
+    try:
+        with _wmi_connection() as c:
+            for os_info in c.Win32_OperatingSystem():
+                fields["os_name"] = os_info.Caption.strip()
+                fields["os_build"] = os_info.BuildNumber
+                boot_dt = _parse_wmi_datetime(os_info.LastBootUpTime)
+                if boot_dt:
+                    fields.update(_boot_fields(boot_dt))
+    except ImportError:
+        fields["os_name"] = platform.platform()
+    return fields
+
+
+def _uptime_fields(boot_time: str) -> dict:
+    """Recompute uptime from a cached ``boot_time`` string."""
+    try:
+        return _boot_fields(datetime.strptime(boot_time, "%Y-%m-%d %H:%M:%S"))
+    except (TypeError, ValueError):
+        return {}
+
+
+def _boot_fields(boot_dt: datetime) -> dict:
+    """Format boot time and uptime fields from a boot datetime."""
+    delta = datetime.now() - boot_dt
+    days = delta.days
+    hours, remainder = divmod(delta.seconds, 3600)
+    minutes = remainder // 60
+    return {
+        "boot_time": boot_dt.strftime("%Y-%m-%d %H:%M:%S"),
+        "uptime": f"{days}d {hours}h {minutes}m",
+    }
+
+
+def _collect_baseboard() -> dict:
+    """Motherboard product and serial from Win32_BaseBoard."""
+    fields = {}
+    with _wmi_connection() as c:
+        for board in c.Win32_BaseBoard():
+            sn = board.SerialNumber or "N/A"
+            fields["motherboard"] = f"{board.Product} (S/N: {sn})"
+    return fields
+
+
+def _collect_processor() -> dict:
+    """CPU name, cores and threads from Win32_Processor."""
+    fields = {}
+    with _wmi_connection() as c:
+        for cpu in c.Win32_Processor():
+            name = cpu.Name.strip()
+            # Shorten common names
+            name = name.replace("Intel(R) Core(TM) ", "Intel ")
+            name = name.replace("AMD Ryzen ", "Ryzen ")
+            name = name.replace(" CPU", "")
+            name = name.replace(" Processor", "")
+            name = name.replace("  ", " ")
+            fields["cpu_name"] = name[:35] if name else "Unknown"
+            fields["cpu_cores"] = cpu.NumberOfCores or 0
+            fields["cpu_threads"] = cpu.NumberOfLogicalProcessors or 0
+            break  # Only first CPU
+    return fields
+
+
+def _collect_video_controller() -> dict:
+    """GPU name from Win32_VideoController."""
+    fields = {}
+    with _wmi_connection() as c:
+        for gpu in c.Win32_VideoController():
+            name = gpu.Name or "Unknown"
+            # Shorten common names
+            name = name.replace("NVIDIA ", "")
+            name = name.replace("AMD ", "")
+            name = name.replace("Intel(R) ", "Intel ")
+            name = name.replace("Graphics", "").strip()
+            fields["gpu_name"] = name[:35] if name else "Unknown"
+            break  # Only first GPU
+    return fields
+
+
+def _collect_bios() -> dict:
+    """BIOS version from Win32_BIOS."""
+    fields = {}
+    with _wmi_connection() as c:
+        for bios in c.Win32_BIOS():
+            fields["bios_version"] = bios.SMBIOSBIOSVersion or "Unknown"
+            break
+    return fields
+
+
+def _collect_disk() -> dict:
+    """Disk info via psutil (faster than WMI)."""
     try:
         import psutil
         disk = psutil.disk_usage("C:\\")
-        info.disk_total_gb = round(disk.total / (1024**3), 1)
-        info.disk_free_gb = round(disk.free / (1024**3), 1)
     except Exception:
-        pass
-
-    # Network
-    _populate_network(info)
-
-    # Deep Freeze
-    _check_deep_freeze(info, df_path)
-
-    return info
+        return {}
+    return {
+        "disk_total_gb": round(disk.total / (1024**3), 1),
+        "disk_free_gb": round(disk.free / (1024**3), 1),
+    }
 
 
 def _parse_wmi_datetime(wmi_dt: str) -> Optional[datetime]:
@@ -188,85 +484,62 @@ def _get_ram_fallback() -> float:
         return 0.0
 
 
-def _populate_network(info: SystemInfo) -> None:
-    """Populate network information."""
+def _collect_network() -> dict:
+    """Collect network information."""
+    fields = {}
     try:
-        # Get IP address
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        try:
-            s.connect(("8.8.8.8", 80))
-            info.net_ip = s.getsockname()[0]
-        except Exception:
-            info.net_ip = "No IP"
-        finally:
-            s.close()
-
-        # Check internet
-        try:
-            socket.getaddrinfo("www.google.com", 80, socket.AF_INET)
-            info.net_status = "Connected"
-        except socket.gaierror:
-            info.net_status = "Disconnected"
-
-        # Detect connection type via PowerShell (fast)
-        try:
-            result = subprocess.run(
-                ["powershell", "-NoProfile", "-Command",
-                 "Get-NetAdapter | Where-Object { $_.Status -eq 'Up' -and "
-                 "$_.InterfaceDescription -notmatch 'Virtual|Loopback|Bluetooth' } | "
-                 "Select-Object -ExpandProperty InterfaceDescription"],
-                capture_output=True, text=True, timeout=5
-            )
-            adapters = result.stdout.strip().split("\n")
-            types = []
-            for a in adapters:
-                a = a.strip()
-                if not a:
-                    continue
-                if any(w in a.lower() for w in ["wi-fi", "wireless", "802.11"]):
-                    if "WiFi" not in types:
-                        types.append("WiFi")
-                elif any(w in a.lower() for w in ["ethernet", "lan", "gigabit"]):
-                    if "Ethernet" not in types:
-                        types.append("Ethernet")
-            if types:
-                info.net_type = " + ".join(types)
-        except Exception:
-            pass
+        # IP and internet reachability (cached, shared with the live panel)
+        probe = get_connectivity_probe().status()
+        fields["net_ip"] = probe.local_ip or "No IP"
+        fields["net_status"] = "Connected" if probe.online else "Disconnected"
+
+        # Connection type from the adapter table (no process spawn)
+        inventory = get_network_inventory()
+        inventory.refresh()
+        net_type = inventory.connection_type()
+        if net_type:
+            fields["net_type"] = net_type
+        if not probe.local_ip and inventory.primary_ipv4():
+            fields["net_ip"] = inventory.primary_ipv4()
 
     except Exception:
         pass
+    return fields
 
 
-def _check_deep_freeze(info: SystemInfo, df_path: str) -> None:
+def _collect_deep_freeze(df_path: Optional[str]) -> dict:
     """Check Deep Freeze status."""
-    if not os.path.exists(df_path):
-        info.deep_freeze = "Not Installed"
-        info.df_color = "grey"
-        return
-
-    try:
-        result = subprocess.run(
-            [df_path, "get", "/ISFROZEN"],
-            capture_output=True, timeout=5
-        )
-        if result.returncode == 1:
-            info.deep_freeze = "FROZEN"
-            info.df_color = "cyan"
-        elif result.returncode == 0:
-            info.deep_freeze = "THAWED"
-            info.df_color = "red"
-        else:
-            info.deep_freeze = f"Unknown ({result.returncode})"
-            info.df_color = "yellow"
-    except Exception:
-        info.deep_freeze = "Error"
-        info.df_color = "yellow"
-
-
-@dataclass
+    if df_path is None:
+        return get_deep_freeze().status().fields
+    return DeepFreezeStatus(DfcBackend(df_path).query()).fields
+
+
+# Sections gathered concurrently by collect_system_info, roughly fastest
+# first. Static collectors are skipped when the on-disk cache is valid;
+# Deep Freeze is appended per call since it may need ``df_path``. WMI-only
+# collectors raise ImportError off Windows and are skipped.
+_DYNAMIC_COLLECTORS: tuple[Callable[[], dict], ...] = (
+    _collect_disk,
+    _collect_network,
+)
+
+_STATIC_COLLECTORS: tuple[Callable[[], dict], ...] = (
+    _collect_computer_system,
+    _collect_operating_system,
+    _collect_processor,
+    _collect_baseboard,
+    _collect_video_controller,
+    _collect_bios,
+)
+
+
+@dataclass(frozen=True)
 class LiveMetrics:
-    """Live system metrics for monitoring display."""
+    """Live system metrics for monitoring display.
+
+    Instances are immutable snapshots: the sampler thread builds a new one
+    every tick and the UI only ever reads them.
+    """
     cpu_percent: float = 0.0
     cpu_name: str = "CPU"
     cpu_cores: int = 0
@@ -277,74 +550,73 @@ class LiveMetrics:
     disk_used_gb: float = 0.0
     disk_total_gb: float = 0.0
     net_online: bool = False
+    net_type: str = ""
+    net_ip: str = ""
     net_sent_rate: float = 0.0  # KB/s
     net_recv_rate: float = 0.0  # KB/s
 
 
+# Adapters rarely change; re-read them every few samples, not every tick
+NETWORK_INVENTORY_MAX_AGE = 10.0
+
 _last_net_io = None
 _last_net_time = None
 _cached_cpu_name = None
 
 
 def get_live_metrics() -> LiveMetrics:
-    """Get current live system metrics."""
+    """Get current live system metrics.
+
+    This blocks on psutil and, when its cache lapses, the connectivity
+    probe, so call it from :class:`MetricsSampler` rather than from the
+    UI thread.
+    """
     global _last_net_io, _last_net_time, _cached_cpu_name
     
-    metrics = LiveMetrics()
+    values = {}
     
     try:
         import psutil
         
         # CPU (non-blocking, uses interval=None for instant reading)
-        metrics.cpu_percent = psutil.cpu_percent(interval=None)
-        metrics.cpu_cores = psutil.cpu_count(logical=True)
+        values["cpu_percent"] = psutil.cpu_percent(interval=None)
+        values["cpu_cores"] = psutil.cpu_count(logical=True)
         
         # Get CPU name (cached)
         if _cached_cpu_name is None:
-            try:
-                import subprocess
-                result = subprocess.run(
-                    ["powershell", "-NoProfile", "-Command",
-                     "(Get-CimInstance Win32_Processor).Name"],
-                    capture_output=True, text=True, timeout=3
-                )
-                name = result.stdout.strip()
-                # Shorten common names
-                name = name.replace("Intel(R) Core(TM) ", "")
-                name = name.replace("AMD Ryzen ", "Ryzen ")
-                name = name.replace(" CPU", "")
-                name = name.replace(" Processor", "")
-                _cached_cpu_name = name[:20] if name else "CPU"
-            except Exception:
-                _cached_cpu_name = "CPU"
-        metrics.cpu_name = _cached_cpu_name
+            name = _read_cpu_name()
+            # Shorten common names
+            name = name.replace("Intel(R) Core(TM) ", "")
+            name = name.replace("AMD Ryzen ", "Ryzen ")
+            name = name.replace(" CPU", "")
+            name = name.replace(" Processor", "")
+            _cached_cpu_name = name[:20] if name else "CPU"
+        values["cpu_name"] = _cached_cpu_name
         
         # Memory
         mem = psutil.virtual_memory()
-        metrics.memory_percent = mem.percent
-        metrics.memory_used_gb = round(mem.used / (1024**3), 1)
-        metrics.memory_total_gb = round(mem.total / (1024**3), 1)
+        values["memory_percent"] = mem.percent
+        values["memory_used_gb"] = round(mem.used / (1024**3), 1)
+        values["memory_total_gb"] = round(mem.total / (1024**3), 1)
         
         # Disk (C: drive)
         try:
             disk = psutil.disk_usage("C:\\")
-            metrics.disk_percent = disk.percent
-            metrics.disk_used_gb = round(disk.used / (1024**3), 1)
-            metrics.disk_total_gb = round(disk.total / (1024**3), 1)
+            values["disk_percent"] = disk.percent
+            values["disk_used_gb"] = round(disk.used / (1024**3), 1)
+            values["disk_total_gb"] = round(disk.total / (1024**3), 1)
         except Exception:
             pass
         
-        # Network status check
-        try:
-            import socket
-            socket.setdefaulttimeout(1)
-            socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect(("8.8.8.8", 53))
-            metrics.net_online = True
-        except Exception:
-            metrics.net_online = False
+        # Network status check (cached; only probes when the TTL lapses)
+        probe = get_connectivity_probe().status()
+        values["net_online"] = probe.online
+        inventory = get_network_inventory()
+        inventory.refresh(max_age=NETWORK_INVENTORY_MAX_AGE)
+        values["net_type"] = inventory.connection_type()
+        values["net_ip"] = probe.local_ip or inventory.primary_ipv4() or ""
         
         # Network rate calculation
-        import time
         current_time = time.time()
         net_io = psutil.net_io_counters()
         
@@ -353,8 +625,8 @@ def get_live_metrics() -> LiveMetrics:
             if time_delta > 0:
                 bytes_sent = net_io.bytes_sent - _last_net_io.bytes_sent
                 bytes_recv = net_io.bytes_recv - _last_net_io.bytes_recv
-                metrics.net_sent_rate = (bytes_sent / 1024) / time_delta  # KB/s
-                metrics.net_recv_rate = (bytes_recv / 1024) / time_delta  # KB/s
+                values["net_sent_rate"] = (bytes_sent / 1024) / time_delta  # KB/s
+                values["net_recv_rate"] = (bytes_recv / 1024) / time_delta  # KB/s
         
         _last_net_io = net_io
         _last_net_time = current_time
@@ -362,4 +634,122 @@ def get_live_metrics() -> LiveMetrics:
     except ImportError:
         pass
     
-    return metrics
+    return LiveMetrics(**values)
+
+
+class MetricsSampler:
+    """Collects :class:`LiveMetrics` on a dedicated background thread.
+
+    The sampler owns all psutil/network calls and runs at its own cadence.
+    Each tick publishes a fresh immutable snapshot by rebinding
+    ``self._latest``; readers just grab the reference, so no lock is needed
+    and a slow tick (e.g. the network probe timing out) never blocks them.
+    If a ``history`` (see mtcp.history) is given, every sample is also
+    recorded into it. While ``detailed`` is set, each tick additionally
+    collects per-core/disk/NIC metrics (see mtcp.monitor) into
+    ``latest_detail``; it is off by default because nobody looks at them
+    unless the monitor screen is open.
+
+    ``source`` produces each sample (``get_live_metrics`` unless the app
+    reads them from an agent, see mtcp.agent) and ``on_sample`` is called
+    on the sampler thread with every new snapshot.
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        history=None,
+        on_sample: Optional[Callable[[LiveMetrics], None]] = None,
+    ) -> None:
+        self.interval = interval
+        self.history = history
+        self.source: Callable[[], LiveMetrics] = get_live_metrics
+        self.on_sample = on_sample
+        self.detailed = False
+        self._latest = LiveMetrics()
+        self._sampled = False
+        self._latest_detail = None
+        self._detail_collector = None
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def latest(self) -> LiveMetrics:
+        """The most recently published snapshot."""
+        return self._latest
+
+    @property
+    def has_sample(self) -> bool:
+        """Whether ``latest`` is a real reading, not the initial placeholder."""
+        return self._sampled
+
+    @property
+    def latest_detail(self):
+        """The most recent DetailedMetrics, or None before the first one."""
+        return self._latest_detail
+
+    def set_detailed(self, enabled: bool) -> None:
+        """Turn the expanded (per-device) collection on or off.
+
+        Only flips the flag; the sampler thread primes the collector as
+        soon as it sees it, so the caller (usually the UI) never waits.
+        """
+        self.detailed = enabled
+        if enabled and self._detail_collector is None:
+            self._wake.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling (no-op if already running)."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._wake.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="mtcp-metrics-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Ask the sampler thread to exit and wait briefly for it."""
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _sample_detail(self) -> None:
+        try:
+            if self._detail_collector is None:
+                from .monitor import DetailedCollector
+                self._detail_collector = DetailedCollector()
+            # The first sample only primes the counters, rates need two
+            self._latest_detail = self._detail_collector.sample()
+        except Exception:
+            pass
+
+    def _run(self) -> None:
+        next_tick = 0.0
+        while not self._stop_event.is_set():
+            if time.monotonic() >= next_tick:
+                try:
+                    self._latest = self.source()
+                    self._sampled = True
+                    if self.history is not None:
+                        self.history.record(self._latest)
+                    if self.on_sample is not None:
+                        self.on_sample(self._latest)
+                except Exception:
+                    pass
+                if self.detailed:
+                    self._sample_detail()
+                next_tick = time.monotonic() + self.interval
+            elif self.detailed and self._detail_collector is None:
+                # Woken by set_detailed: prime now rather than next tick
+                self._sample_detail()
+            self._wake.wait(max(0.0, next_tick - time.monotonic()))
+            self._wake.clear()
@@ -0,0 +1,184 @@
+"""Update checking and installation for MTCP TUI."""
+
+import json
+import os
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Optional
+
+from .paths import cache_path, write_atomic
+
+REPO_OWNER = "TA-Softies"
+REPO_NAME = "mtcp"
+VERSION_URL = (
+    f"https://raw.githubusercontent.com/{REPO_OWNER}/{REPO_NAME}/main/"
+    "ROOT/sfu-tools/config.json"
+)
+DOWNLOAD_URL = f"https://github.com/{REPO_OWNER}/{REPO_NAME}/archive/refs/heads/main.zip"
+
+UPDATE_CACHE_FILE = "update-check.json"
+UPDATE_CACHE_VERSION = 1
+DEFAULT_UPDATE_TTL = 3600.0  # seconds
+
+
+def compare_versions(current: str, remote: str) -> bool:
+    """Return True if ``remote`` is newer than ``current``.
+
+    Mirrors Compare-Versions in Check-Update.ps1: dotted integer parts,
+    missing parts count as 0, and anything unparsable is "not newer".
+    """
+    try:
+        current_parts = [int(p) for p in current.split(".")]
+        remote_parts = [int(p) for p in remote.split(".")]
+    except (AttributeError, ValueError):
+        return False
+    length = max(len(current_parts), len(remote_parts))
+    current_parts += [0] * (length - len(current_parts))
+    remote_parts += [0] * (length - len(remote_parts))
+    return remote_parts > current_parts
+
+
+class UpdateChecker:
+    """Fetches the remote ``meta.version`` once and shares the answer.
+
+    The remote version is cached in memory and on disk together with the
+    response's ETag/Last-Modified. Within ``ttl`` the cached answer is
+    returned without touching the network; after that a conditional GET
+    revalidates it, so an unchanged config costs a 304 instead of a full
+    download. Concurrent callers wait for a single in-flight fetch.
+    """
+
+    def __init__(
+        self,
+        url: str = VERSION_URL,
+        download_url: str = DOWNLOAD_URL,
+        ttl: float = DEFAULT_UPDATE_TTL,
+        timeout: float = 5.0,
+        cache_file: Optional[str] = None,
+    ) -> None:
+        self.url = url
+        self.download_url = download_url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.cache_file = cache_file or cache_path(UPDATE_CACHE_FILE)
+        self._entry: Optional[dict] = None
+        self._lock = threading.Lock()
+
+    def check(self, current_version: str, force: bool = False) -> Optional[dict]:
+        """Return update info for ``current_version``, or None if unknown.
+
+        The dict has the same keys Check-Update.ps1 produced:
+        ``UpdateAvailable``, ``CurrentVersion``, ``RemoteVersion`` and,
+        when an update is available, ``DownloadUrl``.
+        """
+        with self._lock:
+            entry = self._entry or self._load_cache()
+            fresh = entry and time.time() - entry["checked_at"] < self.ttl
+            if force or not fresh:
+                entry = self._fetch(entry) or entry
+            self._entry = entry
+
+        if not entry:
+            return None
+        remote_version = entry["remote_version"]
+        if compare_versions(current_version, remote_version):
+            return {
+                "UpdateAvailable": True,
+                "CurrentVersion": current_version,
+                "RemoteVersion": remote_version,
+                "DownloadUrl": self.download_url,
+            }
+        return {
+            "UpdateAvailable": False,
+            "CurrentVersion": current_version,
+            "RemoteVersion": remote_version,
+        }
+
+    def _fetch(self, entry: Optional[dict]) -> Optional[dict]:
+        """GET the remote config, revalidating ``entry`` if we have one."""
+        request = urllib.request.Request(self.url)
+        if entry and entry.get("url") == self.url:
+            if entry.get("etag"):
+                request.add_header("If-None-Match", entry["etag"])
+            if entry.get("last_modified"):
+                request.add_header("If-Modified-Since", entry["last_modified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as resp:
+                data = json.loads(resp.read().decode("utf-8-sig"))
+                new_entry = {
+                    "url": self.url,
+                    "remote_version": str(data["meta"]["version"]),
+                    "etag": resp.headers.get("ETag", ""),
+                    "last_modified": resp.headers.get("Last-Modified", ""),
+                    "checked_at": time.time(),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or not entry:
+                return None
+            new_entry = dict(entry, checked_at=time.time())
+        except Exception:
+            return None
+
+        self._save_cache(new_entry)
+        return new_entry
+
+    def _load_cache(self) -> Optional[dict]:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return None
+        if data.get("version") != UPDATE_CACHE_VERSION or data.get("url") != self.url:
+            return None
+        if "remote_version" not in data or "checked_at" not in data:
+            return None
+        return data
+
+    def _save_cache(self, entry: dict) -> None:
+        payload = dict(entry, version=UPDATE_CACHE_VERSION)
+        try:
+            write_atomic(self.cache_file, json.dumps(payload).encode("utf-8"))
+        except OSError:
+            pass
+
+
+_checker: Optional[UpdateChecker] = None
+
+
+def get_update_checker() -> UpdateChecker:
+    """Return the shared checker (``MTCP_UPDATE_URL`` overrides the URL)."""
+    global _checker
+    if _checker is None:
+        _checker = UpdateChecker(url=os.environ.get("MTCP_UPDATE_URL", VERSION_URL))
+    return _checker
+
+
+def check_for_updates(current_version: str, force: bool = False) -> Optional[dict]:
+    """Check GitHub for a newer version (cached, see UpdateChecker)."""
+    return get_update_checker().check(current_version, force=force)
+
+
+def install_update(download_url: str, current_version: str, new_version: str, script_root: str) -> bool:
+    """Run the install-update script."""
+    install_script = os.path.join(script_root, "sfu-tools", "Install-Update.ps1")
+    if not os.path.exists(install_script):
+        return False
+
+    try:
+        subprocess.Popen(
+            [
+                "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass",
+                "-File", install_script,
+                "-DownloadUrl", download_url,
+                "-CurrentVersion", current_version,
+                "-NewVersion", new_version,
+            ],
+            creationflags=subprocess.CREATE_NEW_CONSOLE
+        )
+        return True
+    except Exception:
+        return False
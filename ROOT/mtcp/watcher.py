@@ -0,0 +1,161 @@
+"""File change watching for MTCP TUI (config hot-reload)."""
+
+import os
+import sys
+import threading
+from typing import Callable, Optional
+
+# FindFirstChangeNotification filter flags
+_FILE_NOTIFY_CHANGE_FILE_NAME = 0x01
+_FILE_NOTIFY_CHANGE_SIZE = 0x08
+_FILE_NOTIFY_CHANGE_LAST_WRITE = 0x10
+_WAIT_OBJECT_0 = 0
+_INVALID_HANDLE_VALUE = -1
+
+
+def _file_signature(path: str) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of ``path``, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class _ChangeNotification:
+    """Win32 directory change notification handle.
+
+    Lets the watcher sleep in the kernel until something in the directory
+    is written instead of waking up to stat the file.
+    """
+
+    def __init__(self, directory: str) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.FindFirstChangeNotificationW.argtypes = [
+            wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD,
+        ]
+        kernel32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+        kernel32.FindNextChangeNotification.argtypes = [wintypes.HANDLE]
+        kernel32.FindCloseChangeNotification.argtypes = [wintypes.HANDLE]
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        self._kernel32 = kernel32
+
+        handle = kernel32.FindFirstChangeNotificationW(
+            directory,
+            False,
+            _FILE_NOTIFY_CHANGE_FILE_NAME
+            | _FILE_NOTIFY_CHANGE_SIZE
+            | _FILE_NOTIFY_CHANGE_LAST_WRITE,
+        )
+        if not handle or handle == ctypes.c_void_p(_INVALID_HANDLE_VALUE).value:
+            raise OSError(ctypes.get_last_error(), "FindFirstChangeNotification failed")
+        self._handle = handle
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to ``timeout`` seconds; True if the directory changed."""
+        result = self._kernel32.WaitForSingleObject(self._handle, int(timeout * 1000))
+        if result == _WAIT_OBJECT_0:
+            self._kernel32.FindNextChangeNotification(self._handle)
+            return True
+        return False
+
+    def close(self) -> None:
+        if self._handle:
+            self._kernel32.FindCloseChangeNotification(self._handle)
+            self._handle = None
+
+
+class FileWatcher:
+    """Calls ``on_change`` from a background thread when a file changes.
+
+    On Windows the thread waits on a directory change notification; on
+    other platforms (or if that fails, e.g. on some network shares) it
+    polls the file's mtime and size every ``interval`` seconds. Either way
+    a change is only reported once the file has stopped changing for
+    ``debounce`` seconds, so editors that save in several writes trigger a
+    single reload.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        on_change: Callable[[], None],
+        interval: float = 1.0,
+        debounce: float = 0.3,
+    ) -> None:
+        self.path = os.path.abspath(path)
+        self.on_change = on_change
+        self.interval = interval
+        self.debounce = debounce
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching (no-op if already running)."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="mtcp-file-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Ask the watcher thread to exit and wait briefly for it."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        notification = None
+        if sys.platform == "win32":
+            try:
+                notification = _ChangeNotification(os.path.dirname(self.path))
+            except Exception:
+                notification = None
+
+        signature = _file_signature(self.path)
+        try:
+            while not self._stop_event.is_set():
+                if notification is not None:
+                    # The wait returns on any change in the directory, and
+                    # also times out periodically so stop() is noticed.
+                    notification.wait(self.interval)
+                else:
+                    self._stop_event.wait(self.interval)
+
+                current = _file_signature(self.path)
+                if current == signature:
+                    continue
+                current = self._wait_until_stable(current)
+                if current is None or self._stop_event.is_set():
+                    # Deleted (or mid-rename); report it once it is back
+                    signature = current
+                    continue
+                signature = current
+                try:
+                    self.on_change()
+                except Exception:
+                    pass
+        finally:
+            if notification is not None:
+                notification.close()
+
+    def _wait_until_stable(
+        self, signature: Optional[tuple[int, int]]
+    ) -> Optional[tuple[int, int]]:
+        while not self._stop_event.wait(self.debounce):
+            current = _file_signature(self.path)
+            if current == signature:
+                break
+            signature = current
+        return signature
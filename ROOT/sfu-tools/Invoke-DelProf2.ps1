@@ -23,41 +23,54 @@ $DelProf2Exe = Join-Path $DelProf2Dir "Delprof2 1.6.0\DelProf2.exe"
 $TempZip = Join-Path $env:TEMP "DelProf2.zip"
 $DFPath = "C:\Windows\SysWOW64\DFC.exe"
 
-# Check Deep Freeze Status
-if (Test-Path $DFPath) {
+# Check Deep Freeze Status. MTCP passes the state it has already read in
+# MTCP_DEEP_FREEZE, and when it read it in MTCP_DEEP_FREEZE_AT (Unix time).
+# Trust it only if it is a definite FROZEN/THAWED from the last minute
+# (ENV_MAX_AGE in mtcp/deepfreeze.py); otherwise ask DFC.exe as before.
+$isFrozen = $false
+$dfAge = $null
+try {
+    $dfAge = [DateTimeOffset]::UtcNow.ToUnixTimeSeconds() - [long]$env:MTCP_DEEP_FREEZE_AT
+} catch {
+    # Not launched from MTCP, or an unreadable timestamp
+}
+$dfFresh = $env:MTCP_DEEP_FREEZE_AT -and $null -ne $dfAge -and $dfAge -ge 0 -and $dfAge -le 60
+if ($dfFresh -and $env:MTCP_DEEP_FREEZE -in @("FROZEN", "THAWED")) {
+    $isFrozen = $env:MTCP_DEEP_FREEZE -eq "FROZEN"
+} elseif (Test-Path $DFPath) {
     try {
         $result = & $DFPath /ISFROZEN
         $isFrozen = $LASTEXITCODE -eq 1
-        
-        if ($isFrozen) {
-            Write-Host "`n========================================" -ForegroundColor Red
-            Write-Host " WARNING: SYSTEM IS FROZEN" -ForegroundColor Yellow
-            Write-Host "========================================" -ForegroundColor Red
-            Write-Host ""
-            Write-Host "[WARNING] This computer is currently frozen by Deep Freeze." -ForegroundColor Yellow
-            Write-Host "[WARNING] Deleting user profiles on a frozen system will:" -ForegroundColor Yellow
-            Write-Host "  - Only temporarily remove profiles until next reboot" -ForegroundColor Gray
-            Write-Host "  - Profiles will be restored after restart" -ForegroundColor Gray
-            Write-Host ""
-            Write-Host "[RECOMMENDATION] Please thaw the system first using the [D] key" -ForegroundColor Cyan
-            Write-Host "                 from the main menu for permanent changes." -ForegroundColor Cyan
-            Write-Host ""
-            
-            $confirm = Read-Host "Do you want to continue anyway? Type 'YES' to proceed"
-            
-            if ($confirm -ne "YES") {
-                Write-Host "`n[INFO] Operation cancelled. Please thaw the system first." -ForegroundColor Yellow
-                Start-Sleep 2
-                Exit 0
-            }
-            Write-Host "`n[INFO] Proceeding on frozen system (changes will be temporary)..." -ForegroundColor Yellow
-            Start-Sleep 1
-        }
     } catch {
         # If we can't check DF status, just continue
     }
 }
 
+if ($isFrozen) {
+    Write-Host "`n========================================" -ForegroundColor Red
+    Write-Host " WARNING: SYSTEM IS FROZEN" -ForegroundColor Yellow
+    Write-Host "========================================" -ForegroundColor Red
+    Write-Host ""
+    Write-Host "[WARNING] This computer is currently frozen by Deep Freeze." -ForegroundColor Yellow
+    Write-Host "[WARNING] Deleting user profiles on a frozen system will:" -ForegroundColor Yellow
+    Write-Host "  - Only temporarily remove profiles until next reboot" -ForegroundColor Gray
+    Write-Host "  - Profiles will be restored after restart" -ForegroundColor Gray
+    Write-Host ""
+    Write-Host "[RECOMMENDATION] Please thaw the system first using the [D] key" -ForegroundColor Cyan
+    Write-Host "                 from the main menu for permanent changes." -ForegroundColor Cyan
+    Write-Host ""
+    
+    $confirm = Read-Host "Do you want to continue anyway? Type 'YES' to proceed"
+    
+    if ($confirm -ne "YES") {
+        Write-Host "`n[INFO] Operation cancelled. Please thaw the system first." -ForegroundColor Yellow
+        Start-Sleep 2
+        Exit 0
+    }
+    Write-Host "`n[INFO] Proceeding on frozen system (changes will be temporary)..." -ForegroundColor Yellow
+    Start-Sleep 1
+}
+
 # Ensure bin directory exists
 if (-not (Test-Path $BinDir)) {
     New-Item -ItemType Directory -Path $BinDir -Force | Out-Null
@@ -0,0 +1,95 @@
+"""DeepFreezeProvider caching and change notification."""
+
+import os
+
+import pytest
+
+from mtcp import deepfreeze
+from mtcp.deepfreeze import FROZEN, THAWED, DeepFreezeBackend, DeepFreezeProvider
+
+
+class StubBackend(DeepFreezeBackend):
+    """Answers with ``state`` and counts how often it was asked."""
+
+    def __init__(self, state: str = FROZEN) -> None:
+        self.state = state
+        self.calls = 0
+
+    def query(self) -> str:
+        self.calls += 1
+        return self.state
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(deepfreeze.time, "time", lambda: now[0])
+    # status() exports the state; keep it out of the rest of the run
+    monkeypatch.delenv(deepfreeze.ENV_VAR, raising=False)
+    monkeypatch.delenv(deepfreeze.ENV_TIME_VAR, raising=False)
+    return now
+
+
+def test_reading_is_cached_for_ttl(clock):
+    backend = StubBackend()
+    provider = DeepFreezeProvider(backend, ttl=60)
+    assert provider.latest is None
+
+    first = provider.status()
+    clock[0] += 59
+    assert provider.status() is first
+    assert backend.calls == 1
+
+    clock[0] += 1
+    assert provider.status().checked_at == clock[0]
+    assert backend.calls == 2
+    assert os.environ[deepfreeze.ENV_VAR] == FROZEN
+    assert os.environ[deepfreeze.ENV_TIME_VAR] == str(int(clock[0]))
+
+
+def test_force_and_max_age_read_again(clock):
+    backend = StubBackend()
+    provider = DeepFreezeProvider(backend, ttl=300)
+    provider.status()
+
+    clock[0] += 1
+    provider.refresh()
+    assert backend.calls == 2
+
+    clock[0] += 10
+    provider.status(max_age=30)
+    assert backend.calls == 2
+    provider.status(max_age=5)
+    assert backend.calls == 3
+
+
+def test_listeners_hear_only_changes(clock):
+    backend = StubBackend(FROZEN)
+    provider = DeepFreezeProvider(backend, ttl=300)
+    heard = []
+    unsubscribe = provider.subscribe(lambda status: heard.append(status.state))
+
+    provider.status()
+    clock[0] += 1
+    provider.refresh()
+    assert heard == [FROZEN]
+
+    backend.state = THAWED
+    clock[0] += 1
+    provider.refresh()
+    assert heard == [FROZEN, THAWED]
+
+    unsubscribe()
+    backend.state = FROZEN
+    clock[0] += 1
+    provider.refresh()
+    assert heard == [FROZEN, THAWED]
+    assert provider.latest.state == FROZEN
+
+
+def test_a_failing_listener_does_not_stop_the_others(clock):
+    provider = DeepFreezeProvider(StubBackend(), ttl=300)
+    heard = []
+    provider.subscribe(lambda status: 1 / 0)
+    provider.subscribe(heard.append)
+    assert provider.status() == heard[0]
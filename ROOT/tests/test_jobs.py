@@ -0,0 +1,43 @@
+"""JobManager behaviour that the menu and pipelines rely on."""
+
+import sys
+import time
+
+import psutil
+import pytest
+
+from mtcp.jobs import TIMED_OUT, JobManager
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses sh and sleep")
+
+
+def _gone(pid: int) -> bool:
+    try:
+        return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+def test_timeout_kills_grandchildren():
+    jobs = JobManager(max_concurrent=1)
+    job = jobs.submit("sleeper", "sleep 30; echo hi", capture=True, timeout=1)
+
+    # Wait for sh to start sleep, and note sleep's pid
+    children = []
+    deadline = time.monotonic() + 5
+    while not children and time.monotonic() < deadline:
+        if job.pid:
+            try:
+                children = psutil.Process(job.pid).children(recursive=True)
+            except psutil.NoSuchProcess:
+                break
+        time.sleep(0.05)
+    assert children, "the shell never started sleep"
+
+    deadline = time.monotonic() + 10
+    while job.is_active and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert job.status == TIMED_OUT
+    time.sleep(0.2)
+    assert all(_gone(child.pid) for child in children)
@@ -0,0 +1,75 @@
+"""plan_command rules for the commands config.json actually contains."""
+
+import pytest
+
+from mtcp.launch import CAPTURE, CONSOLE, DEFAULT_TIMEOUT, GUI, plan_command, split_command
+
+CHECK_DISK = 'powershell.exe -ExecutionPolicy Bypass -File "$PSScriptRoot\\sfu-tools\\Invoke-CheckDisk.ps1"'
+
+
+def test_msc_snap_in_opens_in_mmc():
+    plan = plan_command("devmgmt.msc")
+    assert plan.argv == ("mmc", "devmgmt.msc")
+    assert plan.mode == GUI
+    assert plan.timeout is None
+
+
+def test_powershell_file_gets_a_console_and_no_timeout():
+    plan = plan_command(CHECK_DISK)
+    assert plan.argv == (
+        "powershell.exe", "-ExecutionPolicy", "Bypass", "-File",
+        "$PSScriptRoot\\sfu-tools\\Invoke-CheckDisk.ps1",
+    )
+    assert plan.mode == CONSOLE
+    assert plan.timeout is None
+
+
+@pytest.mark.parametrize("command", ["sfc /scannow", "DISM /Online /Cleanup-Image /RestoreHealth"])
+def test_repair_tools_are_captured_with_the_default_timeout(command):
+    plan = plan_command(command)
+    assert plan.argv == tuple(command.split())
+    assert plan.mode == CAPTURE
+    assert plan.timeout == DEFAULT_TIMEOUT == 300.0
+
+
+def test_timeout_override_and_zero_means_none():
+    assert plan_command("sfc /scannow", timeout=60).timeout == 60
+    assert plan_command("sfc /scannow", timeout=0).timeout is None
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "ipconfig /release & ipconfig /flushdns & ipconfig /renew",
+        "ipconfig /all & pause",
+        "tasklist | findstr explorer",
+        "pause",
+    ],
+)
+def test_chains_and_builtins_go_through_the_shell(command):
+    plan = plan_command(command)
+    assert plan.shell
+    assert plan.argv == ()
+    assert plan.args("D:\\MTCP") == command
+
+
+def test_quoted_paths_keep_their_spaces():
+    plan = plan_command('"C:\\Program Files\\Tool Kit\\tool.exe" /scan "C:\\Users\\Lab User"')
+    assert plan.argv == ("C:\\Program Files\\Tool Kit\\tool.exe", "/scan", "C:\\Users\\Lab User")
+    assert plan.mode == CAPTURE
+
+
+def test_unsplittable_lines_fall_back_to_the_shell():
+    assert split_command('"unclosed') is None
+    assert split_command("echo 'hi'") is None
+    assert plan_command('notepad "unclosed').shell
+
+
+def test_args_substitutes_the_script_root():
+    direct = plan_command(CHECK_DISK)
+    assert direct.args("D:\\MTCP")[-1] == "D:\\MTCP\\sfu-tools\\Invoke-CheckDisk.ps1"
+    # Kept until launch: the plan itself still has the placeholder
+    assert "$PSScriptRoot" in direct.argv[-1]
+
+    shell = plan_command('type "$PSScriptRoot\\README.txt" | more')
+    assert shell.args("E:\\USB") == 'type "E:\\USB\\README.txt" | more'